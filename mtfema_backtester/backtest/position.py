@@ -3,8 +3,34 @@ Position class for tracking trades in the backtesting engine.
 """
 
 from datetime import datetime
+import os
+import sys
+import threading
 import uuid
 
+# Random bytes are drawn from the OS in blocks and sliced into 16-byte ids so
+# that creating a position does not cost one urandom syscall per instance.
+_ID_BLOCK_SIZE = 4096
+_id_pool = threading.local()
+
+
+def _new_id_bytes():
+    """Return 16 random bytes for a position id, refilling the pool as needed"""
+    block = getattr(_id_pool, "block", b"")
+    offset = getattr(_id_pool, "offset", 0)
+    if offset + 16 > len(block):
+        block = os.urandom(_ID_BLOCK_SIZE)
+        offset = 0
+        _id_pool.block = block
+    _id_pool.offset = offset + 16
+    return block[offset:offset + 16]
+
+
+def _intern(value):
+    """Intern string fields so repeated symbols/timeframes share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Position:
     """
     Represents a trading position (open or closed)
@@ -13,6 +39,13 @@ class Position:
     including entry/exit details, profit/loss, and risk management parameters.
     """
     
+    __slots__ = (
+        "_id", "_id_bytes", "symbol", "direction", "_sign", "entry_price",
+        "size", "entry_time", "stop_loss", "take_profit", "trailing_activated",
+        "timeframe", "target_timeframe", "exit_price", "exit_time",
+        "exit_reason", "realized_pnl", "status", "_cached_r_multiple"
+    )
+    
     def __init__(
         self,
         symbol,
@@ -49,10 +82,12 @@ class Position:
         id : str, optional
             Unique identifier for the position
         """
-        # Basic position details
-        self.id = id if id else str(uuid.uuid4())
-        self.symbol = symbol
-        self.direction = direction.lower()
+        # Basic position details (generated ids are formatted lazily, see `id`)
+        self._id = id if id else None
+        self._id_bytes = None if id else _new_id_bytes()
+        self.symbol = _intern(symbol)
+        self.direction = _intern(direction.lower())
+        self._sign = 1.0 if self.direction == "long" else -1.0
         self.entry_price = entry_price
         self.size = size
         self.entry_time = entry_time if entry_time else datetime.now()
@@ -63,8 +98,8 @@ class Position:
         self.trailing_activated = False
         
         # Timeframe tracking
-        self.timeframe = timeframe
-        self.target_timeframe = timeframe
+        self.timeframe = _intern(timeframe)
+        self.target_timeframe = self.timeframe
         
         # Exit details (initialize as None for open positions)
         self.exit_price = None
@@ -74,6 +109,23 @@ class Position:
         # Performance tracking
         self.realized_pnl = 0.0
         self.status = "open"
+        self._cached_r_multiple = None
+    
+    def __getstate__(self):
+        """Pickle as a flat tuple of slot values (compact across process pools)"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        """Restore slot values produced by __getstate__"""
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+    
+    @property
+    def id(self):
+        """Unique identifier for the position (UUID4 string)"""
+        if self._id is None:
+            self._id = str(uuid.UUID(bytes=self._id_bytes, version=4))
+        return self._id
     
     def close(self, exit_price, exit_time=None, exit_reason=None):
         """
@@ -99,16 +151,14 @@ class Position:
         # Update exit details
         self.exit_price = exit_price
         self.exit_time = exit_time if exit_time else datetime.now()
-        self.exit_reason = exit_reason if exit_reason else "manual"
+        self.exit_reason = _intern(exit_reason) if exit_reason else "manual"
         
         # Calculate profit/loss
-        if self.direction == "long":
-            self.realized_pnl = (self.exit_price - self.entry_price) * self.size
-        else:  # short
-            self.realized_pnl = (self.entry_price - self.exit_price) * self.size
+        self.realized_pnl = (self.exit_price - self.entry_price) * self.size * self._sign
         
         # Mark as closed
         self.status = "closed"
+        self._cached_r_multiple = self.current_r_multiple()
         
         return self.realized_pnl
     
@@ -129,10 +179,7 @@ class Position:
         if self.status == "closed":
             return self.realized_pnl
         
-        if self.direction == "long":
-            return (current_price - self.entry_price) * self.size
-        else:  # short
-            return (self.entry_price - current_price) * self.size
+        return (current_price - self.entry_price) * self.size * self._sign
     
     def current_r_multiple(self, current_price=None):
         """
@@ -164,14 +211,8 @@ class Position:
         if initial_risk == 0:
             return 0.0  # Avoid division by zero
         
-        # Calculate profit/loss
-        if self.direction == "long":
-            profit_loss = price - self.entry_price
-        else:  # short
-            profit_loss = self.entry_price - price
-        
         # Return R multiple
-        return profit_loss / initial_risk
+        return (price - self.entry_price) * self._sign / initial_risk
     
     def duration(self):
         """
@@ -267,10 +308,10 @@ class Position:
         )
         
         position.trailing_activated = data["trailing_activated"]
-        position.target_timeframe = data["target_timeframe"]
+        position.target_timeframe = _intern(data["target_timeframe"])
         position.exit_price = data["exit_price"]
         position.exit_time = data["exit_time"]
-        position.exit_reason = data["exit_reason"]
+        position.exit_reason = _intern(data["exit_reason"])
         position.realized_pnl = data["realized_pnl"]
         position.status = data["status"]
         
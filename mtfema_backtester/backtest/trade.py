@@ -4,6 +4,8 @@ Trade class for storing completed trades in the backtesting engine.
 
 from datetime import datetime
 
+from .position import _intern
+
 class Trade:
     """
     Represents a completed trade for analysis and reporting
@@ -12,6 +14,14 @@ class Trade:
     and immutable record for analysis and performance reporting.
     """
     
+    __slots__ = (
+        "id", "symbol", "direction", "_sign", "entry_price", "exit_price",
+        "size", "entry_time", "exit_time", "profit", "timeframe", "stop_loss",
+        "take_profit", "exit_reason", "target_timeframe", "metadata",
+        "percent_return", "r_multiple", "risk_reward_ratio", "duration",
+        "duration_hours"
+    )
+    
     def __init__(
         self,
         id,
@@ -28,7 +38,8 @@ class Trade:
         take_profit=None,
         exit_reason=None,
         target_timeframe=None,
-        metadata=None
+        metadata=None,
+        _precomputed=None
     ):
         """
         Initialize a Trade record
@@ -65,25 +76,38 @@ class Trade:
             Target timeframe for the trade
         metadata : dict, optional
             Additional metadata about the trade
+        _precomputed : dict, optional
+            Metrics already known to the caller (currently 'r_multiple');
+            these are not recalculated
         """
         self.id = id
-        self.symbol = symbol
-        self.direction = direction
+        self.symbol = _intern(symbol)
+        self.direction = _intern(direction)
+        self._sign = 1.0 if direction == "long" else -1.0
         self.entry_price = entry_price
         self.exit_price = exit_price
         self.size = size
         self.entry_time = entry_time
         self.exit_time = exit_time
         self.profit = profit
-        self.timeframe = timeframe
+        self.timeframe = _intern(timeframe)
         self.stop_loss = stop_loss
         self.take_profit = take_profit
-        self.exit_reason = exit_reason if exit_reason else "unknown"
-        self.target_timeframe = target_timeframe if target_timeframe else timeframe
+        self.exit_reason = _intern(exit_reason) if exit_reason else "unknown"
+        self.target_timeframe = _intern(target_timeframe) if target_timeframe else self.timeframe
         self.metadata = metadata if metadata else {}
         
         # Calculate additional metrics
-        self._calculate_metrics()
+        self._calculate_metrics(_precomputed)
+    
+    def __getstate__(self):
+        """Pickle as a flat tuple of slot values (compact across process pools)"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        """Restore slot values produced by __getstate__"""
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
     
     @classmethod
     def from_position(cls, position):
@@ -103,6 +127,11 @@ class Trade:
         if position.status != "closed":
             raise ValueError("Cannot create Trade from an open Position")
         
+        # Reuse the R multiple the position already worked out when it closed
+        precomputed = None
+        if position._cached_r_multiple is not None:
+            precomputed = {"r_multiple": position._cached_r_multiple}
+        
         return cls(
             id=position.id,
             symbol=position.symbol,
@@ -117,11 +146,14 @@ class Trade:
             stop_loss=position.stop_loss,
             take_profit=position.take_profit,
             exit_reason=position.exit_reason,
-            target_timeframe=position.target_timeframe
+            target_timeframe=position.target_timeframe,
+            _precomputed=precomputed
         )
     
-    def _calculate_metrics(self):
-        """Calculate additional trade metrics"""
+    def _calculate_metrics(self, precomputed=None):
+        """Calculate additional trade metrics, skipping any precomputed ones"""
+        precomputed = precomputed or {}
+        
         # Calculate percentage return
         if self.entry_price > 0:
             self.percent_return = (self.profit / (self.entry_price * self.size)) * 100
@@ -129,14 +161,12 @@ class Trade:
             self.percent_return = 0.0
         
         # Calculate R multiple (if stop loss is defined)
-        if self.stop_loss is not None:
+        if "r_multiple" in precomputed:
+            self.r_multiple = precomputed["r_multiple"]
+        elif self.stop_loss is not None:
             initial_risk = abs(self.entry_price - self.stop_loss)
             if initial_risk > 0:
-                if self.direction == "long":
-                    profit_points = self.exit_price - self.entry_price
-                else:  # short
-                    profit_points = self.entry_price - self.exit_price
-                
+                profit_points = (self.exit_price - self.entry_price) * self._sign
                 self.r_multiple = profit_points / initial_risk
             else:
                 self.r_multiple = 0.0
@@ -156,6 +186,18 @@ class Trade:
             self.risk_reward_ratio = 0.0
         
         # Calculate duration
+        if isinstance(self.entry_time, datetime) and isinstance(self.exit_time, datetime):
+            self._calculate_duration_fast(self.entry_time, self.exit_time)
+        else:
+            self._calculate_duration_slow()
+    
+    def _calculate_duration_fast(self, entry_time, exit_time):
+        """Calculate duration from datetime entry/exit times"""
+        self.duration = exit_time - entry_time
+        self.duration_hours = self.duration.total_seconds() / 3600
+    
+    def _calculate_duration_slow(self):
+        """Calculate duration when entry/exit times may be ISO strings"""
         try:
             if isinstance(self.entry_time, str):
                 entry_time = datetime.fromisoformat(self.entry_time.replace('Z', '+00:00'))
@@ -167,8 +209,7 @@ class Trade:
             else:
                 exit_time = self.exit_time
                 
-            self.duration = exit_time - entry_time
-            self.duration_hours = self.duration.total_seconds() / 3600
+            self._calculate_duration_fast(entry_time, exit_time)
         except (ValueError, TypeError):
             self.duration = None
             self.duration_hours = 0.0
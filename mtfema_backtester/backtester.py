@@ -1,3 +1,61 @@
+import functools
+import heapq
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _evaluate_strategy_parameters(strategy_class, data_path, initial_capital, optimization_target, params):
+    """
+    Evaluate a single set of parameters.
+    
+    Module-level so worker processes receive only the arguments they need
+    rather than a pickled Optimizer.
+    
+    Args:
+        strategy_class: Strategy class to instantiate
+        data_path: Path to data file
+        initial_capital: Initial capital amount
+        optimization_target: Metric to extract as the target value
+        params: Parameter dictionary
+        
+    Returns:
+        Tuple of (params, result_metrics)
+    """
+    # Create strategy with these parameters
+    strategy = strategy_class(**params)
+    
+    # Create backtester
+    backtester = Backtester(
+        strategy=strategy,
+        data_source="csv",
+        data_path=data_path,
+        initial_capital=initial_capital
+    )
+    
+    # Run backtest
+    results = backtester.run()
+    
+    if results is None:
+        logger.warning("Backtest failed for parameters: %s", params)
+        return params, None
+    
+    # Extract the target metric
+    if optimization_target in results.metrics:
+        target_value = results.metrics[optimization_target]
+    else:
+        logger.warning("Optimization target '%s' not found in results metrics", optimization_target)
+        target_value = 0
+    
+    return params, {
+        'target_value': target_value,
+        'metrics': results.metrics,
+        'params': params
+    }
+
+
 class Optimizer:
     """
     Strategy parameter optimizer for the MT 9 EMA Backtester.
@@ -23,20 +81,34 @@ class Optimizer:
         self.optimization_target = optimization_target
         self.n_jobs = n_jobs
         
-        # Generate parameter combinations
-        self.param_combinations = self._generate_param_combinations()
+        # Combinations are generated lazily; only their count is kept up front
+        self.n_combinations = self._count_param_combinations()
         
         # Results storage
         self.results = []
         
-        logger.info(f"Optimizer initialized with {len(self.param_combinations)} parameter combinations")
+        logger.info("Optimizer initialized with %d parameter combinations", self.n_combinations)
+    
+    def _count_param_combinations(self):
+        """
+        Count the parameter combinations without generating them.
+        
+        Returns:
+            Number of parameter combinations in the grid
+        """
+        import math
+        
+        return math.prod(len(values) for values in self.param_grid.values())
     
     def _generate_param_combinations(self):
         """
         Generate all combinations of parameters to test.
         
-        Returns:
-            List of parameter dictionaries
+        Combinations are yielded one at a time so that large grids never
+        have to be materialized in memory.
+        
+        Yields:
+            Parameter dictionaries
         """
         import itertools
         
@@ -44,16 +116,8 @@ class Optimizer:
         param_names = list(self.param_grid.keys())
         param_values = list(self.param_grid.values())
         
-        # Generate all combinations
-        combinations = list(itertools.product(*param_values))
-        
-        # Convert to list of dictionaries
-        param_dicts = []
-        for combo in combinations:
-            param_dict = {name: value for name, value in zip(param_names, combo)}
-            param_dicts.append(param_dict)
-        
-        return param_dicts
+        for combo in itertools.product(*param_values):
+            yield dict(zip(param_names, combo))
     
     def _evaluate_parameters(self, params):
         """
@@ -65,36 +129,8 @@ class Optimizer:
         Returns:
             Tuple of (params, result_metrics)
         """
-        # Create strategy with these parameters
-        strategy = self.strategy_class(**params)
-        
-        # Create backtester
-        backtester = Backtester(
-            strategy=strategy,
-            data_source="csv",
-            data_path=self.data_path,
-            initial_capital=self.initial_capital
-        )
-        
-        # Run backtest
-        results = backtester.run()
-        
-        if results is None:
-            logger.warning(f"Backtest failed for parameters: {params}")
-            return params, None
-        
-        # Extract the target metric
-        if self.optimization_target in results.metrics:
-            target_value = results.metrics[self.optimization_target]
-        else:
-            logger.warning(f"Optimization target '{self.optimization_target}' not found in results metrics")
-            target_value = 0
-        
-        return params, {
-            'target_value': target_value,
-            'metrics': results.metrics,
-            'params': params
-        }
+        return _evaluate_strategy_parameters(self.strategy_class, self.data_path, self.initial_capital,
+                                             self.optimization_target, params)
     
     def run(self):
         """
@@ -103,12 +139,11 @@ class Optimizer:
         Returns:
             OptimizationResults object
         """
-        logger.info(f"Starting optimization with target: {self.optimization_target}")
+        logger.info("Starting optimization with target: %s", self.optimization_target)
         
         # Check if we can use parallel processing
         if self.n_jobs != 1:
             try:
-                from concurrent.futures import ProcessPoolExecutor
                 import multiprocessing
                 
                 # Determine number of workers
@@ -117,14 +152,10 @@ class Optimizer:
                 else:
                     n_workers = min(self.n_jobs, multiprocessing.cpu_count())
                 
-                logger.info(f"Running optimization in parallel with {n_workers} workers")
-                
-                # Run evaluations in parallel
-                with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                    results = list(executor.map(self._evaluate_parameters, self.param_combinations))
+                logger.info("Running optimization in parallel with %d workers", n_workers)
                 
-                # Filter out failed evaluations
-                self.results = [r for _, r in results if r is not None]
+                self.results = []
+                self._run_parallel(n_workers)
                 
             except ImportError:
                 logger.warning("Could not import parallel processing modules, falling back to sequential execution")
@@ -133,26 +164,73 @@ class Optimizer:
             # Run sequentially
             self._run_sequential()
         
-        # Sort results by target value (descending)
-        self.results.sort(key=lambda x: x['target_value'], reverse=True)
+        optimization_results = OptimizationResults(self.results, self.optimization_target)
+        
+        if optimization_results.top_results:
+            logger.info("Optimization completed. Best %s: %s", self.optimization_target,
+                        optimization_results.top_results[0]['target_value'])
+        
+        return optimization_results
+    
+    def _run_parallel(self, n_workers):
+        """
+        Run the optimization across a pool of worker processes.
+        
+        Results are collected as soon as each evaluation completes, and only
+        a bounded window of evaluations is in flight so the lazy combination
+        generator is never drained ahead of the workers.
+        
+        Args:
+            n_workers: Number of worker processes
+        """
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+        import itertools
+        
+        # Bind the per-run arguments once; each task then ships only its params
+        evaluate = functools.partial(_evaluate_strategy_parameters, self.strategy_class, self.data_path,
+                                     self.initial_capital, self.optimization_target)
         
-        logger.info(f"Optimization completed. Best {self.optimization_target}: {self.results[0]['target_value']}")
+        param_iter = self._generate_param_combinations()
+        max_in_flight = n_workers * 4
         
-        return OptimizationResults(self.results, self.optimization_target)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            pending = {executor.submit(evaluate, params)
+                       for params in itertools.islice(param_iter, max_in_flight)}
+            
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                
+                # Keep successful evaluations, skip failed ones
+                for future in done:
+                    _, result = future.result()
+                    if result is not None:
+                        self.results.append(result)
+                
+                # Refill the window with the next combinations
+                for params in itertools.islice(param_iter, len(done)):
+                    pending.add(executor.submit(evaluate, params))
     
     def _run_sequential(self):
         """Run the optimization sequentially."""
         logger.info("Running optimization sequentially")
         
-        total_params = len(self.param_combinations)
+        total_params = self.n_combinations
         
-        for i, params in enumerate(self.param_combinations):
-            logger.info(f"Evaluating parameters {i+1}/{total_params}: {params}")
+        # Report progress roughly every 1% instead of once per combination
+        log_every = max(1, total_params // 100)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        for i, params in enumerate(self._generate_param_combinations()):
+            if debug_enabled:
+                logger.debug("Evaluating parameters %d/%d: %s", i + 1, total_params, params)
             
             _, result = self._evaluate_parameters(params)
             
             if result is not None:
                 self.results.append(result)
+            
+            if (i + 1) % log_every == 0:
+                logger.info("Progress: %d/%d parameter combinations evaluated", i + 1, total_params)
 
 
 class OptimizationResults:
@@ -160,16 +238,25 @@ class OptimizationResults:
     Container for optimization results with analysis methods.
     """
     
+    # Number of best results kept ranked; larger requests rank on demand
+    TOP_K = 5
+    
     def __init__(self, results, target_metric):
         """
         Initialize optimization results.
         
         Args:
-            results: List of result dictionaries
+            results: List of result dictionaries (in any order)
             target_metric: The metric that was optimized
         """
         self.results = results
         self.target_metric = target_metric
+        
+        # Best results by target value (descending)
+        self.top_results = self._rank(self.TOP_K)
+        
+        # One row per result: parameter columns plus the target value in '_t'
+        self._df = pd.DataFrame([{**r['params'], '_t': r['target_value']} for r in results])
     
     def get_best_parameters(self):
         """
@@ -181,7 +268,7 @@ class OptimizationResults:
         if not self.results:
             return {}
             
-        return self.results[0]['params']
+        return self.top_results[0]['params']
     
     def get_top_parameters(self, n=5):
         """
@@ -195,8 +282,21 @@ class OptimizationResults:
         """
         if not self.results:
             return []
+        
+        top = self.top_results[:n] if n <= self.TOP_K else self._rank(n)
+        return [result['params'] for result in top]
+    
+    def _rank(self, n):
+        """
+        Select the n best results by target value.
+        
+        Args:
+            n: Number of results to select
             
-        return [result['params'] for result in self.results[:n]]
+        Returns:
+            List of result dictionaries, best first
+        """
+        return heapq.nlargest(n, self.results, key=lambda x: x['target_value'])
     
     def summary(self):
         """
@@ -220,7 +320,7 @@ class OptimizationResults:
         lines.append("TOP 5 PARAMETER SETS")
         lines.append("-" * 60)
         
-        for i, result in enumerate(self.results[:5]):
+        for i, result in enumerate(self.top_results):
             lines.append(f"Rank {i+1}: {self.target_metric} = {result['target_value']}")
             for param, value in result['params'].items():
                 lines.append(f"  {param}: {value}")
@@ -236,6 +336,24 @@ class OptimizationResults:
         
         return "\n".join(lines)
     
+    def _mean_target_by(self, parameter):
+        """
+        Average the target value over each value of a parameter.
+        
+        Args:
+            parameter: Parameter name to group by
+            
+        Returns:
+            Series of mean target values indexed by sorted parameter value
+        """
+        if parameter not in self._df.columns:
+            return pd.Series(dtype=float)
+        
+        # Results that don't set the parameter are left out, but a None/NaN
+        # value is a value of its own and keeps its group
+        present = [parameter in r['params'] for r in self.results]
+        return self._df[present].groupby(parameter, dropna=False)['_t'].mean()
+    
     def _calculate_parameter_importance(self):
         """
         Calculate a simple measure of parameter importance.
@@ -245,36 +363,13 @@ class OptimizationResults:
         """
         if not self.results or len(self.results) < 2:
             return {}
-            
-        # Get all parameter names
-        all_params = set()
-        for result in self.results:
-            all_params.update(result['params'].keys())
         
-        # Calculate importance for each parameter
+        # Spread between the best and worst average target across each
+        # parameter's values
         importance = {}
-        
-        for param in all_params:
-            # Group results by parameter value
-            values = {}
-            
-            for result in self.results:
-                if param in result['params']:
-                    value = result['params'][param]
-                    if value not in values:
-                        values[value] = []
-                    values[value].append(result['target_value'])
-            
-            # Calculate average performance for each value
-            avg_performance = {value: sum(perfs)/len(perfs) for value, perfs in values.items()}
-            
-            # Calculate variance in performance across different values
-            if len(avg_performance) > 1:
-                variance = max(avg_performance.values()) - min(avg_performance.values())
-            else:
-                variance = 0
-            
-            importance[param] = variance
+        for param in self._df.columns.drop('_t'):
+            avg_performance = self._mean_target_by(param)
+            importance[param] = float(avg_performance.max() - avg_performance.min()) if len(avg_performance) > 1 else 0
         
         # Normalize importance scores
         max_importance = max(importance.values()) if importance else 1
@@ -296,29 +391,10 @@ class OptimizationResults:
         try:
             import matplotlib.pyplot as plt
             
-            # Extract parameter values and corresponding target metric values
-            param_values = []
-            target_values = []
-            
-            for result in self.results:
-                if parameter in result['params']:
-                    param_values.append(result['params'][parameter])
-                    target_values.append(result['target_value'])
-            
-            # Group by parameter value
-            grouped_values = {}
-            for param, target in zip(param_values, target_values):
-                if param not in grouped_values:
-                    grouped_values[param] = []
-                grouped_values[param].append(target)
-            
-            # Calculate average for each parameter value
-            avg_values = {param: sum(targets)/len(targets) for param, targets in grouped_values.items()}
-            
-            # Sort by parameter value
-            sorted_items = sorted(avg_values.items())
-            x_values = [item[0] for item in sorted_items]
-            y_values = [item[1] for item in sorted_items]
+            # Average target metric for each parameter value, sorted by value
+            avg_values = self._mean_target_by(parameter)
+            x_values = avg_values.index.tolist()
+            y_values = avg_values.tolist()
             
             # Create plot
             plt.figure(figsize=(10, 6))
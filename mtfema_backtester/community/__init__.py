@@ -6,29 +6,54 @@ features, including signal sharing, subscriptions, reputation system,
 and feature management.
 """
 
+import importlib
 import logging
 from mtfema_backtester.community.feature_flags import (
     FeatureFlags,
     get_feature_flags,
     is_feature_enabled
 )
-from .sharing import CommunityConnect
-from .signals import SignalManager, TradingSignal
-from .forums import ForumManager, ForumPost
 from mtfema_backtester.utils.feature_flags import FeatureState
 
+# Component classes are imported on first access (PEP 562) so that importing
+# the package for its flags does not pull in the sharing/signals/forums stacks
+_LAZY_IMPORTS = {
+    'CommunityConnect': '.sharing',
+    'SignalManager': '.signals',
+    'TradingSignal': '.signals',
+    'ForumManager': '.forums',
+    'ForumPost': '.forums'
+}
+
+
+def __getattr__(name):
+    """Import component classes lazily on first attribute access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
 # Check if community features are enabled
 feature_flags = get_feature_flags()
 
-FORUMS_ENABLED = feature_flags.is_enabled("community.forums")
-SHARING_ENABLED = feature_flags.is_enabled("community.sharing")
-SIGNALS_ENABLED = feature_flags.is_enabled("community.signals")
-PROFILES_ENABLED = feature_flags.is_enabled("community.profiles")
+_community_flags = feature_flags.snapshot([
+    "community.forums",
+    "community.sharing",
+    "community.signals",
+    "community.profiles"
+])
+
+FORUMS_ENABLED = _community_flags["community.forums"]
+SHARING_ENABLED = _community_flags["community.sharing"]
+SIGNALS_ENABLED = _community_flags["community.signals"]
+PROFILES_ENABLED = _community_flags["community.profiles"]
 
-if any([FORUMS_ENABLED, SHARING_ENABLED, SIGNALS_ENABLED, PROFILES_ENABLED]):
+if any(_community_flags.values()):
     logger.info("Community features are enabled")
 else:
     logger.info("All community features are currently disabled")
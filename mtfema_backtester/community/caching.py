@@ -0,0 +1,195 @@
+"""
+Caching helpers for the community module.
+
+Provides a small time-based cache for community API reads whose data
+changes much more slowly than dashboards poll it.
+"""
+
+import functools
+import inspect
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+# Named cache lifetimes in seconds, for data that changes at different speeds
+CACHE_POLICIES = {
+    "short": 10,
+    "normal": 30,
+    "long": 60
+}
+
+# Seconds an expired cached read is still served while it is refreshed in the background
+STALE_SECONDS = 300
+
+
+def ttl_cache(seconds: float = 60,
+              maxsize: int = 128,
+              policy: Optional[str] = None,
+              stale_seconds: float = 0,
+              fallback: bool = False) -> Callable:
+    """
+    Cache a function's results for a fixed number of seconds.
+
+    Results are keyed on all positional and keyword arguments. Methods (a
+    first parameter named ``self``) keep a separate cache per instance,
+    held weakly so the cache never keeps an instance alive. Results of None
+    and empty results are returned but never cached, so data shows up as
+    soon as there is some (e.g. once a client connects). Callers get their
+    own copy of a cached list or dict; nested values are shared with the
+    cache and must not be changed.
+
+    The decorated function gains an ``invalidate(instance=None)`` method
+    that drops the cached results of one instance (or of every instance,
+    and of a plain function, when none is given), for use after actions
+    that change the underlying data.
+
+    With ``stale_seconds``, an expired result is still returned for that
+    much longer while a background thread fetches a new one (one refresh
+    per key at a time), so callers don't wait on the refresh.
+
+    With ``fallback``, a call that raises an exception or returns None
+    returns the last cached result for the same arguments instead, however
+    old. ``fetched_at(*args, **kwargs)`` gives the wall-clock time that
+    cached result was fetched, so callers can show how out of date it is.
+
+    Args:
+        seconds: Time in seconds a cached result stays valid
+        maxsize: Maximum number of cached results (per instance for methods)
+        policy: Name of a lifetime in CACHE_POLICIES, used instead of seconds
+        stale_seconds: Time in seconds an expired result may still be served
+            while it is refreshed
+        fallback: Whether to return the last cached result when a call fails
+
+    Returns:
+        Decorator
+    """
+    if policy is not None:
+        seconds = CACHE_POLICIES[policy]
+
+    def decorator(func: Callable) -> Callable:
+        is_method = next(iter(inspect.signature(func).parameters), None) == "self"
+        shared_state = _CacheState()
+        instance_states: "weakref.WeakKeyDictionary[Any, _CacheState]" = weakref.WeakKeyDictionary()
+        lock = threading.Lock()
+
+        def state_and_key(args: Tuple, kwargs: Dict[str, Any]) -> Tuple["_CacheState", Tuple]:
+            # Called with the lock held
+            if is_method and args:
+                state = instance_states.get(args[0])
+                if state is None:
+                    state = instance_states[args[0]] = _CacheState()
+                args = args[1:]
+            else:
+                state = shared_state
+            return state, (args, tuple(sorted(kwargs.items())))
+
+        def store(state: "_CacheState", key: Tuple, result: Any, now: float,
+                  from_generation: int) -> None:
+            if not result:
+                return
+            # Keep a private copy; the caller is free to change the one it gets
+            result = _snapshot(result)
+            cache = state.cache
+            with lock:
+                # Results computed before an invalidate() are dropped
+                if from_generation != state.generation:
+                    return
+                if len(cache) >= maxsize:
+                    # Drop unservable entries first (all expired ones stay
+                    # servable as fallbacks), then the oldest if still full
+                    if not fallback:
+                        for old in [k for k, (expires, _, _) in cache.items() if expires + stale_seconds <= now]:
+                            del cache[old]
+                    if len(cache) >= maxsize:
+                        del cache[next(iter(cache))]
+                cache.pop(key, None)
+                cache[key] = (now + seconds, result, time.time())
+
+        def refresh(state: "_CacheState", key: Tuple, args: Tuple, kwargs: Dict[str, Any],
+                    from_generation: int) -> None:
+            try:
+                store(state, key, func(*args, **kwargs), time.monotonic(), from_generation)
+            finally:
+                with lock:
+                    state.refreshing.discard(key)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+
+            start_refresh = False
+            with lock:
+                state, key = state_and_key(args, kwargs)
+                entry = state.cache.get(key)
+                current_generation = state.generation
+                if (entry is not None and entry[0] <= now < entry[0] + stale_seconds
+                        and key not in state.refreshing):
+                    state.refreshing.add(key)
+                    start_refresh = True
+
+            if entry is not None:
+                if entry[0] > now:
+                    return _snapshot(entry[1])
+                if now < entry[0] + stale_seconds:
+                    if start_refresh:
+                        threading.Thread(target=refresh,
+                                         args=(state, key, args, kwargs, current_generation),
+                                         daemon=True).start()
+                    return _snapshot(entry[1])
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                if fallback and entry is not None:
+                    return _snapshot(entry[1])
+                raise
+            if result is None and fallback and entry is not None:
+                return _snapshot(entry[1])
+            store(state, key, result, now, current_generation)
+            return result
+
+        def fetched_at(*args, **kwargs) -> Optional[float]:
+            """Get when the cached result for these arguments was fetched (epoch seconds)."""
+            with lock:
+                state, key = state_and_key(args, kwargs)
+                entry = state.cache.get(key)
+            return entry[2] if entry is not None else None
+
+        def invalidate(instance: Any = None) -> None:
+            """Drop the cached results of one instance, or all cached results."""
+            with lock:
+                if instance is not None:
+                    states = [instance_states[instance]] if instance in instance_states else []
+                else:
+                    states = [shared_state, *instance_states.values()]
+                for state in states:
+                    state.cache.clear()
+                    state.generation += 1
+
+        wrapper.fetched_at = fetched_at
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
+
+
+class _CacheState:
+    """Cached results of one function, or of one instance for methods."""
+
+    __slots__ = ("cache", "refreshing", "generation")
+
+    def __init__(self):
+        # key -> (time the result expires, result, wall-clock time it was fetched)
+        self.cache: Dict[Tuple, Tuple[float, Any, float]] = {}
+        self.refreshing: Set[Tuple] = set()
+        self.generation = 0
+
+
+def _snapshot(result: Any) -> Any:
+    """Copy the outer level of a list or dict result; return anything else as is."""
+    if isinstance(result, list):
+        return list(result)
+    if isinstance(result, dict):
+        return dict(result)
+    return result
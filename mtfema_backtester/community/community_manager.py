@@ -5,9 +5,14 @@ This module provides a single interface for all community features
 including sharing, signals, and forums.
 """
 
+import copy
+import functools
 import logging
-import os
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from .sharing import CommunityConnect
@@ -16,6 +21,78 @@ from .forums import ForumManager, ForumPost
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on simultaneous API calls issued by one overview/profile request
+MAX_CONCURRENT_REQUESTS = 6
+
+# Seconds a community overview is reused before it is fetched again
+OVERVIEW_CACHE_TTL = 30
+
+
+def auth_required(method: Callable) -> Callable:
+    """
+    Require the manager to be logged in before running the decorated method.
+    
+    Raises:
+        ValueError: If the user is not authenticated
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.is_authenticated:
+            logger.warning("Not authenticated with community platform")
+            raise ValueError("Authentication required. Please login first.")
+        return method(self, *args, **kwargs)
+    
+    return wrapper
+
+
+class RequestCoalescer:
+    """
+    Share a single in-flight API call among identical concurrent requests.
+    
+    When several callers ask for the same method with the same arguments
+    while a call is already running, they wait for and reuse its result
+    instead of issuing their own round-trip.
+    """
+    
+    def __init__(self):
+        """Initialize the coalescer."""
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple, Future] = {}
+    
+    def call(self, func: Callable, **kwargs) -> Any:
+        """
+        Call func(**kwargs), joining an identical call if one is running.
+        
+        Args:
+            func: API method to call
+            **kwargs: Hashable keyword arguments for the call
+            
+        Returns:
+            Result of the call
+        """
+        key = (func, tuple(sorted(kwargs.items())))
+        
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._in_flight[key] = Future()
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = func(**kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
 class CommunityManager:
     """Central manager for all community features."""
     
@@ -31,20 +108,32 @@ class CommunityManager:
         self.api_url = api_url
         self.storage_path = storage_path
         
-        # Create storage directory if it doesn't exist
-        os.makedirs(storage_path, exist_ok=True)
+        # Create the component storage directories (and the base) up front
+        base_path = Path(storage_path)
+        self.signals_dir = str(base_path / "signals")
+        self.forums_dir = str(base_path / "forums")
+        for directory in (self.signals_dir, self.forums_dir):
+            Path(directory).mkdir(parents=True, exist_ok=True)
         
         # Initialize components
         self.connect = CommunityConnect(api_url=api_url)
         self.signals = SignalManager(
             community_api_url=api_url,
-            local_storage_path=os.path.join(storage_path, "signals")
+            local_storage_path=self.signals_dir
         )
         self.forums = ForumManager(
             api_url=f"{api_url}/forums",
-            local_storage_path=os.path.join(storage_path, "forums")
+            local_storage_path=self.forums_dir
         )
         
+        # Worker threads for fanning out independent API calls
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS,
+                                            thread_name_prefix="community")
+        self._coalescer = RequestCoalescer()
+        
+        # (monotonic fetch time, overview) of the last overview fetched
+        self._overview_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
         # Authentication state
         self.is_authenticated = False
         self.user_id = None
@@ -52,6 +141,10 @@ class CommunityManager:
         
         logger.info("Community manager initialized")
     
+    def close(self) -> None:
+        """Stop the worker threads used to fetch community data."""
+        self._executor.shutdown(wait=True)
+    
     def login(self, username: str, password: str) -> bool:
         """
         Login to the community platform.
@@ -95,6 +188,7 @@ class CommunityManager:
         logger.info("Logged out of community platform")
         return True
     
+    @auth_required
     def share_backtest_results(self, backtest_result: Any, description: str = "") -> Dict[str, Any]:
         """
         Share backtest results with the community.
@@ -106,9 +200,9 @@ class CommunityManager:
         Returns:
             Response from the community API
         """
-        self._check_authentication()
         return self.connect.share_backtest_results(backtest_result, description)
     
+    @auth_required
     def share_trading_setup(self, setup: Dict[str, Any]) -> Dict[str, Any]:
         """
         Share a trading setup with the community.
@@ -119,9 +213,9 @@ class CommunityManager:
         Returns:
             Response from the community API
         """
-        self._check_authentication()
         return self.connect.share_trading_setup(setup)
     
+    @auth_required
     def create_signal(self, 
                     symbol: str,
                     direction: str,
@@ -149,8 +243,6 @@ class CommunityManager:
         Returns:
             TradingSignal object or None if failed
         """
-        self._check_authentication()
-        
         # Create the signal
         signal = self.signals.create_signal(
             user_id=self.user_id,
@@ -173,6 +265,7 @@ class CommunityManager:
         
         return signal
     
+    @auth_required
     def create_forum_post(self,
                         title: str,
                         content: str,
@@ -190,8 +283,6 @@ class CommunityManager:
         Returns:
             ForumPost object or None if failed
         """
-        self._check_authentication()
-        
         post = self.forums.create_post(
             user_id=self.user_id,
             username=self.username,
@@ -206,45 +297,53 @@ class CommunityManager:
         
         return post
     
-    def get_community_overview(self) -> Dict[str, Any]:
+    def get_community_overview(self, max_age: float = OVERVIEW_CACHE_TTL) -> Dict[str, Any]:
         """
         Get an overview of community activity.
         
+        Args:
+            max_age: Seconds a previously fetched overview may be reused (0 to refetch)
+            
         Returns:
             Dictionary with community overview data
         """
-        # Get trending topics
-        trending_topics = self.forums.get_trending_topics(limit=5)
-        
-        # Get recent signals
-        recent_signals = self.signals.get_signals(limit=5)
-        
-        # Get community performance stats
-        performance = self.connect.get_community_performance(timeframe="week")
-        
-        # Get recent forum posts
-        recent_posts = self.forums.get_recent_posts(limit=5)
-        
-        # Get leaderboard
-        leaderboard = self.connect.get_leaderboard(timeframe="month", limit=5)
-        
-        # Get signal statistics
-        signal_stats = self.signals.get_signal_statistics(days=30)
+        now = time.monotonic()
+        cached = self._overview_cache
+        if cached is not None and now - cached[0] < max_age:
+            logger.debug("Using cached community overview")
+            return copy.deepcopy(cached[1])
+        
+        timestamp = datetime.now().isoformat()
+        
+        # The sections are independent, so fetch them concurrently
+        results = self._fetch_concurrently({
+            "trending_topics": (self.forums.get_trending_topics, {"limit": 5}),
+            "recent_signals": (self.signals.get_signals, {"limit": 5}),
+            "performance": (self.connect.get_community_performance, {"timeframe": "week"}),
+            "recent_posts": (self.forums.get_recent_posts, {"limit": 5}),
+            "leaderboard": (self.connect.get_leaderboard, {"timeframe": "month", "limit": 5}),
+            "signal_stats": (self.signals.get_signal_statistics, {"days": 30})
+        })
         
         # Combine into overview
         overview = {
-            "trending_topics": trending_topics,
-            "recent_signals": [s.to_dict() for s in recent_signals],
-            "performance": performance,
-            "recent_posts": [p.to_dict() for p in recent_posts],
-            "leaderboard": leaderboard,
-            "signal_stats": signal_stats,
-            "timestamp": datetime.now().isoformat()
+            "trending_topics": results["trending_topics"],
+            "recent_signals": [s.to_dict() for s in results["recent_signals"]],
+            "performance": results["performance"],
+            "recent_posts": [p.to_dict() for p in results["recent_posts"]],
+            "leaderboard": results["leaderboard"],
+            "signal_stats": results["signal_stats"],
+            "timestamp": timestamp
         }
         
+        self._overview_cache = (now, overview)
+        
         logger.info("Retrieved community overview")
-        return overview
+        
+        # Hand out a copy so callers can't change the cached sections
+        return copy.deepcopy(overview)
     
+    @auth_required
     def get_user_profile(self, user_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get a user's profile and activity data.
@@ -255,22 +354,22 @@ class CommunityManager:
         Returns:
             Dictionary with user profile data
         """
-        self._check_authentication()
+        timestamp = datetime.now().isoformat()
         
         # Use current user if no user_id provided
         user_id = user_id or self.user_id
         
-        # Get forum statistics
-        forum_stats = self.forums.get_user_statistics(user_id)
-        
-        # Get performance data
-        performance = self.signals.get_user_performance(user_id)
-        
-        # Get recent signals
-        recent_signals = self.signals.get_signals(user_id=user_id, limit=5)
-        
-        # Get recent forum posts
-        recent_posts = self.forums.get_posts(user_id=user_id, limit=5)
+        # Fetch the profile sections concurrently
+        results = self._fetch_concurrently({
+            "forum_stats": (self.forums.get_user_statistics, {"user_id": user_id}),
+            "performance": (self.signals.get_user_performance, {"user_id": user_id}),
+            "recent_signals": (self.signals.get_signals, {"user_id": user_id, "limit": 5}),
+            "recent_posts": (self.forums.get_posts, {"user_id": user_id, "limit": 5})
+        })
+        forum_stats = results["forum_stats"]
+        performance = results["performance"]
+        recent_signals = results["recent_signals"]
+        recent_posts = results["recent_posts"]
         
         # Combine into profile
         profile = {
@@ -281,14 +380,25 @@ class CommunityManager:
             "performance": performance,
             "recent_signals": [s.to_dict() for s in recent_signals],
             "recent_posts": [p.to_dict() for p in recent_posts],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
         logger.info(f"Retrieved profile for user {user_id}")
         return profile
     
-    def _check_authentication(self):
-        """Check if user is authenticated and raise error if not."""
-        if not self.is_authenticated:
-            logger.warning("Not authenticated with community platform")
-            raise ValueError("Authentication required. Please login first.")
+    def _fetch_concurrently(self, calls: Dict[str, Tuple[Callable, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Run independent API calls in parallel and collect their results.
+        
+        Identical calls already in flight (e.g. from another dashboard
+        request) are joined rather than repeated.
+        
+        Args:
+            calls: Dictionary of result keys and (method, keyword arguments) pairs
+            
+        Returns:
+            Dictionary of result keys and call results
+        """
+        futures = {key: self._executor.submit(self._coalescer.call, func, **kwargs)
+                   for key, (func, kwargs) in calls.items()}
+        return {key: future.result() for key, future in futures.items()}
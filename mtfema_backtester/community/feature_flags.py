@@ -6,13 +6,45 @@ allowing gradual rollout of features and A/B testing capabilities.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
 import json
 import random
+import functools
+import threading
+import zlib
+from collections import Counter
+from types import MappingProxyType
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Environment variables of the form MTFEMA_FEATURE_<FEATURE_NAME>=true/false
+_ENV_PREFIX = "MTFEMA_FEATURE_"
+
+# Environment variable values that enable a flag
+_TRUTHY = frozenset({'true', '1', 'yes', 'y', 'on'})
+
+
+def _parse_env_flags() -> Dict[str, bool]:
+    """
+    Extract feature flag overrides from the environment.
+    
+    Returns:
+        Dictionary of feature names and enabled state
+    """
+    prefix_len = len(_ENV_PREFIX)
+    return {key[prefix_len:].lower(): value.lower() in _TRUTHY
+            for key, value in os.environ.items() if key.startswith(_ENV_PREFIX)}
+
+
+# Parsed once at import; FeatureFlags.reload() rescans the environment
+_ENV_FLAG_OVERRIDES = _parse_env_flags()
+
+# Usage buffers are folded into the shared counter once they reach this size
+_USAGE_FLUSH_SIZE = 1024
+
 class FeatureFlags:
     """
     Manages feature flags for controlling feature availability.
@@ -40,8 +72,10 @@ class FeatureFlags:
         Args:
             config_path: Path to configuration file
         """
-        # Skip re-initialization if already initialized
+        # Construction is idempotent; use reload() to re-read configuration
         if getattr(self, '_initialized', False):
+            if config_path and config_path != self.config_path:
+                logger.warning(f"Feature flags already initialized; call reload() to load {config_path}")
             return
             
         self._initialized = True
@@ -86,8 +120,24 @@ class FeatureFlags:
         # User-specific flag overrides
         self.user_overrides = {}
         
-        # Flag usage tracking
-        self.flag_usage = {}
+        # Flag usage tracking; checks are appended to a per-thread buffer and
+        # folded into the counter in bulk. Buffers are registered with their
+        # thread so those of finished threads can be folded in and dropped
+        self.flag_usage = Counter()
+        self._usage_local = threading.local()
+        self._usage_buffers: List[Tuple[threading.Thread, list]] = []
+        
+        self._usage_lock = threading.Lock()
+        
+        # Writers mutate flags/user_overrides under this lock and publish
+        # read-only views in self._state; readers never take the lock
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._publish()
+        
+        # Memoized flag resolution, keyed by the published generation so
+        # stale entries are never hit
+        self._resolve = functools.lru_cache(maxsize=4096)(self._resolve_uncached)
         
         # Load configuration
         self._load_config()
@@ -109,16 +159,73 @@ class FeatureFlags:
             Whether the feature is enabled
         """
         # Track usage
-        if feature_name not in self.flag_usage:
-            self.flag_usage[feature_name] = 0
-        self.flag_usage[feature_name] += 1
+        buffer = getattr(self._usage_local, "buffer", None)
+        if buffer is None:
+            buffer = self._usage_local.buffer = []
+            with self._usage_lock:
+                self._drop_finished_usage_buffers()
+                self._usage_buffers.append((threading.current_thread(), buffer))
+        buffer.append(feature_name)
+        if len(buffer) >= _USAGE_FLUSH_SIZE:
+            self._flush_usage(buffer)
+        
+        return self._resolve(feature_name, user_id, self._state[0])
+    
+    def snapshot(self, feature_names: List[str], user_id: Optional[str] = None) -> Dict[str, bool]:
+        """
+        Check several features in one call.
+        
+        Args:
+            feature_names: Names of the features
+            user_id: Optional user ID for user-specific overrides
+            
+        Returns:
+            Dictionary of feature names and whether each is enabled
+        """
+        with self._usage_lock:
+            self.flag_usage.update(feature_names)
+        
+        _, flags, user_overrides = self._state
+        overrides = user_overrides.get(user_id, {}) if user_id else {}
+        return {name: overrides.get(name, flags.get(name, False)) for name in feature_names}
+    
+    def _resolve_uncached(self, feature_name: str, user_id: Optional[str], generation: int) -> bool:
+        """
+        Resolve a flag for a user against the current configuration.
+        
+        Args:
+            feature_name: Name of the feature
+            user_id: Optional user ID for user-specific overrides
+            generation: Configuration generation (cache key only)
+            
+        Returns:
+            Whether the feature is enabled
+        """
+        _, flags, user_overrides = self._state
         
         # Check user-specific override
-        if user_id and user_id in self.user_overrides and feature_name in self.user_overrides[user_id]:
-            return self.user_overrides[user_id][feature_name]
+        overrides = user_overrides.get(user_id) if user_id else None
+        if overrides is not None and feature_name in overrides:
+            return overrides[feature_name]
         
         # Check global flag
-        return self.flags.get(feature_name, False)
+        return flags.get(feature_name, False)
+    
+    def _publish(self) -> None:
+        """
+        Publish read-only views of the flags for lock-free readers.
+        
+        Called with the writer lock held after every mutation. The views and
+        a new generation number are swapped in as one tuple, so a reader that
+        loads self._state once sees a consistent configuration.
+        """
+        self._generation += 1
+        self._state = (
+            self._generation,
+            MappingProxyType(dict(self.flags)),
+            MappingProxyType({user_id: MappingProxyType(dict(overrides))
+                              for user_id, overrides in self.user_overrides.items()})
+        )
     
     def set_flag(self, feature_name: str, enabled: bool) -> None:
         """
@@ -128,7 +235,9 @@ class FeatureFlags:
             feature_name: Name of the feature
             enabled: Whether the feature should be enabled
         """
-        self.flags[feature_name] = enabled
+        with self._lock:
+            self.flags[feature_name] = enabled
+            self._publish()
         logger.info(f"Set feature flag {feature_name} to {enabled}")
     
     def set_user_flag(self, user_id: str, feature_name: str, enabled: bool) -> None:
@@ -140,10 +249,12 @@ class FeatureFlags:
             feature_name: Name of the feature
             enabled: Whether the feature should be enabled for this user
         """
-        if user_id not in self.user_overrides:
-            self.user_overrides[user_id] = {}
-        
-        self.user_overrides[user_id][feature_name] = enabled
+        with self._lock:
+            if user_id not in self.user_overrides:
+                self.user_overrides[user_id] = {}
+            
+            self.user_overrides[user_id][feature_name] = enabled
+            self._publish()
         logger.info(f"Set user-specific flag {feature_name} to {enabled} for user {user_id}")
     
     def get_flag_usage(self) -> Dict[str, int]:
@@ -153,8 +264,64 @@ class FeatureFlags:
         Returns:
             Dictionary of feature names and usage counts
         """
+        with self._usage_lock:
+            for _, buffer in self._usage_buffers:
+                self._fold_usage(buffer)
+            self._drop_finished_usage_buffers()
         return self.flag_usage
     
+    def _flush_usage(self, buffer: list) -> None:
+        """
+        Fold buffered flag checks into the usage counter.
+        
+        Args:
+            buffer: Per-thread list of checked feature names
+        """
+        with self._usage_lock:
+            self._fold_usage(buffer)
+    
+    def _fold_usage(self, buffer: list) -> None:
+        """
+        Move a buffer's flag checks into the usage counter (caller holds the usage lock).
+        
+        Only the entries present when the fold starts are removed, so checks
+        appended concurrently by the owning thread are kept for the next flush.
+        
+        Args:
+            buffer: Per-thread list of checked feature names
+        """
+        count = len(buffer)
+        if count:
+            self.flag_usage.update(buffer[:count])
+            del buffer[:count]
+    
+    def _drop_finished_usage_buffers(self) -> None:
+        """Fold in and forget the buffers of threads that have exited (caller holds the usage lock)."""
+        live_buffers = []
+        for thread, buffer in self._usage_buffers:
+            if thread.is_alive():
+                live_buffers.append((thread, buffer))
+            else:
+                self._fold_usage(buffer)
+        self._usage_buffers = live_buffers
+    
+    def reload(self, config_path: Optional[str] = None) -> None:
+        """
+        Re-read flags from the configuration file and environment variables.
+        
+        Flags set at runtime are kept unless the file or environment sets
+        them again.
+        
+        Args:
+            config_path: New configuration file path (keeps the current one if None)
+        """
+        with self._lock:
+            if config_path is not None:
+                self.config_path = config_path
+            
+            self._load_config()
+            self._load_env_vars(rescan=True)
+    
     def _load_config(self) -> None:
         """
         Load feature flags from configuration file.
@@ -166,39 +333,42 @@ class FeatureFlags:
             with open(self.config_path, 'r') as f:
                 config = json.load(f)
                 
-            # Update flags from config
-            if "flags" in config:
-                self.flags.update(config["flags"])
+            with self._lock:
+                # Update flags from config
+                if "flags" in config:
+                    self.flags.update(config["flags"])
+                    
+                # Load user overrides
+                if "user_overrides" in config:
+                    self.user_overrides = config["user_overrides"]
                 
-            # Load user overrides
-            if "user_overrides" in config:
-                self.user_overrides = config["user_overrides"]
+                self._publish()
                 
             logger.info(f"Loaded feature flags configuration from {self.config_path}")
         except Exception as e:
             logger.error(f"Error loading feature flags config: {e}")
     
-    def _load_env_vars(self) -> None:
+    def _load_env_vars(self, rescan: bool = False) -> None:
         """
         Load feature flags from environment variables.
         
         Environment variables should be in the format:
         MTFEMA_FEATURE_<FEATURE_NAME>=true/false
+        
+        Args:
+            rescan: Re-read os.environ instead of using the snapshot taken at import
         """
-        prefix = "MTFEMA_FEATURE_"
+        global _ENV_FLAG_OVERRIDES
         
-        # Check all environment variables
-        for key, value in os.environ.items():
-            if key.startswith(prefix):
-                # Extract feature name
-                feature_name = key[len(prefix):].lower()
-                
-                # Convert value to boolean
-                enabled = value.lower() in ('true', '1', 'yes', 'y', 'on')
-                
-                # Set flag
-                self.flags[feature_name] = enabled
-                logger.info(f"Set feature flag {feature_name} to {enabled} from environment variable")
+        if rescan:
+            _ENV_FLAG_OVERRIDES = _parse_env_flags()
+        
+        with self._lock:
+            self.flags.update(_ENV_FLAG_OVERRIDES)
+            self._publish()
+        
+        for feature_name, enabled in _ENV_FLAG_OVERRIDES.items():
+            logger.info(f"Set feature flag {feature_name} to {enabled} from environment variable")
     
     def enable_for_percentage(self, feature_name: str, percentage: float) -> None:
         """
@@ -217,9 +387,13 @@ class FeatureFlags:
         
         # Set global flag based on percentage
         if percentage >= 100:
-            self.flags[feature_name] = True
+            with self._lock:
+                self.flags[feature_name] = True
+                self._publish()
         elif percentage <= 0:
-            self.flags[feature_name] = False
+            with self._lock:
+                self.flags[feature_name] = False
+                self._publish()
         else:
             # For partial rollouts, we'll use the user_id to determine eligibility
             # This is handled in is_enabled with user-specific logic
@@ -239,13 +413,42 @@ class FeatureFlags:
         if not user_id:
             return False
             
-        # Use hash of user_id for consistent randomization
-        hash_value = hash(user_id) % 100
-        return hash_value < percentage
+        return _user_bucket(user_id) < percentage
+    
+    def is_users_in_segment(self, user_ids: List[str], percentage: float) -> np.ndarray:
+        """
+        Determine segment membership for many users at once.
+        
+        Args:
+            user_ids: IDs of the users
+            percentage: Percentage threshold (0-100)
+            
+        Returns:
+            Boolean array, True where the user is in the segment
+        """
+        hashes = np.fromiter((zlib.crc32(user_id.encode()) if user_id else 0 for user_id in user_ids),
+                             dtype=np.uint64, count=len(user_ids))
+        buckets = (hashes * 100) >> 32
+        has_id = np.fromiter((bool(user_id) for user_id in user_ids), dtype=bool, count=len(user_ids))
+        return (buckets < percentage) & has_id
+
+
+def _user_bucket(user_id: str) -> int:
+    """
+    Map a user ID to a rollout bucket in 0-99.
+    
+    Uses CRC32 rather than hash() so buckets are identical across processes
+    and restarts (str hashing is randomized per interpreter). The 32-bit hash
+    is scaled into range with a multiply and shift instead of a modulo.
+    """
+    return (zlib.crc32(user_id.encode()) * 100) >> 32
 
 
 # Helper functions for easier access
 
+# Cached singleton reference so helpers skip the FeatureFlags() construction path
+_feature_flags: Optional[FeatureFlags] = None
+
 def get_feature_flags() -> FeatureFlags:
     """
     Get the global feature flags instance.
@@ -253,7 +456,10 @@ def get_feature_flags() -> FeatureFlags:
     Returns:
         FeatureFlags instance
     """
-    return FeatureFlags()
+    global _feature_flags
+    if _feature_flags is None:
+        _feature_flags = FeatureFlags()
+    return _feature_flags
 
 def is_feature_enabled(feature_name: str, user_id: Optional[str] = None) -> bool:
     """
@@ -266,5 +472,4 @@ def is_feature_enabled(feature_name: str, user_id: Optional[str] = None) -> bool
     Returns:
         Whether the feature is enabled
     """
-    flags = get_feature_flags()
-    return flags.is_enabled(feature_name, user_id)
+    return get_feature_flags().is_enabled(feature_name, user_id)
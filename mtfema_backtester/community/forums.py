@@ -63,42 +63,48 @@
             True if successful, False otherwise
         """
         try:
-            # Create markdown content
-            markdown = "# MT 9 EMA Community Forum Posts\n\n"
+            # Format all post and reply dates up front
+            post_dates = [post.created_at.strftime('%Y-%m-%d %H:%M') for post in posts]
+            reply_dates = iter(_format_reply_dates(
+                [reply["created_at"] for post in posts for reply in (post.replies or [])]
+            ))
             
-            for post in posts:
+            # Collect markdown fragments and join once at the end
+            parts = ["# MT 9 EMA Community Forum Posts\n\n"]
+            append = parts.append
+            
+            for post, post_date in zip(posts, post_dates):
                 # Add post header
-                markdown += f"## {post.title}\n\n"
-                markdown += f"**By:** {post.username} | "
-                markdown += f"**Date:** {post.created_at.strftime('%Y-%m-%d %H:%M')} | "
-                markdown += f"**Category:** {post.category} | "
-                markdown += f"**Likes:** {post.likes}\n\n"
+                append(f"## {post.title}\n\n"
+                       f"**By:** {post.username} | "
+                       f"**Date:** {post_date} | "
+                       f"**Category:** {post.category} | "
+                       f"**Likes:** {post.likes}\n\n")
                 
                 # Add tags
                 if post.tags:
                     tags_str = ", ".join([f"#{tag}" for tag in post.tags])
-                    markdown += f"**Tags:** {tags_str}\n\n"
+                    append(f"**Tags:** {tags_str}\n\n")
                 
                 # Add content
-                markdown += f"{post.content.strip()}\n\n"
+                append(f"{post.content.strip()}\n\n")
                 
                 # Add replies
                 if post.replies:
-                    markdown += "### Replies\n\n"
+                    append("### Replies\n\n")
                     
                     for reply in post.replies:
-                        reply_date = datetime.fromisoformat(reply["created_at"]) if isinstance(reply["created_at"], str) else reply["created_at"]
-                        markdown += f"**{reply['username']}** ({reply_date.strftime('%Y-%m-%d %H:%M')}):\n\n"
-                        markdown += f"{reply['content'].strip()}\n\n"
-                        markdown += f"Likes: {reply['likes']}\n\n"
-                        markdown += "---\n\n"
+                        append(f"**{reply['username']}** ({next(reply_dates)}):\n\n"
+                               f"{reply['content'].strip()}\n\n"
+                               f"Likes: {reply['likes']}\n\n"
+                               "---\n\n")
                 
                 # Add separator between posts
-                markdown += "---\n\n"
+                append("---\n\n")
             
             # Write to file
             with open(filepath, 'w') as f:
-                f.write(markdown)
+                f.write("".join(parts))
             
             logger.info(f"Exported {len(posts)} posts to {filepath}")
             return True
@@ -117,22 +123,7 @@
         try:
             # In a real implementation, this would make an API call
             # Simulate API response with sample data
-            
-            tags = [
-                {"tag": "mt9ema", "count": 450},
-                {"tag": "futures", "count": 280},
-                {"tag": "forex", "count": 245},
-                {"tag": "stocks", "count": 210},
-                {"tag": "daytrading", "count": 185},
-                {"tag": "swingtrading", "count": 150},
-                {"tag": "emacrossover", "count": 125},
-                {"tag": "riskmanagement", "count": 110},
-                {"tag": "psychology", "count": 95},
-                {"tag": "indicators", "count": 85},
-                {"tag": "backtesting", "count": 75},
-                {"tag": "fibonacci", "count": 60},
-                {"tag": "priceaction", "count": 55}
-            ]
+            tags = list(POPULAR_TAGS)
             
             logger.info(f"Retrieved {len(tags)} tags")
             return tags
@@ -250,3 +241,40 @@
         except Exception as e:
             logger.error(f"Error reporting post: {str(e)}")
             return False
+
+
+# Sample popular tags returned by ForumManager.get_tags
+POPULAR_TAGS = (
+    {"tag": "mt9ema", "count": 450},
+    {"tag": "futures", "count": 280},
+    {"tag": "forex", "count": 245},
+    {"tag": "stocks", "count": 210},
+    {"tag": "daytrading", "count": 185},
+    {"tag": "swingtrading", "count": 150},
+    {"tag": "emacrossover", "count": 125},
+    {"tag": "riskmanagement", "count": 110},
+    {"tag": "psychology", "count": 95},
+    {"tag": "indicators", "count": 85},
+    {"tag": "backtesting", "count": 75},
+    {"tag": "fibonacci", "count": 60},
+    {"tag": "priceaction", "count": 55}
+)
+
+
+def _format_reply_dates(created_at: List[Any]) -> List[str]:
+    """
+    Format reply timestamps for the markdown export.
+    
+    Each string is parsed on its own with datetime.fromisoformat, so mixed
+    UTC offsets work too (a bulk pandas parse returns an object index for
+    them on pandas 2.0, which cannot be formatted).
+    
+    Args:
+        created_at: Reply creation times (ISO strings or datetimes)
+        
+    Returns:
+        List of 'YYYY-MM-DD HH:MM' strings in the same order
+    """
+    fmt = '%Y-%m-%d %H:%M'
+    return [(datetime.fromisoformat(value) if isinstance(value, str) else value).strftime(fmt)
+            for value in created_at]
@@ -10,6 +10,7 @@ from mtfema_backtester.community.moderation.content_moderator import (
     ContentType, 
     ModerationType, 
     ModeratorRole,
+    get_content_moderator,
     moderate_content,
     report_content
 )
@@ -19,6 +20,7 @@ __all__ = [
     'ContentType',
     'ModerationType', 
     'ModeratorRole',
+    'get_content_moderator',
     'moderate_content',
     'report_content'
 ]
@@ -7,7 +7,15 @@ community content adheres to guidelines and maintains quality.
 
 import re
 import logging
-from typing import Dict, List, Optional, Tuple, Union, Any
+import queue
+import threading
+import time
+import functools
+import weakref
+from collections import Counter, OrderedDict, defaultdict, deque
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, Optional, Pattern, Set, Tuple, Union, Any
 from datetime import datetime
 import json
 from enum import Enum
@@ -17,6 +25,13 @@ from mtfema_backtester.community.feature_flags import FeatureFlags
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson for faster metadata serialization, but use json fallback if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class ContentType(Enum):
     """Types of content that can be moderated."""
     FORUM_POST = "forum_post"
@@ -41,6 +56,11 @@ class ModeratorRole(Enum):
     COMMUNITY_MODERATOR = "community_moderator"  # Trusted community members with limited moderation powers
     AUTO = "auto"  # Automated moderation system
 
+# Enum values looked up once instead of through the .value descriptor on every action
+_CONTENT_TYPE_VALUES = {content_type: content_type.value for content_type in ContentType}
+_MODERATION_TYPE_VALUES = {action: action.value for action in ModerationType}
+_MODERATOR_ROLE_VALUES = {role: role.value for role in ModeratorRole}
+
 class ContentModerator:
     """
     Content moderation system that combines automated and manual moderation.
@@ -52,15 +72,6 @@ class ContentModerator:
     - Audit logging of all moderation actions
     """
     
-    _instance = None
-    
-    def __new__(cls, *args, **kwargs):
-        """Implement singleton pattern for global moderation access."""
-        if cls._instance is None:
-            cls._instance = super(ContentModerator, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the content moderation system.
@@ -68,11 +79,6 @@ class ContentModerator:
         Args:
             config_path: Path to moderation configuration file
         """
-        # Skip re-initialization if already initialized
-        if getattr(self, '_initialized', False):
-            return
-            
-        self._initialized = True
         self.config_path = config_path
         
         # Load feature flags
@@ -95,6 +101,7 @@ class ContentModerator:
                 "spam", "scam", "hack", "cheat", "illegal", "password"
             ],
             "moderation_queue_limit": 100,  # Maximum items in the moderation queue
+            "moderation_history_limit": 100000,  # Maximum actions kept in memory (oldest dropped first)
         }
         
         # Override with configuration file if provided
@@ -107,18 +114,47 @@ class ContentModerator:
             except Exception as e:
                 logger.error(f"Error loading moderation config from {config_path}: {e}")
         
-        # Compile regex patterns for performance
-        self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) 
-                                  for pattern in self.config["forbidden_patterns"]]
-        
         # Create a set of forbidden words for faster lookup
         self.forbidden_words_set = set(word.lower() for word in self.config["forbidden_words"])
         
-        # Initialize moderation queue
-        self.moderation_queue = []
+        # Compile forbidden words and patterns into one regex each
+        self.forbidden_word_pattern, self.forbidden_content_pattern = _compile_forbidden_content(
+            frozenset(self.forbidden_words_set), tuple(self.config["forbidden_patterns"]))
+        
+        # Metadata checks by content type value; each returns (reason, confidence)
+        # when the content should be rejected, None otherwise
+        self._metadata_checks = {
+            _CONTENT_TYPE_VALUES[ContentType.FORUM_POST]: _check_forum_post_metadata,
+            _CONTENT_TYPE_VALUES[ContentType.SIGNAL]: _check_signal_metadata,
+        }
+        
+        # Initialize moderation queue: items by content ID, oldest first.
+        # Queued content bodies are kept separately and fetched with get_content()
+        self.moderation_queue: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._content_store: Dict[str, str] = {}
         
         # Initialize moderation history
-        self.moderation_history = []
+        self.moderation_history = deque(maxlen=self.config["moderation_history_limit"])
+        
+        # Indexes of history entries by content, user and moderator, plus
+        # per-content report counts, so lookups don't scan the whole history
+        self._history_by_content: Dict[str, deque] = defaultdict(deque)
+        self._history_by_user: Dict[str, deque] = defaultdict(deque)
+        self._history_by_moderator: Dict[str, deque] = defaultdict(deque)
+        self._reports_by_content: Counter = Counter()
+        
+        # Log entries are recorded into the history by a background thread so
+        # moderation calls return as soon as a decision is made. The thread
+        # only holds a weak reference, and is told to stop by close() or when
+        # the moderator is garbage collected
+        self._history_lock = threading.Lock()
+        self._log_queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._log_thread = threading.Thread(target=_process_log_queue,
+                                            args=(weakref.ref(self), self._log_queue),
+                                            name="moderation-log", daemon=True)
+        self._stop_log_thread = weakref.finalize(self, self._log_queue.put, _STOP_LOGGING)
+        self._log_thread.start()
         
         logger.info("Content moderation system initialized")
     
@@ -142,13 +178,16 @@ class ContentModerator:
             Tuple of (is_approved, moderation_reason, confidence_score)
         """
         # Check if content moderation is enabled
-        if not self.feature_flags.flags.get("content_moderation", True):
+        if not self.feature_flags.is_enabled("content_moderation"):
             return True, "Content moderation disabled", 1.0
         
+        # Every outcome below is logged or queued under the content's ID
+        content_id = self._generate_content_id(content, metadata)
+        
         # Auto-approve for trusted users if enabled
         if auto_approve and self._is_trusted_user(user_id):
             self._log_moderation_action(
-                content_id=self._generate_content_id(content, metadata),
+                content_id=content_id,
                 content_type=content_type,
                 user_id=user_id,
                 action=ModerationType.APPROVED,
@@ -164,13 +203,13 @@ class ContentModerator:
         # If confidence is below thresholds, queue for manual review
         if (is_approved and confidence < self.config["manual_review_threshold"]) or \
            (not is_approved and confidence < self.config["rejection_threshold"]):
-            self._add_to_moderation_queue(content, metadata, content_type, user_id, reason, confidence)
+            self._add_to_moderation_queue(content_id, content, metadata, content_type, user_id, reason, confidence)
             return False, "Queued for manual review", confidence
         
         # Log the moderation action
         action = ModerationType.APPROVED if is_approved else ModerationType.REJECTED
         self._log_moderation_action(
-            content_id=self._generate_content_id(content, metadata),
+            content_id=content_id,
             content_type=content_type,
             user_id=user_id,
             action=action,
@@ -204,9 +243,7 @@ class ContentModerator:
             return False
         
         # Count existing reports for this content
-        existing_reports = sum(1 for item in self.moderation_history 
-                              if item["content_id"] == content_id and 
-                              item["action"] == ModerationType.USER_REPORTED.value)
+        existing_reports = self._reports_by_content[content_id]
         
         # Add the report to moderation history
         self._log_moderation_action(
@@ -254,14 +291,14 @@ class ContentModerator:
         Returns:
             Whether the moderation action was applied successfully
         """
-        # Find the item in the moderation queue
-        queue_item = next((item for item in self.moderation_queue 
-                          if item["content_id"] == content_id), None)
+        # Take the item off the moderation queue
+        queue_item = self.moderation_queue.pop(content_id, None)
+        self._content_store.pop(content_id, None)
                           
         # Log the moderation action
         self._log_moderation_action(
             content_id=content_id,
-            content_type=queue_item["content_type"] if queue_item else None,
+            content_type=ContentType(queue_item["content_type"]) if queue_item else None,
             user_id=queue_item["user_id"] if queue_item else "",
             action=action,
             reason=reason,
@@ -269,12 +306,7 @@ class ContentModerator:
             moderator_role=moderator_role
         )
         
-        # Remove from queue if present
-        if queue_item:
-            self.moderation_queue.remove(queue_item)
-            return True
-            
-        return False
+        return queue_item is not None
     
     def get_moderation_queue(self, 
                            moderator_role: ModeratorRole,
@@ -294,17 +326,30 @@ class ContentModerator:
             List of moderation queue items
         """
         # Filter by content types if specified
-        filtered_queue = self.moderation_queue
+        filtered_queue = self.moderation_queue.values()
         if content_types:
-            content_type_values = [ct.value for ct in content_types]
-            filtered_queue = [item for item in self.moderation_queue 
-                             if item["content_type"] in content_type_values]
+            content_type_values = frozenset(_CONTENT_TYPE_VALUES[ct] for ct in content_types)
+            filtered_queue = (item for item in self.moderation_queue.values()
+                              if item["content_type"] in content_type_values)
         
         # Apply pagination
-        paginated_queue = filtered_queue[offset:offset + limit]
+        paginated_queue = [_with_iso_timestamp(item)
+                           for item in islice(filtered_queue, offset, offset + limit)]
         
         return paginated_queue
     
+    def get_content(self, content_id: str) -> Optional[str]:
+        """
+        Get the text of content waiting in the moderation queue.
+        
+        Args:
+            content_id: ID of the queued content
+            
+        Returns:
+            The content text, or None if it is not in the queue
+        """
+        return self._content_store.get(content_id)
+    
     def get_moderation_history(self,
                              content_id: Optional[str] = None,
                              user_id: Optional[str] = None,
@@ -326,34 +371,76 @@ class ContentModerator:
         Returns:
             List of moderation history items
         """
-        # Apply filters
-        filtered_history = self.moderation_history
-        
-        if content_id:
-            filtered_history = [item for item in filtered_history 
-                               if item["content_id"] == content_id]
-        
-        if user_id:
-            filtered_history = [item for item in filtered_history 
-                               if item["user_id"] == user_id]
-        
-        if moderator_id:
-            filtered_history = [item for item in filtered_history 
-                               if item["moderator_id"] == moderator_id]
+        self.flush_moderation_log()
         
-        if action:
-            filtered_history = [item for item in filtered_history 
-                               if item["action"] == action.value]
+        with self._history_lock:
+            return self._query_moderation_history(content_id, user_id, moderator_id,
+                                                  action, limit, offset)
+    
+    def flush_moderation_log(self):
+        """Wait until all pending moderation actions are recorded in the history."""
+        self._log_queue.join()
+    
+    def close(self):
+        """
+        Record pending moderation actions and stop the background log thread.
         
-        # Sort by timestamp (newest first)
-        sorted_history = sorted(filtered_history, 
-                               key=lambda x: x["timestamp"], 
-                               reverse=True)
+        Actions logged after closing are recorded synchronously.
+        """
+        if self._closed:
+            return
         
-        # Apply pagination
-        paginated_history = sorted_history[offset:offset + limit]
+        self._closed = True
+        self._stop_log_thread()
+        self._log_thread.join()
         
-        return paginated_history
+        # Record anything queued by a call that raced with closing
+        while True:
+            try:
+                log_entry = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._record_log_entry(log_entry)
+            self._log_queue.task_done()
+    
+    def _query_moderation_history(self,
+                                  content_id: Optional[str],
+                                  user_id: Optional[str],
+                                  moderator_id: Optional[str],
+                                  action: Optional[ModerationType],
+                                  limit: int,
+                                  offset: int) -> List[Dict[str, Any]]:
+        """Filter and paginate the moderation history (caller holds the history lock)."""
+        # Start from the narrowest index that applies, then apply filters
+        indexed = [index.get(key, []) for index, key in ((self._history_by_content, content_id),
+                                                         (self._history_by_user, user_id),
+                                                         (self._history_by_moderator, moderator_id))
+                   if key]
+        filtered_history = min(indexed, key=len) if indexed else self.moderation_history
+        action_value = _MODERATION_TYPE_VALUES[action] if action else None
+        
+        if limit <= 0:
+            return []
+        
+        # Build the combined filter once: one itemgetter call per entry,
+        # compared against the wanted values
+        filters = [(field, value) for field, value in (("content_id", content_id),
+                                                       ("user_id", user_id),
+                                                       ("moderator_id", moderator_id),
+                                                       ("action", action_value))
+                   if value]
+        
+        # History is appended in timestamp order, so walk it backwards (newest
+        # first) and stop as soon as the requested page is filled
+        newest_first = reversed(filtered_history)
+        if filters:
+            fields, wanted = zip(*filters)
+            get_fields = itemgetter(*fields)
+            if len(fields) == 1:
+                wanted = wanted[0]
+            newest_first = (item for item in newest_first if get_fields(item) == wanted)
+        
+        return [_with_iso_timestamp(item) for item in islice(newest_first, offset, offset + limit)]
     
     def _apply_moderation_rules(self, 
                               content: str, 
@@ -368,43 +455,46 @@ class ContentModerator:
         Returns:
             Tuple of (is_approved, reason, confidence)
         """
-        # Check for empty content
-        if not content or content.strip() == "":
+        # Check for empty content (isspace() stops at the first visible
+        # character, so unlike strip() it doesn't copy normal content)
+        if not content or content.isspace():
             return False, "Empty content", 1.0
         
         # Check content length
         if len(content) < 3:
             return False, "Content too short", 1.0
         
-        # Check for forbidden words
-        content_lower = content.lower()
-        for word in self.forbidden_words_set:
-            if word in content_lower:
-                return False, f"Forbidden word: {word}", 0.95
-        
-        # Check for forbidden patterns
-        for i, pattern in enumerate(self.compiled_patterns):
-            if pattern.search(content):
-                return False, f"Matched forbidden pattern #{i+1}", 0.9
-        
-        # Additional checks based on content type can be added here
-        content_type = metadata.get("content_type", "")
-        
-        if content_type == ContentType.FORUM_POST.value:
-            # Forum-specific checks (e.g., title quality)
-            title = metadata.get("title", "")
-            if title and len(title) < 5:
-                return False, "Forum post title too short", 0.85
-        
-        elif content_type == ContentType.SIGNAL.value:
-            # Signal-specific checks
-            if "symbol" not in metadata or not metadata["symbol"]:
-                return False, "Signal missing required symbol", 0.95
+        # Content type checks only look at metadata, so run them before
+        # scanning the content itself. A rejection that is confident enough
+        # to stand on its own skips the scan; a weaker one only applies if
+        # the scan finds nothing, so it can't hide an automatic rejection
+        rejection = None
+        check_metadata = self._metadata_checks.get(metadata.get("content_type", ""))
+        if check_metadata is not None:
+            rejection = check_metadata(metadata)
+            if rejection and rejection[1] >= self.config["rejection_threshold"]:
+                return False, rejection[0], rejection[1]
+        
+        # Check for forbidden words, then patterns. The regexes are
+        # case-insensitive, so search the content as-is
+        if self.forbidden_word_pattern is not None:
+            match = self.forbidden_word_pattern.search(content)
+            if match:
+                return False, f"Forbidden word: {match.group().lower()}", 0.95
+        
+        if self.forbidden_content_pattern is not None:
+            match = self.forbidden_content_pattern.search(content)
+            if match:
+                return False, f"Matched forbidden pattern #{int(match.lastgroup[len('pattern'):]) + 1}", 0.9
+        
+        if rejection:
+            return False, rejection[0], rejection[1]
         
         # All checks passed
         return True, "Content approved", 0.85
     
     def _add_to_moderation_queue(self,
+                                content_id: str,
                                 content: str,
                                 metadata: Dict[str, Any],
                                 content_type: ContentType,
@@ -415,6 +505,7 @@ class ContentModerator:
         Add an item to the moderation queue.
         
         Args:
+            content_id: ID of the content (from _generate_content_id)
             content: The content to moderate
             metadata: Additional metadata about the content
             content_type: Type of content being moderated
@@ -422,29 +513,33 @@ class ContentModerator:
             reason: Reason for moderation
             confidence: Confidence score of the automated decision
         """
+        # The same content and metadata always get the same ID, so content
+        # already waiting for review is not queued a second time
+        if content_id in self.moderation_queue:
+            logger.info(f"Content {content_id} is already in the moderation queue")
+            return
+        
         # Check if queue is full
         if len(self.moderation_queue) >= self.config["moderation_queue_limit"]:
             # Remove oldest item if queue is full
-            self.moderation_queue.pop(0)
-        
-        # Generate a content ID for tracking
-        content_id = self._generate_content_id(content, metadata)
+            oldest_id, _ = self.moderation_queue.popitem(last=False)
+            self._content_store.pop(oldest_id, None)
         
         # Create queue item
         queue_item = {
             "content_id": content_id,
-            "content": content,
             "metadata": metadata,
-            "content_type": content_type.value,
+            "content_type": _CONTENT_TYPE_VALUES[content_type],
             "user_id": user_id,
             "reason": reason,
             "confidence": confidence,
-            "timestamp": datetime.now().isoformat(),
-            "status": ModerationType.FLAGGED.value
+            "timestamp_ns": time.time_ns(),
+            "status": _MODERATION_TYPE_VALUES[ModerationType.FLAGGED]
         }
         
         # Add to queue
-        self.moderation_queue.append(queue_item)
+        self.moderation_queue[content_id] = queue_item
+        self._content_store[content_id] = content
         
         # Log the queuing action
         self._log_moderation_action(
@@ -461,7 +556,7 @@ class ContentModerator:
     
     def _log_moderation_action(self,
                               content_id: str,
-                              content_type: ContentType,
+                              content_type: Optional[ContentType],
                               user_id: str,
                               action: ModerationType,
                               reason: str,
@@ -472,29 +567,68 @@ class ContentModerator:
         
         Args:
             content_id: ID of the moderated content
-            content_type: Type of the content
+            content_type: Type of the content (None if unknown)
             user_id: ID of the user who created the content
             action: Moderation action taken
             reason: Reason for the action
             moderator_id: ID of the moderator
             moderator_role: Role of the moderator
         """
+        content_type_value = _CONTENT_TYPE_VALUES.get(content_type)
+        action_value = _MODERATION_TYPE_VALUES[action]
+        moderator_role_value = _MODERATOR_ROLE_VALUES[moderator_role]
+        
         log_entry = {
             "content_id": content_id,
-            "content_type": content_type.value,
+            "content_type": content_type_value,
             "user_id": user_id,
-            "action": action.value,
+            "action": action_value,
             "reason": reason,
             "moderator_id": moderator_id,
-            "moderator_role": moderator_role.value,
-            "timestamp": datetime.now().isoformat()
+            "moderator_role": moderator_role_value,
+            "timestamp_ns": time.time_ns()
         }
         
-        # Add to history
-        self.moderation_history.append(log_entry)
+        # Report counts are read right away by report_content, so keep them current here
+        if action == ModerationType.USER_REPORTED:
+            self._reports_by_content[content_id] += 1
         
-        # Log to system logs
-        logger.info(f"Moderation action: {action.value} on {content_type.value} by {moderator_role.value}")
+        # Hand the entry to the background thread for recording
+        if self._closed:
+            self._record_log_entry(log_entry)
+        else:
+            self._log_queue.put_nowait(log_entry)
+    
+    def _record_log_entry(self, log_entry: Dict[str, Any]):
+        """Record a moderation log entry in the history and system logs."""
+        try:
+            # Add to history and its indexes
+            with self._history_lock:
+                if len(self.moderation_history) == self.moderation_history.maxlen:
+                    self._drop_oldest_history_entry()
+                self.moderation_history.append(log_entry)
+                self._history_by_content[log_entry["content_id"]].append(log_entry)
+                self._history_by_user[log_entry["user_id"]].append(log_entry)
+                self._history_by_moderator[log_entry["moderator_id"]].append(log_entry)
+            
+            # Log to system logs
+            logger.info(f"Moderation action: {log_entry['action']} on {log_entry['content_type']} "
+                        f"by {log_entry['moderator_role']}")
+        except Exception as e:
+            logger.error(f"Error recording moderation action: {e}")
+    
+    def _drop_oldest_history_entry(self):
+        """Remove the oldest history entry and its index references (caller holds the history lock)."""
+        oldest = self.moderation_history.popleft()
+        
+        # The oldest entry overall is also the oldest in each index it appears in
+        for index, key in ((self._history_by_content, oldest["content_id"]),
+                           (self._history_by_user, oldest["user_id"]),
+                           (self._history_by_moderator, oldest["moderator_id"])):
+            entries = index[key]
+            entries.popleft()
+            if not entries:
+                del index[key]
     
     def _generate_content_id(self, content: str, metadata: Dict[str, Any]) -> str:
         """
@@ -507,14 +641,16 @@ class ContentModerator:
         Returns:
             Unique content ID
         """
-        # Create a string representation of the metadata
-        metadata_str = json.dumps(metadata, sort_keys=True)
-        
-        # Combine content and metadata
-        combined = f"{content}|{metadata_str}"
-        
-        # Generate hash
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        # Create a canonical representation of the metadata
+        metadata_bytes = _serialize_metadata(metadata)
+        
+        # Hash content and metadata (not security-sensitive, so a fast
+        # 64-bit BLAKE2b digest is enough for a 16-character ID)
+        content_hash = hashlib.blake2b(digest_size=8)
+        content_hash.update(content.encode())
+        content_hash.update(b"|")
+        content_hash.update(metadata_bytes)
+        return content_hash.hexdigest()
     
     def _is_trusted_user(self, user_id: str) -> bool:
         """
@@ -530,7 +666,252 @@ class ContentModerator:
         # For now, it's a stub implementation
         return False
 
+# Queued in place of a log entry to stop a moderator's log thread
+_STOP_LOGGING = None
+
+def _process_log_queue(moderator_ref: "weakref.ref[ContentModerator]", log_queue: queue.Queue):
+    """
+    Record queued moderation log entries until told to stop.
+    
+    Runs on a moderator's log thread. The moderator is only dereferenced
+    while an entry is being recorded, so an idle thread doesn't keep it alive.
+    
+    Args:
+        moderator_ref: Weak reference to the owning moderator
+        log_queue: The moderator's log queue
+    """
+    while True:
+        log_entry = log_queue.get()
+        try:
+            if log_entry is _STOP_LOGGING:
+                return
+            moderator = moderator_ref()
+            if moderator is None:
+                return
+            moderator._record_log_entry(log_entry)
+            del moderator
+        finally:
+            log_queue.task_done()
+
+def _check_forum_post_metadata(metadata: Dict[str, Any]) -> Optional[Tuple[str, float]]:
+    """Forum-specific checks (e.g., title quality)."""
+    title = metadata.get("title", "")
+    if title and len(title) < 5:
+        return "Forum post title too short", 0.85
+    return None
+
+def _check_signal_metadata(metadata: Dict[str, Any]) -> Optional[Tuple[str, float]]:
+    """Signal-specific checks."""
+    if "symbol" not in metadata or not metadata["symbol"]:
+        return "Signal missing required symbol", 0.95
+    return None
+
+@functools.lru_cache(maxsize=1024)
+def _format_timestamp(timestamp_ns: int) -> str:
+    """
+    Format an epoch timestamp in nanoseconds as a local ISO 8601 string.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch (from time.time_ns())
+        
+    Returns:
+        ISO formatted timestamp, as datetime.now().isoformat() would give
+    """
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+def _with_iso_timestamp(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a history or queue item, adding its ISO "timestamp" for callers."""
+    return {**item, "timestamp": _format_timestamp(item["timestamp_ns"])}
+
+def _serialize_metadata(metadata: Dict[str, Any]) -> bytes:
+    """
+    Serialize metadata to compact JSON with sorted keys.
+    
+    Uses orjson when it is installed, falling back to json for values it
+    can't encode (such as integers wider than 64 bits). The backends agree
+    on strings, integers, booleans and None, but not on every float (orjson
+    writes 1e16 where json writes 1e+16) or on NaN and infinity (orjson
+    writes null). Content IDs of metadata holding such floats therefore
+    depend on whether orjson is installed.
+    
+    Args:
+        metadata: Metadata dictionary
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(metadata, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _drop_covered_literals(pattern: str, forbidden_words: FrozenSet[str]) -> Optional[str]:
+    """
+    Drop the literals of a \\b(foo|bar)\\b pattern already caught by a forbidden word.
+    
+    Forbidden words match anywhere in the content and are tried first, so a
+    literal containing one of them could never be the reported match.
+    
+    Args:
+        pattern: Forbidden regex pattern
+        forbidden_words: Lowercase forbidden words
+        
+    Returns:
+        The pattern without covered literals, or None if nothing is left
+    """
+    # Only handle a single group of alternatives without nested groups,
+    # character classes or escaped metacharacters, so splitting on "|" is safe
+    match = re.fullmatch(r"\\b\((?P<alternatives>(?:[^()\[\]\\]|\\[a-zA-Z])*)\)\\b", pattern)
+    if not match:
+        return pattern
+    
+    alternatives = match.group("alternatives").split("|")
+    remaining = [alternative for alternative in alternatives
+                 if not (alternative.isalnum() and
+                         any(word in alternative.lower() for word in forbidden_words))]
+    
+    if not remaining:
+        return None
+    if len(remaining) == len(alternatives):
+        return pattern
+    return rf"\b({'|'.join(remaining)})\b"
+
+def _leading_characters(pattern: str) -> Optional[Set[str]]:
+    """
+    Get the characters a match of a forbidden pattern must start with.
+    
+    Only patterns of the form [\\b]literal... or [\\b](literal|literal|...)...
+    are analysed; anything else returns None, meaning any character may start
+    a match.
+    
+    Args:
+        pattern: Forbidden regex pattern
+        
+    Returns:
+        Set of possible first characters, or None if unknown
+    """
+    if pattern.startswith(r"\b"):
+        pattern = pattern[2:]
+    if _has_top_level_alternation(pattern):
+        return None
+    
+    if pattern.startswith("("):
+        end = pattern.find(")")
+        group = pattern[1:end]
+        if (end < 0 or "(" in group or group.endswith("\\") or
+                pattern[end + 1:end + 2] in ("?", "*", "{")):
+            return None
+        alternatives = group.split("|")
+    else:
+        alternatives = [pattern]
+    
+    first_chars = set()
+    for alternative in alternatives:
+        if not alternative or not alternative[0].isalnum() or alternative[1:2] in ("?", "*", "{"):
+            return None
+        first_chars.add(alternative[0])
+    return first_chars
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Check whether a regex pattern has a "|" outside of any group or character class."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+@functools.lru_cache(maxsize=32)
+def _compile_forbidden_content(forbidden_words: FrozenSet[str],
+                               forbidden_patterns: Tuple[str, ...]
+                               ) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+    """
+    Compile forbidden words and patterns into case-insensitive regexes.
+    
+    Cached on the word set and pattern tuple, so moderators created with
+    the same configuration share the compiled regexes.
+    
+    Words and patterns get separate regexes so a forbidden word anywhere in
+    the content outranks a pattern matching earlier on. Words match as
+    literals, longest first, so the most specific word at a position is
+    reported; pattern i is wrapped in the "pattern<i>" group so a match
+    tells which rule fired. Pattern literals already caught by a forbidden
+    word are left out.
+    
+    Args:
+        forbidden_words: Lowercase forbidden words
+        forbidden_patterns: Forbidden regex patterns
+        
+    Returns:
+        Tuple of (word regex, pattern regex); either is None if there is
+        nothing for it to match
+    """
+    word_regex = None
+    if forbidden_words:
+        words = sorted(forbidden_words, key=len, reverse=True)
+        first_chars = {word[0] for word in words} if all(words) else None
+        word_regex = _compile_alternatives([re.escape(word) for word in words], first_chars)
+    
+    alternatives = []
+    first_chars: Optional[Set[str]] = set()
+    for i, pattern in enumerate(forbidden_patterns):
+        pattern = _drop_covered_literals(pattern, forbidden_words)
+        if pattern is not None:
+            alternatives.append(f"(?P<pattern{i}>{pattern})")
+            pattern_chars = _leading_characters(pattern)
+            first_chars = first_chars | pattern_chars if first_chars is not None and pattern_chars else None
+    pattern_regex = _compile_alternatives(alternatives, first_chars) if alternatives else None
+    
+    return word_regex, pattern_regex
+
+def _compile_alternatives(alternatives: List[str], first_chars: Optional[Set[str]]) -> Pattern:
+    """Compile regex alternatives into one case-insensitive regex."""
+    combined = "|".join(alternatives)
+    if first_chars:
+        # Reject most positions with a single character-class test before
+        # trying every alternative there
+        char_class = "".join(re.escape(char) for char in sorted(first_chars))
+        combined = f"(?=[{char_class}])(?:{combined})"
+    return re.compile(combined, re.IGNORECASE)
+
 # Helper functions for easier access
+
+# Global moderator instance, created on first use
+_content_moderator: Optional[ContentModerator] = None
+
+def get_content_moderator(config_path: Optional[str] = None) -> ContentModerator:
+    """
+    Get the global content moderator instance.
+    
+    Args:
+        config_path: Path to moderation configuration file (only used when
+            the instance is first created)
+        
+    Returns:
+        ContentModerator instance
+    """
+    global _content_moderator
+    if _content_moderator is None:
+        _content_moderator = ContentModerator(config_path)
+    return _content_moderator
+
 def moderate_content(content: str, 
                     metadata: Dict[str, Any],
                     content_type: ContentType,
@@ -549,8 +930,7 @@ def moderate_content(content: str,
     Returns:
         Tuple of (is_approved, moderation_reason, confidence_score)
     """
-    moderator = ContentModerator()
-    return moderator.moderate_content(content, metadata, content_type, user_id, auto_approve)
+    return get_content_moderator().moderate_content(content, metadata, content_type, user_id, auto_approve)
 
 def report_content(content_id: str,
                   content_type: ContentType,
@@ -568,5 +948,4 @@ def report_content(content_id: str,
     Returns:
         Whether the content was flagged for review
     """
-    moderator = ContentModerator()
-    return moderator.report_content(content_id, content_type, reporter_id, reason)
+    return get_content_moderator().report_content(content_id, content_type, reporter_id, reason)
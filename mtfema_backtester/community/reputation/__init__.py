@@ -9,6 +9,7 @@ from mtfema_backtester.community.reputation.reputation_system import (
     ReputationSystem, 
     get_reputation_system,
     award_points,
+    award_points_bulk,
     get_user_reputation,
     get_user_badges,
     generate_leaderboard
@@ -18,6 +19,7 @@ __all__ = [
     'ReputationSystem',
     'get_reputation_system',
     'award_points',
+    'award_points_bulk',
     'get_user_reputation',
     'get_user_badges',
     'generate_leaderboard'
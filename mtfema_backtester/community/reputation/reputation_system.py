@@ -6,18 +6,143 @@ awarding points, managing badges, and generating leaderboards.
 """
 
 import os
+import sys
 import json
+import atexit
+import hashlib
 import logging
 import uuid
+import time
+import bisect
+import heapq
 import threading
-from typing import Dict, List, Any, Optional
+import numpy as np
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
+from typing import Deque, Dict, List, Any, Mapping, Optional, Set, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Seconds a generated leaderboard is reused while no points change
+LEADERBOARD_CACHE_TTL = 30.0
+
+# Seconds the writer thread waits after a change before writing the user
+# reputation snapshot, so changes made meanwhile share the write
+SNAPSHOT_DELAY = 5.0
+
+# Users are stored across this many files, by the first byte of an MD5 of the
+# user ID, so saving a change only rewrites that user's file
+USER_SHARD_COUNT = 256
+
+# Most recent actions kept in memory per user (the action log keeps them all)
+ACTION_HISTORY_LIMIT = 1000
+
+# Points needed to reach each level; level N starts at LEVEL_THRESHOLDS[N - 1]
+LEVEL_THRESHOLDS = (0, 100, 300, 600, 1000, 1500, 2100, 3000, 4000, 5500, 7500, 10000)
+
+# Number of locks that per-user updates are spread over (a power of two)
+USER_LOCK_STRIPES = 64
+
+# Storage directories (real paths) held by open ReputationSystem instances
+_open_storage_paths: Set[str] = set()
+_open_storage_paths_lock = threading.Lock()
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON, using orjson when available.
+    
+    Args:
+        obj: JSON-compatible object
+        
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _user_shard(user_id: str) -> int:
+    """
+    Get the storage shard for a user.
+    
+    Uses MD5 rather than hash() so users stay in the same file across runs.
+    
+    Args:
+        user_id: ID of the user
+        
+    Returns:
+        Shard number below USER_SHARD_COUNT
+    """
+    return hashlib.md5(user_id.encode("utf-8")).digest()[0] % USER_SHARD_COUNT
+
+def _restore_user(user_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a stored user record back to its in-memory form.
+    
+    Args:
+        user_data: User record as loaded from JSON
+        
+    Returns:
+        The same record, with badges as a set, interned action types and
+        leaderboard scores filled in
+    """
+    user_data["badges"] = set(user_data["badges"])
+    user_data["actions"] = {_ACTION_TYPE_VALUES.get(action_type, action_type): count
+                            for action_type, count in user_data["actions"].items()}
+    user_data["signal_score"] = _signals_score(user_data)
+    user_data["forum_score"] = _forum_score(user_data)
+    return user_data
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """
+    Replace a file's contents so readers see either the old or new data.
+    
+    The data is written and synced to a temporary file next to the target,
+    which is then renamed over it.
+    
+    Args:
+        path: File to write
+        data: New contents
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _with_iso_timestamp(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy an action record, adding its ISO "timestamp" for callers.
+    
+    Records store the time as "timestamp_ns" and are only formatted when
+    read. Records from older versions already carry "timestamp".
+    
+    Args:
+        record: Action record
+        
+    Returns:
+        Copy of the record with a "timestamp" field
+    """
+    if "timestamp_ns" not in record:
+        return dict(record)
+    seconds, nanoseconds = divmod(record["timestamp_ns"], 1_000_000_000)
+    timestamp = datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+    return {**record, "timestamp": timestamp}
+
 class ActionType(Enum):
     """Types of community actions that award reputation points."""
     FORUM_POST_CREATE = "forum_post_create"
@@ -37,6 +162,39 @@ class ActionType(Enum):
     DAILY_LOGIN = "daily_login"
     PROFILE_COMPLETE = "profile_complete"
 
+# Interned action type string for each ActionType member and value, so action
+# counts are keyed by the same string objects however the type was given
+_ACTION_TYPE_VALUES: Dict[Union[str, ActionType], str] = {}
+for _action in ActionType:
+    _ACTION_TYPE_VALUES[_action] = _ACTION_TYPE_VALUES[_action.value] = sys.intern(_action.value)
+del _action
+
+# Action type values read when scoring and building leaderboards
+_SIGNAL_CREATE = ActionType.SIGNAL_CREATE.value
+_SIGNAL_SUCCESS = ActionType.SIGNAL_SUCCESS.value
+_FORUM_POST_CREATE = ActionType.FORUM_POST_CREATE.value
+_FORUM_SOLUTION = ActionType.FORUM_SOLUTION.value
+
+# Points awarded for different actions
+_POINTS_MAP = {
+    ActionType.FORUM_POST_CREATE.value: 10,
+    ActionType.FORUM_POST_LIKE.value: 1,
+    ActionType.FORUM_POST_LIKED.value: 5,
+    ActionType.FORUM_SOLUTION.value: 25,
+    
+    ActionType.SIGNAL_CREATE.value: 15,
+    ActionType.SIGNAL_SUCCESS.value: 20,
+    ActionType.SIGNAL_FOLLOWED.value: 5,
+    
+    ActionType.SETUP_SHARE.value: 15,
+    ActionType.SETUP_LIKED.value: 5,
+    
+    ActionType.BACKTEST_SHARE.value: 10,
+    
+    ActionType.DAILY_LOGIN.value: 2,
+    ActionType.PROFILE_COMPLETE.value: 5
+}
+
 
 @dataclass
 class Badge:
@@ -51,6 +209,33 @@ class Badge:
     is_special: bool = False
 
 
+def _signals_score(user: Dict[str, Any]) -> int:
+    """Leaderboard score for the 'signals' category (signal creation and success)."""
+    actions = user["actions"]
+    return actions.get(_SIGNAL_SUCCESS, 0) * 2 + actions.get(_SIGNAL_CREATE, 0)
+
+def _forum_score(user: Dict[str, Any]) -> int:
+    """Leaderboard score for the 'forum' category (posts and solutions)."""
+    actions = user["actions"]
+    return actions.get(_FORUM_POST_CREATE, 0) + actions.get(_FORUM_SOLUTION, 0) * 3
+
+# User field holding the score for each leaderboard category other than
+# reputation. The fields are kept up to date on award so leaderboards don't
+# have to recompute them from the action counts.
+_LEADERBOARD_SCORE_FIELDS = {
+    "signals": "signal_score",
+    "forum": "forum_score"
+}
+
+# Score field and amount each action adds to it
+_ACTION_SCORES = {
+    _SIGNAL_SUCCESS: ("signal_score", 2),
+    _SIGNAL_CREATE: ("signal_score", 1),
+    _FORUM_POST_CREATE: ("forum_score", 1),
+    _FORUM_SOLUTION: ("forum_score", 3)
+}
+
+
 class ReputationSystem:
     """
     Reputation system for the MT 9 EMA Backtester community.
@@ -60,17 +245,11 @@ class ReputationSystem:
     - Award badges for accomplishments
     - Generate leaderboards
     - Track user activity and contributions
-    """
-    
-    # Singleton instance
-    _instance = None
     
-    def __new__(cls, *args, **kwargs):
-        """Implement singleton pattern for global access."""
-        if cls._instance is None:
-            cls._instance = super(ReputationSystem, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    Each instance owns its storage directory until closed, so only one may
+    be open per directory. Use get_reputation_system() for the shared
+    instance rather than constructing one directly.
+    """
     
     def __init__(self, storage_path: Optional[str] = None):
         """
@@ -78,13 +257,10 @@ class ReputationSystem:
         
         Args:
             storage_path: Directory for storing reputation data
-        """
-        # Skip re-initialization if already initialized
-        if getattr(self, '_initialized', False):
-            return
             
-        self._initialized = True
-        
+        Raises:
+            RuntimeError: If another open instance already uses the directory
+        """
         # Set storage path
         self._storage_path = storage_path or os.path.join(
             os.path.expanduser("~"),
@@ -98,65 +274,322 @@ class ReputationSystem:
         
         # Initialize data structures
         self._users: Dict[str, Dict[str, Any]] = {}
-        self._badges: Dict[str, Badge] = {}
-        self._action_history: Dict[str, List[Dict[str, Any]]] = {}
+        self._badges: Mapping[str, Badge] = MappingProxyType({})
+        
+        # Badge lookups for award checks: action badges by action type ordered
+        # by action count, and special badges ordered by points required
+        self._badges_by_action: Dict[str, List[Badge]] = {}
+        self._special_badges: List[Badge] = []
+        self._special_badge_points: List[int] = []
+        # Recent actions per user, newest first
+        self._action_history: Dict[str, Deque[Dict[str, Any]]] = {}
         
-        # Thread lock for thread safety
+        # Lock for the structures shared by all users (user table, rank index,
+        # caches, history log). Per-user data is guarded by a striped lock;
+        # when both are needed the user's lock is taken first.
         self._lock = threading.RLock()
+        self._user_locks = [threading.Lock() for _ in range(USER_LOCK_STRIPES)]
+        
+        # Serializes writes of the user snapshot
+        self._io_lock = threading.Lock()
+        
+        # Recently generated leaderboards: (category, timeframe, limit) -> (monotonic time, entries)
+        self._leaderboard_cache: Dict[Tuple[str, str, int], Tuple[float, List[Dict[str, Any]]]] = {}
         
-        # Load data
-        self._load_data()
+        # Set when the user snapshot has unsaved changes; the writer thread
+        # saves it in the background when woken
+        self._snapshot_pending = threading.Event()
+        self._writer_wakeup = threading.Event()
+        self._closing = threading.Event()
+        
+        # User IDs stored in each shard, and shards with unsaved changes
+        self._shard_users: Dict[int, List[str]] = {}
+        self._dirty_shards: Set[int] = set()
+        self._writer_thread = threading.Thread(target=self._writer_loop,
+                                               name="reputation-writer", daemon=True)
+        
+        # Claim the directory before reading it, so two instances never
+        # append to the same log or overwrite each other's shards
+        self._storage_key = os.path.realpath(self._storage_path)
+        with _open_storage_paths_lock:
+            if self._storage_key in _open_storage_paths:
+                raise RuntimeError(f"Reputation data in {self._storage_path} is already open; "
+                                   f"use get_reputation_system() or close the other instance first")
+            _open_storage_paths.add(self._storage_key)
+        
+        try:
+            # Load data
+            self._load_data()
+            
+            # Action records are appended to this log as they happen
+            self._history_log = open(self._history_log_path(), 'ab')
+        except BaseException:
+            with _open_storage_paths_lock:
+                _open_storage_paths.discard(self._storage_key)
+            raise
+        atexit.register(self.close)
+        
+        # Users ordered by rank as (-points, user_id), kept sorted as points change
+        self._rank_index: List[Tuple[int, str]] = sorted(
+            (-user["points"], user_id) for user_id, user in self._users.items())
+        
+        # Leaderboard scores for the categories other than reputation, one
+        # array per category indexed by user slot
+        self._user_ids: List[str] = []
+        self._user_slots: Dict[str, int] = {}
+        self._category_scores: Dict[str, np.ndarray] = {
+            category: np.zeros(max(len(self._users), 64), dtype=np.int64)
+            for category in _LEADERBOARD_SCORE_FIELDS
+        }
+        for user_id in self._users:
+            self._update_category_scores(user_id)
         
         # Initialize system with default badges
         self._initialize_badges()
         
+        self._writer_thread.start()
+        
         logger.info("Reputation system initialized")
     
     def _load_data(self) -> None:
         """Load reputation data from storage."""
-        # Load user reputation data
-        user_file = os.path.join(self._storage_path, "user_reputation.json")
-        if os.path.exists(user_file):
+        # Load user reputation data from the shard files
+        shard_files = []
+        for name in sorted(os.listdir(self._storage_path)):
+            if name.startswith("users_") and name.endswith(".json.tmp"):
+                # A crash interrupted the first save of this shard before its rename
+                shard_file = os.path.join(self._storage_path, name[:-len(".tmp")])
+                if not os.path.exists(shard_file):
+                    os.replace(shard_file + ".tmp", shard_file)
+                    shard_files.append(shard_file)
+            elif name.startswith("users_") and name.endswith(".json"):
+                shard_files.append(os.path.join(self._storage_path, name))
+        
+        for shard_file in shard_files:
             try:
-                with open(user_file, 'r') as f:
-                    self._users = json.load(f)
-                logger.info(f"Loaded reputation data for {len(self._users)} users")
+                with open(shard_file, 'rb') as f:
+                    for user_id, user_data in _loads(f.read()).items():
+                        self._users[user_id] = _restore_user(user_data)
             except Exception as e:
-                logger.error(f"Error loading user reputation data: {str(e)}")
+                logger.error(f"Error loading user reputation data from {shard_file}: {str(e)}")
         
-        # Load action history
-        history_file = os.path.join(self._storage_path, "action_history.json")
-        if os.path.exists(history_file):
+        for user_id in self._users:
+            self._shard_users.setdefault(_user_shard(user_id), []).append(user_id)
+        
+        if shard_files:
+            logger.info(f"Loaded reputation data for {len(self._users)} users")
+        else:
+            self._migrate_user_file()
+        
+        # Load action history by replaying the action log
+        history_log = self._history_log_path()
+        if os.path.exists(history_log):
             try:
-                with open(history_file, 'r') as f:
-                    self._action_history = json.load(f)
+                skipped = 0
+                offset = 0
+                torn_at = None
+                with open(history_log, 'rb') as f:
+                    for line in f:
+                        line_start = offset
+                        offset += len(line)
+                        if not line.strip():
+                            continue
+                        # A crash mid-append leaves a partial last line; skip
+                        # unreadable records rather than losing the whole log
+                        try:
+                            record = _loads(line)
+                        except ValueError:
+                            skipped += 1
+                            if not line.endswith(b"\n"):
+                                torn_at = line_start
+                            continue
+                        self._replay_history_record(record)
+                        if not line.endswith(b"\n"):
+                            torn_at = offset
+                
+                # Repair an unterminated last line before anything is appended,
+                # or the next record would be joined onto it and lost as well
+                if torn_at is not None:
+                    with open(history_log, 'r+b') as f:
+                        f.truncate(torn_at)
+                        if torn_at == offset:
+                            f.seek(torn_at)
+                            f.write(b"\n")
+                if skipped:
+                    logger.warning(f"Skipped {skipped} unreadable action history records")
                 logger.info(f"Loaded action history for {len(self._action_history)} users")
             except Exception as e:
                 logger.error(f"Error loading action history: {str(e)}")
+        else:
+            self._migrate_history_file()
     
-    def _save_data(self) -> None:
-        """Save reputation data to storage."""
+    def _migrate_user_file(self) -> None:
+        """Split a user_reputation.json file from older versions into shard files."""
+        user_file = os.path.join(self._storage_path, "user_reputation.json")
+        if not os.path.exists(user_file):
+            return
+        
+        try:
+            with open(user_file, 'rb') as f:
+                for user_id, user_data in _loads(f.read()).items():
+                    self._users[user_id] = _restore_user(user_data)
+                    shard = _user_shard(user_id)
+                    self._shard_users.setdefault(shard, []).append(user_id)
+                    self._dirty_shards.add(shard)
+            
+            self._save_users()
+            if self._dirty_shards:
+                logger.error("Error migrating user reputation data: not all shards were saved")
+                return
+            
+            os.remove(user_file)
+            logger.info(f"Migrated reputation data for {len(self._users)} users")
+        except Exception as e:
+            logger.error(f"Error migrating user reputation data: {str(e)}")
+    
+    def _history_log_path(self) -> str:
+        """Path of the append-only action history log."""
+        return os.path.join(self._storage_path, "action_history.jsonl")
+    
+    def _replay_history_record(self, record: Dict[str, Any]) -> None:
+        """
+        Apply one action log record to the in-memory action history.
+        
+        Args:
+            record: Action record, or a reset marker written by reset_user_reputation
+        """
+        if record.get("reset"):
+            self._action_history[record["user_id"]] = deque(maxlen=ACTION_HISTORY_LIMIT)
+        else:
+            history = self._action_history.get(record["user_id"])
+            if history is None:
+                history = self._action_history[record["user_id"]] = deque(maxlen=ACTION_HISTORY_LIMIT)
+            history.appendleft(record)
+    
+    def _migrate_history_file(self) -> None:
+        """Convert an action_history.json file from older versions into the action log."""
+        history_file = os.path.join(self._storage_path, "action_history.json")
+        if not os.path.exists(history_file):
+            return
+        
+        try:
+            with open(history_file, 'rb') as f:
+                legacy_history = _loads(f.read())
+            
+            _write_atomic(self._history_log_path(), b"".join(
+                _dumps(record) + b"\n"
+                for actions in legacy_history.values()
+                for record in actions))
+            
+            for user_id, actions in legacy_history.items():
+                self._action_history[user_id] = deque(maxlen=ACTION_HISTORY_LIMIT)
+                self._action_history[user_id].extendleft(actions)
+            
+            os.remove(history_file)
+            logger.info(f"Migrated action history for {len(self._action_history)} users")
+        except Exception as e:
+            logger.error(f"Error migrating action history: {str(e)}")
+    
+    def _append_history(self, *records: Dict[str, Any]) -> None:
+        """
+        Append records to the action history log.
+        
+        Args:
+            records: Records to append
+        """
+        try:
+            self._history_log.write(b"".join(_dumps(record) + b"\n" for record in records))
+            self._history_log.flush()
+        except Exception as e:
+            logger.error(f"Error saving action history: {str(e)}")
+    
+    def _schedule_snapshot(self) -> None:
+        """Wake the writer thread to save the shards marked as changed."""
+        self._snapshot_pending.set()
+        self._writer_wakeup.set()
+    
+    def _writer_loop(self) -> None:
+        """Save the user snapshot in the background whenever it has changed."""
+        while not self._closing.is_set():
+            self._writer_wakeup.wait()
+            self._writer_wakeup.clear()
+            
+            # Give further changes a chance to join this write
+            self._closing.wait(SNAPSHOT_DELAY)
+            
+            self.flush()
+    
+    def _save_users(self) -> None:
+        """Save the user reputation shards that have changed to storage."""
+        with self._io_lock:
+            with self._lock:
+                shards, self._dirty_shards = self._dirty_shards, set()
+                shard_users = {shard: list(self._shard_users.get(shard, ())) for shard in shards}
+            
+            for shard, user_ids in shard_users.items():
+                # Copy each user under their own lock so the dump doesn't race updates
+                users = {}
+                for user_id in user_ids:
+                    with self._user_lock(user_id):
+                        user_data = self._users[user_id]
+                        users[user_id] = dict(user_data,
+                                              badges=sorted(user_data["badges"]),
+                                              actions=dict(user_data["actions"]))
+                
+                shard_file = os.path.join(self._storage_path, f"users_{shard:02x}.json")
+                try:
+                    _write_atomic(shard_file, _dumps(users))
+                except Exception as e:
+                    logger.error(f"Error saving user reputation data: {str(e)}")
+                    with self._lock:
+                        self._dirty_shards.add(shard)
+    
+    def flush(self) -> None:
+        """Write any pending user snapshot to storage now."""
+        # Clear before copying, so changes made during the save stay pending
+        if self._snapshot_pending.is_set():
+            self._snapshot_pending.clear()
+            self._save_users()
+    
+    def close(self) -> None:
+        """
+        Flush pending changes, stop the writer thread and close the action history log.
+        
+        Closing releases the storage directory for another instance.
+        """
+        self._closing.set()
+        if self._writer_thread.is_alive():
+            # Wake the writer so it saves anything pending and exits
+            self._writer_wakeup.set()
+            self._writer_thread.join()
+        self.flush()
         with self._lock:
-            # Save user reputation data
-            user_file = os.path.join(self._storage_path, "user_reputation.json")
-            try:
-                with open(user_file, 'w') as f:
-                    json.dump(self._users, f, indent=2)
-            except Exception as e:
-                logger.error(f"Error saving user reputation data: {str(e)}")
+            if self._history_log.closed:
+                return
+            self._history_log.close()
+        
+        atexit.unregister(self.close)
+        with _open_storage_paths_lock:
+            _open_storage_paths.discard(self._storage_key)
+    
+    def _user_lock(self, user_id: str) -> threading.Lock:
+        """
+        Get the lock guarding a user's data.
+        
+        Args:
+            user_id: ID of the user
             
-            # Save action history
-            history_file = os.path.join(self._storage_path, "action_history.json")
-            try:
-                with open(history_file, 'w') as f:
-                    json.dump(self._action_history, f, indent=2)
-            except Exception as e:
-                logger.error(f"Error saving action history: {str(e)}")
+        Returns:
+            Lock shared by all users in the same stripe
+        """
+        return self._user_locks[hash(user_id) & (USER_LOCK_STRIPES - 1)]
     
     def _initialize_badges(self) -> None:
         """Initialize the system with default badges."""
+        badges: Dict[str, Badge] = {}
+        
         # Forum badges
-        self._badges["forum_novice"] = Badge(
+        badges["forum_novice"] = Badge(
             id="forum_novice",
             name="Forum Novice",
             description="Created your first forum post",
@@ -166,7 +599,7 @@ class ReputationSystem:
             action_count=1
         )
         
-        self._badges["forum_contributor"] = Badge(
+        badges["forum_contributor"] = Badge(
             id="forum_contributor",
             name="Forum Contributor",
             description="Created 10 forum posts",
@@ -176,7 +609,7 @@ class ReputationSystem:
             action_count=10
         )
         
-        self._badges["forum_expert"] = Badge(
+        badges["forum_expert"] = Badge(
             id="forum_expert",
             name="Forum Expert",
             description="Created 50 forum posts",
@@ -186,7 +619,7 @@ class ReputationSystem:
             action_count=50
         )
         
-        self._badges["helpful_advisor"] = Badge(
+        badges["helpful_advisor"] = Badge(
             id="helpful_advisor",
             name="Helpful Advisor",
             description="Your post was marked as a solution 5 times",
@@ -197,7 +630,7 @@ class ReputationSystem:
         )
         
         # Signal badges
-        self._badges["signal_provider"] = Badge(
+        badges["signal_provider"] = Badge(
             id="signal_provider",
             name="Signal Provider",
             description="Shared your first trading signal",
@@ -207,7 +640,7 @@ class ReputationSystem:
             action_count=1
         )
         
-        self._badges["signal_master"] = Badge(
+        badges["signal_master"] = Badge(
             id="signal_master",
             name="Signal Master",
             description="Shared 20 successful trading signals",
@@ -217,7 +650,7 @@ class ReputationSystem:
             action_count=20
         )
         
-        self._badges["popular_trader"] = Badge(
+        badges["popular_trader"] = Badge(
             id="popular_trader",
             name="Popular Trader",
             description="Your signals were followed 50 times",
@@ -228,7 +661,7 @@ class ReputationSystem:
         )
         
         # Setup badges
-        self._badges["setup_sharer"] = Badge(
+        badges["setup_sharer"] = Badge(
             id="setup_sharer",
             name="Setup Sharer",
             description="Shared your first trading setup",
@@ -238,7 +671,7 @@ class ReputationSystem:
             action_count=1
         )
         
-        self._badges["setup_guru"] = Badge(
+        badges["setup_guru"] = Badge(
             id="setup_guru",
             name="Setup Guru",
             description="Your setups received 100 likes",
@@ -249,7 +682,7 @@ class ReputationSystem:
         )
         
         # Reputation level badges
-        self._badges["bronze_trader"] = Badge(
+        badges["bronze_trader"] = Badge(
             id="bronze_trader",
             name="Bronze Trader",
             description="Reached 100 reputation points",
@@ -258,7 +691,7 @@ class ReputationSystem:
             is_special=True
         )
         
-        self._badges["silver_trader"] = Badge(
+        badges["silver_trader"] = Badge(
             id="silver_trader",
             name="Silver Trader",
             description="Reached 500 reputation points",
@@ -267,7 +700,7 @@ class ReputationSystem:
             is_special=True
         )
         
-        self._badges["gold_trader"] = Badge(
+        badges["gold_trader"] = Badge(
             id="gold_trader",
             name="Gold Trader",
             description="Reached 1000 reputation points",
@@ -276,7 +709,7 @@ class ReputationSystem:
             is_special=True
         )
         
-        self._badges["diamond_trader"] = Badge(
+        badges["diamond_trader"] = Badge(
             id="diamond_trader",
             name="Diamond Trader",
             description="Reached 5000 reputation points",
@@ -285,9 +718,24 @@ class ReputationSystem:
             is_special=True
         )
         
+        # Badges never change after this, so they are published read-only and
+        # read without locking
+        self._badges = MappingProxyType(badges)
+        
+        for badge in badges.values():
+            if badge.is_special:
+                self._special_badges.append(badge)
+            elif badge.action_type:
+                self._badges_by_action.setdefault(badge.action_type, []).append(badge)
+        for action_badges in self._badges_by_action.values():
+            action_badges.sort(key=lambda b: b.action_count)
+        self._special_badges.sort(key=lambda b: b.points_required)
+        self._special_badge_points = [b.points_required for b in self._special_badges]
+        
         logger.info(f"Initialized {len(self._badges)} badges")
     
-    def award_points(self, user_id: str, action_type: str, context: Optional[Dict[str, Any]] = None) -> int:
+    def award_points(self, user_id: str, action_type: Union[str, ActionType],
+                     context: Optional[Dict[str, Any]] = None) -> int:
         """
         Award reputation points to a user for an action.
         
@@ -299,58 +747,111 @@ class ReputationSystem:
         Returns:
             Number of points awarded
         """
-        if not user_id:
-            logger.warning("Cannot award points: no user ID provided")
-            return 0
-            
-        with self._lock:
-            # Initialize user data if not exists
-            if user_id not in self._users:
-                self._users[user_id] = {
-                    "user_id": user_id,
-                    "points": 0,
-                    "level": 1,
-                    "badges": [],
-                    "actions": {}
-                }
-            
-            # Initialize action history if not exists
-            if user_id not in self._action_history:
-                self._action_history[user_id] = []
-            
-            # Determine points to award based on action type
-            points = self._get_points_for_action(action_type)
-            
-            # Update user's points
-            self._users[user_id]["points"] += points
-            
-            # Update action count
-            if action_type not in self._users[user_id]["actions"]:
-                self._users[user_id]["actions"][action_type] = 0
-            self._users[user_id]["actions"][action_type] += 1
-            
-            # Record action in history
-            action_record = {
-                "action_id": str(uuid.uuid4()),
-                "user_id": user_id,
-                "action_type": action_type,
-                "points": points,
-                "timestamp": datetime.now().isoformat(),
-                "context": context or {}
-            }
-            self._action_history[user_id].append(action_record)
-            
-            # Check for new badges
-            self._check_and_award_badges(user_id)
-            
-            # Update user level
-            self._update_user_level(user_id)
-            
-            # Save data
-            self._save_data()
+        return self.award_points_bulk([(user_id, action_type, context)])[0]
+    
+    def award_points_bulk(self, actions: List[Tuple[str, Union[str, ActionType], Optional[Dict[str, Any]]]]) -> List[int]:
+        """
+        Award reputation points for many actions at once.
+        
+        Actions are grouped by user, so badges, level, rank and storage are
+        updated once per user rather than once per action.
+        
+        Args:
+            actions: (user_id, action_type, context) for each action
             
-            logger.info(f"Awarded {points} points to user {user_id} for {action_type}")
-            return points
+        Returns:
+            Number of points awarded for each action, in the same order
+        """
+        awarded = [0] * len(actions)
+        
+        # Positions of each user's actions, in order
+        actions_by_user: Dict[str, List[int]] = {}
+        for i, (user_id, _, _) in enumerate(actions):
+            if not user_id:
+                logger.warning("Cannot award points: no user ID provided")
+                continue
+            actions_by_user.setdefault(user_id, []).append(i)
+        
+        for user_id, positions in actions_by_user.items():
+            with self._user_lock(user_id):
+                # Initialize user data if not exists
+                if user_id not in self._users:
+                    with self._lock:
+                        self._users[user_id] = {
+                            "user_id": user_id,
+                            "points": 0,
+                            "level": 1,
+                            "badges": set(),
+                            "actions": {},
+                            "signal_score": 0,
+                            "forum_score": 0
+                        }
+                        bisect.insort(self._rank_index, (0, user_id))
+                        self._shard_users.setdefault(_user_shard(user_id), []).append(user_id)
+                
+                # Initialize action history if not exists
+                if user_id not in self._action_history:
+                    with self._lock:
+                        self._action_history[user_id] = deque(maxlen=ACTION_HISTORY_LIMIT)
+                
+                user_data = self._users[user_id]
+                user_actions = user_data["actions"]
+                old_points = user_data["points"]
+                
+                records = []
+                for i in positions:
+                    _, action_type, context = actions[i]
+                    action_type = _ACTION_TYPE_VALUES.get(action_type, action_type)
+                    
+                    # Determine points to award based on action type
+                    points = self._get_points_for_action(action_type)
+                    awarded[i] = points
+                    
+                    # Update user's points and action count
+                    user_data["points"] += points
+                    user_actions[action_type] = user_actions.get(action_type, 0) + 1
+                    score = _ACTION_SCORES.get(action_type)
+                    if score is not None:
+                        user_data[score[0]] += score[1]
+                    
+                    # Record action in history
+                    records.append({
+                        "action_id": str(uuid.uuid4()),
+                        "user_id": user_id,
+                        "action_type": action_type,
+                        "points": points,
+                        "timestamp_ns": time.time_ns(),
+                        "context": context or {}
+                    })
+                self._action_history[user_id].extendleft(records)
+                
+                # Check for new badges, once per action type performed
+                for action_type in dict.fromkeys(record["action_type"] for record in records):
+                    self._check_and_award_badges(user_id, action_type)
+                
+                # Update user level
+                self._update_user_level(user_id)
+                
+                with self._lock:
+                    self._update_rank_index(user_id, old_points, user_data["points"])
+                    self._update_category_scores(user_id)
+                    self._append_history(*records)
+                    self._dirty_shards.add(_user_shard(user_id))
+                
+                if len(records) == 1:
+                    logger.info(f"Awarded {records[0]['points']} points to user {user_id} for {records[0]['action_type']}")
+                else:
+                    logger.info(f"Awarded {user_data['points'] - old_points} points to user {user_id} for {len(records)} actions")
+        
+        if actions_by_user:
+            with self._lock:
+                # Points changed, so cached leaderboards are stale
+                self._leaderboard_cache.clear()
+                
+                # Persist the user snapshot shortly, batching with other changes
+                self._schedule_snapshot()
+        
+        return awarded
     
     def _get_points_for_action(self, action_type: str) -> int:
         """
@@ -362,58 +863,38 @@ class ReputationSystem:
         Returns:
             Number of points
         """
-        # Points awarded for different actions
-        points_map = {
-            ActionType.FORUM_POST_CREATE.value: 10,
-            ActionType.FORUM_POST_LIKE.value: 1,
-            ActionType.FORUM_POST_LIKED.value: 5,
-            ActionType.FORUM_SOLUTION.value: 25,
-            
-            ActionType.SIGNAL_CREATE.value: 15,
-            ActionType.SIGNAL_SUCCESS.value: 20,
-            ActionType.SIGNAL_FOLLOWED.value: 5,
-            
-            ActionType.SETUP_SHARE.value: 15,
-            ActionType.SETUP_LIKED.value: 5,
-            
-            ActionType.BACKTEST_SHARE.value: 10,
-            
-            ActionType.DAILY_LOGIN.value: 2,
-            ActionType.PROFILE_COMPLETE.value: 5
-        }
-        
-        return points_map.get(action_type, 0)
+        return _POINTS_MAP.get(action_type, 0)
     
-    def _check_and_award_badges(self, user_id: str) -> None:
+    def _check_and_award_badges(self, user_id: str, action_type: str) -> None:
         """
         Check if user has earned any new badges and award them.
         
+        Only badges the action could have earned are checked: badges for the
+        action type, and special badges within the user's points.
+        
         Args:
             user_id: ID of the user
+            action_type: Type of action just performed
         """
         user_data = self._users[user_id]
         user_points = user_data["points"]
-        user_actions = user_data["actions"]
         user_badges = user_data["badges"]
         
-        # Check each badge
-        for badge_id, badge in self._badges.items():
-            # Skip if user already has this badge
-            if badge_id in user_badges:
-                continue
-                
-            # Check if user meets requirements
-            if badge.is_special:
-                # Special badges are based on total points
-                if user_points >= badge.points_required:
-                    user_badges.append(badge_id)
-                    logger.info(f"Awarded badge {badge.name} to user {user_id}")
-            elif badge.action_type:
-                # Action-based badges require a certain number of actions
-                action_count = user_actions.get(badge.action_type, 0)
-                if action_count >= badge.action_count:
-                    user_badges.append(badge_id)
-                    logger.info(f"Awarded badge {badge.name} to user {user_id}")
+        # Action-based badges require a certain number of actions
+        action_count = user_data["actions"].get(action_type, 0)
+        for badge in self._badges_by_action.get(action_type, ()):
+            if action_count < badge.action_count:
+                break
+            if badge.id not in user_badges:
+                user_badges.add(badge.id)
+                logger.info(f"Awarded badge {badge.name} to user {user_id}")
+        
+        # Special badges are based on total points
+        earned = bisect.bisect_right(self._special_badge_points, user_points)
+        for badge in self._special_badges[:earned]:
+            if badge.id not in user_badges:
+                user_badges.add(badge.id)
+                logger.info(f"Awarded badge {badge.name} to user {user_id}")
     
     def _update_user_level(self, user_id: str) -> None:
         """
@@ -425,27 +906,8 @@ class ReputationSystem:
         user_data = self._users[user_id]
         user_points = user_data["points"]
         
-        # Define point thresholds for each level
-        level_thresholds = [
-            0,      # Level 1: 0+ points
-            100,    # Level 2: 100+ points
-            300,    # Level 3: 300+ points
-            600,    # Level 4: 600+ points
-            1000,   # Level 5: 1000+ points
-            1500,   # Level 6: 1500+ points
-            2100,   # Level 7: 2100+ points
-            3000,   # Level 8: 3000+ points
-            4000,   # Level 9: 4000+ points
-            5500,   # Level 10: 5500+ points
-            7500,   # Level 11: 7500+ points
-            10000   # Level 12: 10000+ points
-        ]
-        
-        # Determine current level
-        current_level = 1
-        for i, threshold in enumerate(level_thresholds):
-            if user_points >= threshold:
-                current_level = i + 1
+        # Current level is the number of thresholds reached
+        current_level = bisect.bisect_right(LEVEL_THRESHOLDS, user_points)
         
         # Update user level if changed
         if current_level != user_data["level"]:
@@ -462,7 +924,7 @@ class ReputationSystem:
         Returns:
             User reputation data including points, level, and badges
         """
-        with self._lock:
+        with self._user_lock(user_id):
             # Return default data if user not found
             if user_id not in self._users:
                 return {
@@ -477,20 +939,20 @@ class ReputationSystem:
             user_data = self._users[user_id]
             
             # Calculate next level points
-            level_thresholds = [0, 100, 300, 600, 1000, 1500, 2100, 3000, 4000, 5500, 7500, 10000]
             current_level = user_data["level"]
             
-            next_level_points = level_thresholds[current_level] if current_level < len(level_thresholds) else None
+            next_level_points = LEVEL_THRESHOLDS[current_level] if current_level < len(LEVEL_THRESHOLDS) else None
             
             # Calculate user's rank
-            rank = self._calculate_user_rank(user_id)
+            with self._lock:
+                rank = self._calculate_user_rank(user_id)
             
             # Return reputation data
             return {
                 "user_id": user_id,
                 "points": user_data["points"],
                 "level": user_data["level"],
-                "badges": user_data["badges"],
+                "badges": sorted(user_data["badges"]),
                 "rank": rank,
                 "next_level_points": next_level_points
             }
@@ -505,19 +967,86 @@ class ReputationSystem:
         Returns:
             User's rank or None if not ranked
         """
-        # Get all users sorted by points
-        users_by_points = sorted(
-            self._users.values(),
-            key=lambda u: u["points"],
-            reverse=True
-        )
+        if user_id not in self._users:
+            return None
         
-        # Find user's position
-        for i, user in enumerate(users_by_points):
-            if user["user_id"] == user_id:
-                return i + 1
-                
-        return None
+        # Rank is the user's position in the rank index, so users with the
+        # same points are ranked by user ID as on the leaderboard
+        user_points = self._users[user_id]["points"]
+        return bisect.bisect_left(self._rank_index, (-user_points, user_id)) + 1
+    
+    def _update_rank_index(self, user_id: str, old_points: int, new_points: int) -> None:
+        """
+        Move a user to their new position in the rank index.
+        
+        Args:
+            user_id: ID of the user
+            old_points: Points the user is currently indexed under
+            new_points: User's new points
+        """
+        if old_points == new_points:
+            return
+        
+        index = self._rank_index
+        i = bisect.bisect_left(index, (-old_points, user_id))
+        if i < len(index) and index[i] == (-old_points, user_id):
+            del index[i]
+        bisect.insort(index, (-new_points, user_id))
+    
+    def _update_category_scores(self, user_id: str) -> None:
+        """
+        Store a user's current leaderboard scores in the category score arrays.
+        
+        Args:
+            user_id: ID of the user
+        """
+        slot = self._user_slots.get(user_id)
+        if slot is None:
+            slot = len(self._user_ids)
+            self._user_ids.append(user_id)
+            self._user_slots[user_id] = slot
+        
+        user_data = self._users[user_id]
+        for category, scores in self._category_scores.items():
+            if slot == len(scores):
+                # Double capacity when full
+                scores = np.concatenate([scores, np.zeros_like(scores)])
+                self._category_scores[category] = scores
+            scores[slot] = user_data[_LEADERBOARD_SCORE_FIELDS[category]]
+    
+    def _top_users(self, category: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get the highest scoring users in a category, best first.
+        
+        Ties are ordered by user ID, as in the reputation leaderboard, so the
+        result doesn't depend on the order users were loaded in.
+        
+        Args:
+            category: Category with a score array
+            limit: Maximum number of users to return
+            
+        Returns:
+            List of user data
+        """
+        user_ids = self._user_ids
+        count = len(user_ids)
+        scores = self._category_scores[category][:count]
+        limit = max(0, min(limit, count))
+        
+        if limit < count:
+            # Everyone above the limit-th best score makes the cut, and the
+            # remaining places go to the lowest user IDs tied at that score
+            threshold = np.partition(scores, count - limit)[count - limit]
+            above = np.flatnonzero(scores > threshold)
+            tied = heapq.nsmallest(limit - len(above),
+                                   (user_ids[slot] for slot in np.flatnonzero(scores == threshold)))
+            top = [(-scores[slot], user_ids[slot]) for slot in above]
+            top.extend((-threshold, user_id) for user_id in tied)
+        else:
+            top = [(-score, user_id) for score, user_id in zip(scores, user_ids)]
+        
+        top.sort()
+        return [self._users[user_id] for _, user_id in top]
     
     def get_user_badges(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -529,13 +1058,13 @@ class ReputationSystem:
         Returns:
             List of badge objects
         """
-        with self._lock:
+        with self._user_lock(user_id):
             # Return empty list if user not found
             if user_id not in self._users:
                 return []
             
             user_data = self._users[user_id]
-            badge_ids = user_data["badges"]
+            badge_ids = sorted(user_data["badges"])
             
             # Convert badge IDs to badge objects
             badges = []
@@ -567,44 +1096,18 @@ class ReputationSystem:
             List of user data sorted by rank
         """
         with self._lock:
-            # Handle different categories
-            if category == "reputation":
-                # Sort by total reputation points
-                sorted_users = sorted(
-                    self._users.values(),
-                    key=lambda u: u["points"],
-                    reverse=True
-                )
-            elif category == "signals":
-                # Sort by signal creation and success
-                sorted_users = sorted(
-                    self._users.values(),
-                    key=lambda u: (
-                        u["actions"].get(ActionType.SIGNAL_SUCCESS.value, 0) * 2 +
-                        u["actions"].get(ActionType.SIGNAL_CREATE.value, 0)
-                    ),
-                    reverse=True
-                )
-            elif category == "forum":
-                # Sort by forum activity
-                sorted_users = sorted(
-                    self._users.values(),
-                    key=lambda u: (
-                        u["actions"].get(ActionType.FORUM_POST_CREATE.value, 0) +
-                        u["actions"].get(ActionType.FORUM_SOLUTION.value, 0) * 3
-                    ),
-                    reverse=True
-                )
-            else:
-                # Default to reputation
-                sorted_users = sorted(
-                    self._users.values(),
-                    key=lambda u: u["points"],
-                    reverse=True
-                )
+            # Reuse a recent leaderboard for the same query
+            cache_key = (category, timeframe, limit)
+            cached = self._leaderboard_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < LEADERBOARD_CACHE_TTL:
+                return [dict(entry) for entry in cached[1]]
             
-            # Limit number of results
-            leaderboard = sorted_users[:limit]
+            # Top users for the category
+            if category in self._category_scores:
+                leaderboard = self._top_users(category, limit)
+            else:
+                # The rank index is already ordered by points
+                leaderboard = [self._users[user_id] for _, user_id in self._rank_index[:limit]]
             
             # Add rank and convert to return format
             result = []
@@ -619,15 +1122,18 @@ class ReputationSystem:
                 
                 # Add category-specific stats
                 if category == "signals":
-                    entry["signal_count"] = user["actions"].get(ActionType.SIGNAL_CREATE.value, 0)
-                    entry["successful_signals"] = user["actions"].get(ActionType.SIGNAL_SUCCESS.value, 0)
+                    entry["signal_count"] = user["actions"].get(_SIGNAL_CREATE, 0)
+                    entry["successful_signals"] = user["actions"].get(_SIGNAL_SUCCESS, 0)
                 elif category == "forum":
-                    entry["post_count"] = user["actions"].get(ActionType.FORUM_POST_CREATE.value, 0)
-                    entry["solutions"] = user["actions"].get(ActionType.FORUM_SOLUTION.value, 0)
+                    entry["post_count"] = user["actions"].get(_FORUM_POST_CREATE, 0)
+                    entry["solutions"] = user["actions"].get(_FORUM_SOLUTION, 0)
                 
                 result.append(entry)
             
-            return result
+            self._leaderboard_cache[cache_key] = (time.monotonic(), result)
+            
+            # Return copies so callers can't modify the cached entries
+            return [dict(entry) for entry in result]
     
     def get_action_history(self, user_id: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -640,21 +1146,14 @@ class ReputationSystem:
         Returns:
             List of recent actions
         """
-        with self._lock:
+        with self._user_lock(user_id):
             # Return empty list if user not found
             if user_id not in self._action_history:
                 return []
             
-            # Get actions and sort by timestamp (newest first)
-            actions = self._action_history[user_id]
-            sorted_actions = sorted(
-                actions,
-                key=lambda a: a["timestamp"],
-                reverse=True
-            )
-            
-            # Limit number of results
-            return sorted_actions[:limit]
+            # History is already ordered newest first
+            return [_with_iso_timestamp(record)
+                    for record in islice(self._action_history[user_id], max(limit, 0))]
     
     def reset_user_reputation(self, user_id: str) -> bool:
         """
@@ -666,40 +1165,75 @@ class ReputationSystem:
         Returns:
             True if successful, False otherwise
         """
-        with self._lock:
+        with self._user_lock(user_id):
             # Check if user exists
             if user_id not in self._users:
                 return False
             
             # Reset user data
+            old_points = self._users[user_id]["points"]
             self._users[user_id] = {
                 "user_id": user_id,
                 "points": 0,
                 "level": 1,
-                "badges": [],
-                "actions": {}
+                "badges": set(),
+                "actions": {},
+                "signal_score": 0,
+                "forum_score": 0
             }
             
             # Clear action history
-            self._action_history[user_id] = []
+            self._action_history[user_id] = deque(maxlen=ACTION_HISTORY_LIMIT)
             
-            # Save data
-            self._save_data()
+            with self._lock:
+                self._update_rank_index(user_id, old_points, 0)
+                self._update_category_scores(user_id)
+                self._append_history({"user_id": user_id, "reset": True})
+                self._dirty_shards.add(_user_shard(user_id))
+                
+                # Points changed, so cached leaderboards are stale
+                self._leaderboard_cache.clear()
+                
+                # Persist the user snapshot shortly, batching with other changes
+                self._schedule_snapshot()
             
             logger.info(f"Reset reputation for user {user_id}")
             return True
 
 
-def get_reputation_system() -> ReputationSystem:
+_reputation_system: Optional[ReputationSystem] = None
+_reputation_system_lock = threading.Lock()
+
+def get_reputation_system(storage_path: Optional[str] = None) -> ReputationSystem:
     """
     Get the global reputation system instance.
     
+    Args:
+        storage_path: Directory for storing reputation data (only used when
+            the instance is first created)
+        
     Returns:
         ReputationSystem instance
+        
+    Raises:
+        ValueError: If storage_path differs from the directory the instance
+            was created with
     """
-    return ReputationSystem()
+    global _reputation_system
+    if _reputation_system is None:
+        with _reputation_system_lock:
+            # Another thread may have created it while we waited
+            if _reputation_system is None:
+                _reputation_system = ReputationSystem(storage_path)
+                return _reputation_system
+    
+    if storage_path is not None and os.path.realpath(storage_path) != _reputation_system._storage_key:
+        raise ValueError(f"Reputation system is already open on {_reputation_system._storage_path}, "
+                         f"not {storage_path}")
+    return _reputation_system
 
-def award_points(user_id: str, action_type: str, context: Optional[Dict[str, Any]] = None) -> int:
+def award_points(user_id: str, action_type: Union[str, ActionType],
+                 context: Optional[Dict[str, Any]] = None) -> int:
     """
     Award reputation points to a user for an action.
     
@@ -714,6 +1248,19 @@ def award_points(user_id: str, action_type: str, context: Optional[Dict[str, Any
     system = get_reputation_system()
     return system.award_points(user_id, action_type, context)
 
+def award_points_bulk(actions: List[Tuple[str, Union[str, ActionType], Optional[Dict[str, Any]]]]) -> List[int]:
+    """
+    Award reputation points for many actions at once.
+    
+    Args:
+        actions: (user_id, action_type, context) for each action
+        
+    Returns:
+        Number of points awarded for each action, in the same order
+    """
+    system = get_reputation_system()
+    return system.award_points_bulk(actions)
+
 def get_user_reputation(user_id: str) -> Dict[str, Any]:
     """
     Get reputation data for a user.
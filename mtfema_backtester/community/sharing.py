@@ -11,13 +11,29 @@ import pandas as pd
 import os
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 import base64
 import hashlib
+import itertools
+
+from .caching import STALE_SECONDS, ttl_cache
+
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Most community setup queries run at once by fetch_many_setups
+MAX_CONCURRENT_QUERIES = 16
+
+# Whether cached reads return their last known result when the API can't be reached
+CACHE_FALLBACK_ENABLED = True
+
 class CommunityConnect:
     """Community connection and sharing functionality."""
     
@@ -89,10 +105,18 @@ class CommunityConnect:
         self.user_id = None
         self.username = None
         self.is_connected = False
+        self._invalidate_cached_reads()
         
         logger.info("Disconnected from MT 9 EMA community")
         return True
     
+    def _invalidate_cached_reads(self) -> None:
+        """Drop this client's cached community reads after it changed their data."""
+        for read in (CommunityConnect.get_community_setups,
+                     CommunityConnect.get_community_performance,
+                     CommunityConnect.get_leaderboard):
+            read.invalidate(self)
+    
     def share_backtest_results(self, backtest_result: Any, description: str = "") -> Dict[str, Any]:
         """
         Share backtest results with the community.
@@ -142,6 +166,7 @@ class CommunityConnect:
                 "url": f"https://mt9ema-community.com/backtests/{str(uuid.uuid4())}"
             }
             
+            self._invalidate_cached_reads()
             logger.info(f"Shared backtest results: {response.get('url')}")
             return response
             
@@ -189,6 +214,7 @@ class CommunityConnect:
                 "url": f"https://mt9ema-community.com/setups/{str(uuid.uuid4())}"
             }
             
+            self._invalidate_cached_reads()
             logger.info(f"Shared trading setup: {response.get('url')}")
             return response
             
@@ -196,11 +222,12 @@ class CommunityConnect:
             logger.error(f"Error sharing trading setup: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    @ttl_cache(policy="short", stale_seconds=STALE_SECONDS, fallback=CACHE_FALLBACK_ENABLED)
     def get_community_setups(self, 
                            symbol: Optional[str] = None, 
                            timeframe: Optional[str] = None,
                            setup_type: Optional[str] = None,
-                           limit: int = 20) -> List[Dict[str, Any]]:
+                           limit: int = 20) -> Optional[List[Dict[str, Any]]]:
         """
         Get setups shared by the community.
         
@@ -211,7 +238,7 @@ class CommunityConnect:
             limit: Maximum number of setups to retrieve
             
         Returns:
-            List of setup dictionaries
+            List of setup dictionaries, or None if the request failed
         """
         if not self.is_connected:
             logger.error("Not connected to community platform")
@@ -241,27 +268,29 @@ class CommunityConnect:
             sample_timeframes = ["5m", "15m", "1h", "4h", "1d"]
             sample_directions = ["buy", "sell"]
             
-            for i in range(limit):
-                sample_symbol = sample_symbols[i % len(sample_symbols)]
-                
+            # Draw all id suffixes in one call rather than one uuid4 per setup
+            id_suffixes = os.urandom(4 * limit).hex()
+            samples = zip(itertools.cycle(sample_symbols),
+                          itertools.cycle(sample_timeframes),
+                          itertools.cycle(sample_directions))
+            now = datetime.now()
+            
+            for i, (sample_symbol, sample_tf, sample_direction) in enumerate(itertools.islice(samples, limit)):
                 # Skip if we're filtering by symbol and it doesn't match
                 if symbol and symbol != sample_symbol:
                     continue
                 
-                sample_tf = sample_timeframes[i % len(sample_timeframes)]
-                
                 # Skip if we're filtering by timeframe and it doesn't match
                 if timeframe and timeframe != sample_tf:
                     continue
                 
-                sample_direction = sample_directions[i % len(sample_directions)]
                 sample_price = 100 + (i * 5)
                 
                 setup = {
-                    "setup_id": f"setup_{i}_{str(uuid.uuid4())[:8]}",
+                    "setup_id": f"setup_{i}_{id_suffixes[i * 8:(i + 1) * 8]}",
                     "user_id": f"user_{i % 10}",
                     "username": f"trader{i % 10}",
-                    "timestamp": (datetime.now().replace(hour=i%24, minute=i%60)).isoformat(),
+                    "timestamp": (now.replace(hour=i%24, minute=i%60)).isoformat(),
                     "symbol": sample_symbol,
                     "timeframe": sample_tf,
                     "setup_type": "MT9EMA",
@@ -283,9 +312,27 @@ class CommunityConnect:
             
         except Exception as e:
             logger.error(f"Error getting community setups: {str(e)}")
+            return None
+    
+    def fetch_many_setups(self, queries: List[Dict[str, Any]]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Run several community setup queries concurrently.
+        
+        Args:
+            queries: Keyword arguments for get_community_setups, one dict per query
+            
+        Returns:
+            Setups for each query, in the same order (None for a query that
+            failed with no cached result to fall back on)
+        """
+        if not queries:
             return []
+        
+        with ThreadPoolExecutor(max_workers=min(len(queries), MAX_CONCURRENT_QUERIES)) as executor:
+            return list(executor.map(lambda query: self.get_community_setups(**query), queries))
     
-    def get_community_performance(self, timeframe: str = "all") -> Dict[str, Any]:
+    @ttl_cache(policy="long", stale_seconds=STALE_SECONDS, fallback=CACHE_FALLBACK_ENABLED)
+    def get_community_performance(self, timeframe: str = "all") -> Optional[Dict[str, Any]]:
         """
         Get community performance statistics.
         
@@ -293,7 +340,8 @@ class CommunityConnect:
             timeframe: Time period for stats ("day", "week", "month", "year", "all")
             
         Returns:
-            Dictionary with community performance statistics
+            Dictionary with community performance statistics, or None if the
+            request failed
         """
         if not self.is_connected:
             logger.error("Not connected to community platform")
@@ -344,7 +392,7 @@ class CommunityConnect:
             
         except Exception as e:
             logger.error(f"Error getting community performance: {str(e)}")
-            return {}
+            return None
     
     def like_setup(self, setup_id: str) -> bool:
         """
@@ -369,6 +417,7 @@ class CommunityConnect:
                 "likes": 42  # New like count
             }
             
+            self._invalidate_cached_reads()
             logger.info(f"Liked setup {setup_id}")
             return response.get("success", False)
             
@@ -376,6 +425,86 @@ class CommunityConnect:
             logger.error(f"Error liking setup: {str(e)}")
             return False
     
+    def batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several API operations in a single request.
+        
+        Args:
+            operations: Operations as {"method", "path", "body"} dictionaries
+            
+        Returns:
+            Response for each operation, in the same order
+        """
+        if not self.is_connected:
+            logger.error("Not connected to community platform")
+            return [{"success": False, "error": "Not connected"} for _ in operations]
+        
+        if not operations:
+            return []
+        
+        try:
+            # In a real implementation, this would be a single API call
+            # to the batch endpoint
+            # Simulate API response
+            responses = [
+                {
+                    "success": True,
+                    "method": operation.get("method", "GET"),
+                    "path": operation.get("path")
+                }
+                for operation in operations
+            ]
+            
+            self._invalidate_cached_reads()
+            logger.info(f"Sent batch of {len(operations)} operations")
+            return responses
+            
+        except Exception as e:
+            logger.error(f"Error sending batch: {str(e)}")
+            return [{"success": False, "error": str(e)} for _ in operations]
+    
+    def like_setups(self, setup_ids: List[str]) -> Dict[str, bool]:
+        """
+        Like several community setups in one batch request.
+        
+        Args:
+            setup_ids: IDs of the setups to like
+            
+        Returns:
+            Whether each like succeeded, by setup ID
+        """
+        operations = [{"method": "POST", "path": f"setups/{setup_id}/like"} for setup_id in setup_ids]
+        responses = self.batch(operations)
+        return {setup_id: response.get("success", False)
+                for setup_id, response in zip(setup_ids, responses)}
+    
+    def comment_on_setups(self, comments: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Comment on several community setups in one batch request.
+        
+        Args:
+            comments: Comment text by setup ID
+            
+        Returns:
+            Response for each comment, in the order given
+        """
+        timestamp = datetime.now().isoformat()
+        operations = [
+            {
+                "method": "POST",
+                "path": f"setups/{setup_id}/comments",
+                "body": {
+                    "user_id": self.user_id,
+                    "username": self.username,
+                    "setup_id": setup_id,
+                    "comment": comment,
+                    "timestamp": timestamp
+                }
+            }
+            for setup_id, comment in comments.items()
+        ]
+        return self.batch(operations)
+    
     def comment_on_setup(self, setup_id: str, comment: str) -> Dict[str, Any]:
         """
         Add a comment to a community setup.
@@ -410,6 +539,7 @@ class CommunityConnect:
                 "comments": 15  # New comment count
             }
             
+            self._invalidate_cached_reads()
             logger.info(f"Added comment to setup {setup_id}")
             return response
             
@@ -428,9 +558,10 @@ class CommunityConnect:
             Base64 encoded image string or URL
         """
         try:
-            # Read image file and encode as base64
+            # Read image file and encode as base64 (SIMD-accelerated when pybase64 is installed)
             with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
+                b64encode = pybase64.b64encode if PYBASE64_AVAILABLE else base64.b64encode
+                encoded_string = b64encode(image_file.read()).decode("ascii")
             
             # In a real implementation, this might upload the image to a server
             # and return a URL instead of the base64 string
@@ -442,7 +573,8 @@ class CommunityConnect:
             logger.error(f"Error uploading screenshot: {str(e)}")
             return ""
     
-    def get_leaderboard(self, timeframe: str = "month", limit: int = 10) -> List[Dict[str, Any]]:
+    @ttl_cache(policy="normal", stale_seconds=STALE_SECONDS, fallback=CACHE_FALLBACK_ENABLED)
+    def get_leaderboard(self, timeframe: str = "month", limit: int = 10) -> Optional[List[Dict[str, Any]]]:
         """
         Get the community leaderboard.
         
@@ -451,7 +583,8 @@ class CommunityConnect:
             limit: Maximum number of users to retrieve
             
         Returns:
-            List of user dictionaries with performance metrics
+            List of user dictionaries with performance metrics, or None if the
+            request failed
         """
         if not self.is_connected:
             logger.error("Not connected to community platform")
@@ -485,4 +618,4 @@ class CommunityConnect:
             
         except Exception as e:
             logger.error(f"Error getting leaderboard: {str(e)}")
-            return []
+            return None
@@ -1,6 +1,7 @@
         try:
-            with open(signals_file, 'r') as f:
-                data = json.load(f)
+            with open(signals_file, 'rb') as f:
+                raw = f.read()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 
                 signals = []
                 for signal_data in data:
@@ -20,9 +21,12 @@
             # Convert signals to dictionaries
             data = [signal.to_dict() for signal in signals]
             
-            # Save to JSON file
-            with open(signals_file, 'w') as f:
-                json.dump(data, f, indent=4)
+            # Save to JSON file (compact; orjson is much faster when installed)
+            with open(signals_file, 'wb') as f:
+                if ORJSON_AVAILABLE:
+                    f.write(orjson.dumps(data))
+                else:
+                    f.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
                 
             # Update cache
             self.signals_cache = signals.copy()
@@ -57,24 +61,25 @@
             sample_timeframes = ["5m", "15m", "1h", "4h", "1d"]
             sample_directions = ["buy", "sell"]
             
-            for i in range(limit):
-                sample_symbol = sample_symbols[i % len(sample_symbols)]
-                
+            # Draw all id suffixes in one call rather than one uuid4 per signal
+            id_suffixes = os.urandom(4 * limit).hex()
+            samples = zip(itertools.cycle(sample_symbols),
+                          itertools.cycle(sample_timeframes),
+                          itertools.cycle(sample_directions))
+            now = datetime.now()
+            
+            for i, (sample_symbol, sample_tf, sample_direction) in enumerate(itertools.islice(samples, limit)):
                 # Skip if we're filtering by symbol and it doesn't match
                 if symbol and symbol != sample_symbol:
                     continue
                 
-                sample_tf = sample_timeframes[i % len(sample_timeframes)]
-                
                 # Skip if we're filtering by timeframe and it doesn't match
                 if timeframe and timeframe != sample_tf:
                     continue
                 
-                sample_direction = sample_directions[i % len(sample_directions)]
                 sample_price = 100 + (i * 5)
                 
                 # Create sample timestamps
-                now = datetime.now()
                 created_at = now - timedelta(hours=i*2)
                 expires_at = created_at + timedelta(hours=24)
                 
@@ -91,7 +96,7 @@
                         profit_pct = 3.5 if result == "win" else -1.2
                 
                 signal_data = {
-                    "signal_id": f"signal_{i}_{str(uuid.uuid4())[:8]}",
+                    "signal_id": f"signal_{i}_{id_suffixes[i * 8:(i + 1) * 8]}",
                     "user_id": f"user_{i % 10}",
                     "username": f"trader{i % 10}",
                     "symbol": sample_symbol,
@@ -120,6 +125,24 @@
             logger.error(f"Error fetching community signals: {str(e)}")
             return []
     
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _user_seed(user_id: str) -> int:
+        """
+        Get a stable number in [0, 100) for a user.
+        
+        CRC32 is enough for a deterministic seed and much cheaper than MD5
+        plus a hex-to-int conversion. Results are cached since the same users
+        are looked up repeatedly.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Seed value
+        """
+        return (zlib.crc32(user_id.encode()) * 100) >> 32
+    
     def get_user_performance(self, user_id: str) -> Dict[str, Any]:
         """
         Get performance statistics for a specific user.
@@ -135,7 +158,7 @@
             # Simulate API response with sample data
             
             # Use user_id to seed random data generator for consistent results
-            seed = int(hashlib.md5(user_id.encode()).hexdigest(), 16) % 100
+            seed = self._user_seed(user_id)
             
             # Use the seed to generate performance metrics
             win_rate = 50 + (seed % 30)  # 50-80%
@@ -168,6 +191,7 @@
             logger.error(f"Error getting user performance: {str(e)}")
             return {}
     
+    @ttl_cache(policy="long", stale_seconds=STALE_SECONDS)
     def get_signal_statistics(self, days: int = 30) -> Dict[str, Any]:
         """
         Get statistics about community signals.
@@ -228,13 +252,17 @@
         """
         try:
             # Convert signals to dictionaries
-            data = [signal.to_dict() for signal in signals]
+            rows = [signal.to_dict() for signal in signals]
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
+            # Columns are every key seen, in first-seen order, as a DataFrame would give
+            fieldnames = list(dict.fromkeys(key for row in rows for key in row))
             
-            # Save to CSV
-            df.to_csv(filepath, index=False)
+            # Write rows directly rather than copying them into a DataFrame
+            with open(filepath, 'w', newline='') as f:
+                if rows:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
+                    writer.writeheader()
+                    writer.writerows(rows)
             
             logger.info(f"Exported {len(signals)} signals to {filepath}")
             return True
@@ -11,15 +11,131 @@ from datetime import datetime
 from pathlib import Path
 import os
 import json
+import copy
 import itertools
 import multiprocessing
+from multiprocessing import shared_memory
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 import random
 import time
 from typing import Dict, List, Any, Callable, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Backtest data installed once per worker process by _init_worker
+_worker_data = None
+_worker_shm = None
+
+
+def _execute_backtest(backtest_func: Callable, params: Dict[str, Any], data) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Run a single backtest and time it.
+    
+    Args:
+        backtest_func: Backtest function (see Optimizer)
+        params: Parameter set to test
+        data: Data to pass to the backtest function
+        
+    Returns:
+        Tuple of (params, metrics)
+    """
+    try:
+        start_time = time.time()
+        
+        # Run backtest
+        metrics, trades_df, equity_curve = backtest_func(params, data)
+        
+        # Add execution time
+        metrics['execution_time'] = time.time() - start_time
+        
+        return params, metrics
+        
+    except Exception as e:
+        logger.error(f"Error running backtest with params {params}: {str(e)}")
+        return params, {'error': str(e)}
+
+
+def _run_backtest_in_worker(backtest_func: Callable, params: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run a backtest in a pool worker against the data installed by _init_worker."""
+    # Each task gets its own writable copy, so changes one backtest makes to
+    # the data never leak into the worker's later tasks. The copy must be
+    # deep: without copy-on-write (pandas < 3) a shallow copy shares the
+    # read-only shared memory columns and in-place writes would fail.
+    if isinstance(_worker_data, pd.DataFrame):
+        data = _worker_data.copy(deep=True)
+    else:
+        data = copy.deepcopy(_worker_data)
+    return _execute_backtest(backtest_func, params, data)
+
+
+def _is_shareable_frame(data) -> bool:
+    """Check whether data is a DataFrame of plain numeric columns."""
+    return (isinstance(data, pd.DataFrame) and len(data.columns) > 0 and
+            all(isinstance(dtype, np.dtype) and dtype.kind in 'biuf' for dtype in data.dtypes))
+
+
+def _share_frame(df: pd.DataFrame) -> Tuple[shared_memory.SharedMemory, Tuple]:
+    """
+    Copy the columns of a numeric DataFrame into one shared memory block.
+    
+    Args:
+        df: DataFrame with numeric columns
+        
+    Returns:
+        Tuple of (shared memory block, layout spec for _attach_frame)
+    """
+    arrays = [np.ascontiguousarray(df.iloc[:, i].to_numpy()) for i in range(len(df.columns))]
+    
+    # Lay the columns out back to back, each aligned to 8 bytes
+    offsets = []
+    size = 0
+    for arr in arrays:
+        offsets.append(size)
+        size += -(-arr.nbytes // 8) * 8
+    
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for arr, offset in zip(arrays, offsets):
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf, offset=offset)[:] = arr
+    
+    layout = [(arr.dtype.str, offset) for arr, offset in zip(arrays, offsets)]
+    return shm, (shm.name, len(df), df.index, df.columns, layout)
+
+
+def _attach_frame(spec: Tuple) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+    """
+    Rebuild a read-only DataFrame over a block created by _share_frame.
+    
+    Args:
+        spec: Layout spec returned by _share_frame
+        
+    Returns:
+        Tuple of (shared memory block, DataFrame viewing it)
+    """
+    name, n_rows, index, columns, layout = spec
+    shm = shared_memory.SharedMemory(name=name)
+    
+    arrays = []
+    for dtype, offset in layout:
+        arr = np.ndarray((n_rows,), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        arr.flags.writeable = False
+        arrays.append(arr)
+    
+    df = pd.DataFrame(dict(enumerate(arrays)), index=index, copy=False)
+    df.columns = columns
+    return shm, df
+
+
+def _init_worker(data, shm_spec) -> None:
+    """Install the backtest data in a pool worker, attaching shared memory if used."""
+    global _worker_data, _worker_shm
+    
+    if shm_spec is not None:
+        _worker_shm, _worker_data = _attach_frame(shm_spec)
+    else:
+        _worker_data = data
+
+
 class Optimizer:
     """
     Parameter optimization for trading strategies using various techniques.
@@ -89,21 +205,37 @@ class Optimizer:
         Returns:
             Tuple of (params, metrics)
         """
+        return _execute_backtest(self.backtest_func, params, self.data)
+    
+    @contextmanager
+    def _worker_pool(self):
+        """
+        Create a process pool with the backtest data loaded once per worker.
+        
+        Numeric DataFrames are placed in shared memory so workers read the
+        parent's copy instead of receiving a pickled copy; other data is sent
+        once to each worker at startup rather than with every task.
+        
+        Yields:
+            ProcessPoolExecutor whose tasks should use _run_backtest_in_worker
+        """
+        shm = None
+        shm_spec = None
+        data = self.data
+        
+        if _is_shareable_frame(self.data):
+            shm, shm_spec = _share_frame(self.data)
+            data = None
+        
         try:
-            start_time = time.time()
-            
-            # Run backtest
-            metrics, trades_df, equity_curve = self.backtest_func(params, self.data)
-            
-            # Add execution time
-            metrics['execution_time'] = time.time() - start_time
-            
-            return params, metrics
-            
-        except Exception as e:
-            logger.error(f"Error running backtest with params {params}: {str(e)}")
-            return params, {'error': str(e)}
-            
+            with ProcessPoolExecutor(max_workers=self.n_jobs, initializer=_init_worker,
+                                     initargs=(data, shm_spec)) as executor:
+                yield executor
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+    
     def run_grid_search(self, save_results: bool = True) -> Dict[str, Any]:
         """
         Run a grid search over all parameter combinations.
@@ -131,8 +263,9 @@ class Optimizer:
         completed = 0
         self.results = []
         
-        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
-            futures = {executor.submit(self.run_backtest, params): params for params in param_combinations}
+        with self._worker_pool() as executor:
+            futures = {executor.submit(_run_backtest_in_worker, self.backtest_func, params): params
+                       for params in param_combinations}
             
             for future in as_completed(futures):
                 completed += 1
@@ -208,8 +341,9 @@ class Optimizer:
         completed = 0
         self.results = []
         
-        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
-            futures = {executor.submit(self.run_backtest, params): params for params in param_combinations}
+        with self._worker_pool() as executor:
+            futures = {executor.submit(_run_backtest_in_worker, self.backtest_func, params): params
+                       for params in param_combinations}
             
             for future in as_completed(futures):
                 completed += 1
@@ -0,0 +1,162 @@
+"""
+Unit tests for the community API result cache.
+"""
+
+import gc
+import time
+import weakref
+
+import pytest
+from mtfema_backtester.community.caching import ttl_cache
+
+
+class FakeApi:
+    """Stand-in for a community API read returning queued responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestTtlCache:
+    """Test suite for the ttl_cache decorator."""
+
+    def test_results_are_reused_until_expired(self):
+        """Test that a cached result is served without calling the function again."""
+        api = FakeApi([1], [2])
+        cached = ttl_cache(seconds=60)(api)
+
+        assert cached("ES") == [1]
+        assert cached("ES") == [1]
+        assert api.calls == 1
+
+        cached.invalidate()
+        assert cached("ES") == [2]
+
+    def test_expired_results_are_refetched(self):
+        """Test that an expired result is fetched again."""
+        api = FakeApi([1], [2])
+        cached = ttl_cache(seconds=0.01)(api)
+
+        assert cached() == [1]
+        time.sleep(0.02)
+        assert cached() == [2]
+
+    def test_callers_cannot_change_the_cached_collection(self):
+        """Test that adding to or removing from a returned result leaves the cached one intact."""
+        api = FakeApi({"top": [{"symbol": "ES"}]}, [1, 2])
+        cached = ttl_cache(seconds=60)(api)
+
+        first = cached("performance")
+        first["top"] = []
+        first["extra"] = True
+        assert cached("performance") == {"top": [{"symbol": "ES"}]}
+
+        cached("leaderboard").clear()
+        assert cached("leaderboard") == [1, 2]
+
+    def test_fallback_on_exception(self):
+        """Test that a failed call returns the last cached result."""
+        api = FakeApi([1], ConnectionError("down"))
+        cached = ttl_cache(seconds=0.01, fallback=True)(api)
+
+        assert cached() == [1]
+        time.sleep(0.02)
+        assert cached() == [1]
+        assert cached.fetched_at() is not None
+
+    def test_exception_without_cached_result_is_raised(self):
+        """Test that a failure with nothing to fall back on still raises."""
+        cached = ttl_cache(seconds=60, fallback=True)(FakeApi(ConnectionError("down")))
+
+        with pytest.raises(ConnectionError):
+            cached()
+
+    def test_fallback_on_none(self):
+        """Test that a None result returns the last cached result."""
+        api = FakeApi([1], None)
+        cached = ttl_cache(seconds=0.01, fallback=True)(api)
+
+        assert cached() == [1]
+        time.sleep(0.02)
+        assert cached() == [1]
+
+    def test_empty_result_is_not_replaced_by_stale_data(self):
+        """Test that a genuinely empty response is returned, not the old result."""
+        api = FakeApi([1], [])
+        cached = ttl_cache(seconds=0.01, fallback=True)(api)
+
+        assert cached() == [1]
+        time.sleep(0.02)
+        assert cached() == []
+
+    def test_stale_result_is_served_while_refreshing(self):
+        """Test that an expired result is returned while a new one is fetched."""
+        api = FakeApi([1], [2])
+        cached = ttl_cache(seconds=0.01, stale_seconds=60)(api)
+
+        assert cached() == [1]
+        time.sleep(0.02)
+        assert cached() == [1]
+
+        deadline = time.monotonic() + 5
+        while cached() != [2] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cached() == [2]
+
+
+class Client:
+    """Stand-in for a community client with a cached method."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    @ttl_cache(seconds=60)
+    def get_leaderboard(self, limit=10):
+        self.calls += 1
+        return [self.name] * limit
+
+
+class TestTtlCacheMethods:
+    """Test suite for ttl_cache on methods."""
+
+    def test_each_instance_has_its_own_cache(self):
+        """Test that instances don't see each other's results."""
+        first, second = Client("a"), Client("b")
+
+        assert first.get_leaderboard(2) == ["a", "a"]
+        assert second.get_leaderboard(2) == ["b", "b"]
+        assert first.get_leaderboard(2) == ["a", "a"]
+        assert first.calls == 1
+
+    def test_invalidate_one_instance(self):
+        """Test that invalidating an instance leaves other instances cached."""
+        first, second = Client("a"), Client("b")
+        first.get_leaderboard()
+        second.get_leaderboard()
+
+        Client.get_leaderboard.invalidate(first)
+        first.get_leaderboard()
+        second.get_leaderboard()
+
+        assert (first.calls, second.calls) == (2, 1)
+
+    def test_cache_does_not_keep_instances_alive(self):
+        """Test that an instance with cached results can still be garbage collected."""
+        client = Client("a")
+        client.get_leaderboard()
+
+        collected = []
+        weakref.finalize(client, collected.append, True)
+        del client
+        gc.collect()
+
+        assert collected == [True]
@@ -0,0 +1,161 @@
+"""
+Unit tests for community sharing.
+"""
+
+import base64
+import time
+from types import SimpleNamespace
+
+import pytest
+from mtfema_backtester.community import caching, sharing
+from mtfema_backtester.community.sharing import CommunityConnect
+
+
+@pytest.fixture
+def community():
+    """Create a client connected to the (simulated) community platform."""
+    client = CommunityConnect()
+    assert client.connect("trader", "secret")
+    return client
+
+
+class TestCommunitySetups:
+    """Test suite for reading community setups."""
+
+    def test_setup_ids_are_unique(self, community):
+        """Test that every sample setup gets its own ID."""
+        setups = community.get_community_setups(limit=500)
+        assert len(setups) == 500
+        assert len({setup["setup_id"] for setup in setups}) == 500
+
+    def test_filters(self, community):
+        """Test filtering setups by symbol and timeframe."""
+        setups = community.get_community_setups(symbol="ES", timeframe="5m", limit=100)
+        assert setups
+        assert all(setup["symbol"] == "ES" and setup["timeframe"] == "5m" for setup in setups)
+
+    def test_fetch_many_keeps_query_order(self, community):
+        """Test that concurrent queries return results in the order asked."""
+        results = community.fetch_many_setups([{"symbol": "NQ", "limit": 50},
+                                               {"symbol": "CL", "limit": 50},
+                                               {"limit": 3}])
+        assert {setup["symbol"] for setup in results[0]} == {"NQ"}
+        assert {setup["symbol"] for setup in results[1]} == {"CL"}
+        assert len(results[2]) == 3
+        assert community.fetch_many_setups([]) == []
+
+    def test_disconnected_reads_are_empty(self):
+        """Test that a client that isn't connected gets empty results."""
+        client = CommunityConnect()
+        assert client.get_community_setups() == []
+        assert client.get_community_performance("week") == {}
+
+        # Empty results aren't cached, so connecting makes the data available
+        client.connect("trader", "secret")
+        assert client.get_community_performance("week")["timeframe"] == "week"
+
+
+class TestCachedReads:
+    """Test suite for falling back to cached reads when the API fails."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the cache's monotonic clock with one the test moves forward."""
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(caching, "time", SimpleNamespace(monotonic=lambda: clock.now, time=time.time))
+        return clock
+
+    def test_failed_reads_fall_back_to_cached_results(self, community, clock, monkeypatch):
+        """Test that reads failing after the cache expired return the last result."""
+        leaderboard = community.get_leaderboard("month", limit=3)
+        performance = community.get_community_performance("week")
+        setups = community.get_community_setups(symbol="ES", limit=5)
+
+        def fail(*args, **kwargs):
+            raise ConnectionError("down")
+        monkeypatch.setattr(sharing.logger, "info", fail)
+        clock.now += 3600
+
+        assert community.get_leaderboard("month", limit=3) == leaderboard
+        assert community.get_community_performance("week") == performance
+        assert community.get_community_setups(symbol="ES", limit=5) == setups
+
+    def test_failed_read_without_cached_result(self, community, monkeypatch):
+        """Test that a failed read with nothing cached returns None."""
+        def fail(*args, **kwargs):
+            raise ConnectionError("down")
+        monkeypatch.setattr(sharing.logger, "info", fail)
+
+        assert community.get_leaderboard("year", limit=2) is None
+
+
+class TestCacheInvalidation:
+    """Test suite for dropping cached reads after the client changes their data."""
+
+    def test_disconnect_hides_cached_reads(self, community):
+        """Test that a disconnected client no longer gets the cached leaderboard."""
+        assert community.get_leaderboard()
+        community.disconnect()
+        assert community.get_leaderboard() == []
+
+    def test_actions_refetch_cached_reads(self, community):
+        """Test that sharing, liking and commenting make the next read fetch again."""
+        setups = community.get_community_setups(limit=5)
+        for action in (lambda: community.share_trading_setup({"symbol": "ES"}),
+                       lambda: community.like_setup("s1"),
+                       lambda: community.like_setups(["s1"]),
+                       lambda: community.comment_on_setup("s1", "Nice")):
+            action()
+            refetched = community.get_community_setups(limit=5)
+            assert refetched is not setups and refetched[0] is not setups[0]
+            setups = refetched
+
+    def test_clients_have_separate_caches(self, community):
+        """Test that one client's cached reads aren't served to another."""
+        assert community.get_community_performance("week")
+        assert CommunityConnect().get_community_performance("week") == {}
+
+
+class TestBatchOperations:
+    """Test suite for batched likes and comments."""
+
+    def test_like_setups(self, community):
+        """Test that each setup's like result is reported."""
+        assert community.like_setups(["s1", "s2"]) == {"s1": True, "s2": True}
+
+    def test_comment_on_setups(self, community):
+        """Test that one response is returned per comment, in order."""
+        responses = community.comment_on_setups({"s1": "Nice", "s2": "Agreed"})
+        assert [response["path"] for response in responses] == ["setups/s1/comments", "setups/s2/comments"]
+
+    def test_disconnected_batch_fails_each_operation(self):
+        """Test that a client that isn't connected fails every operation."""
+        assert CommunityConnect().like_setups(["s1", "s2"]) == {"s1": False, "s2": False}
+        assert CommunityConnect().batch([]) == []
+
+
+class TestScreenshots:
+    """Test suite for screenshot uploads."""
+
+    def test_upload_encodes_image(self, community, tmp_path):
+        """Test that the image is returned base64 encoded."""
+        image_path = tmp_path / "chart.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)))
+
+        assert base64.b64decode(community.upload_screenshot(str(image_path))) == image_path.read_bytes()
+
+    def test_missing_image(self, community, tmp_path):
+        """Test that a missing file gives an empty string."""
+        assert community.upload_screenshot(str(tmp_path / "missing.png")) == ""
+
+
+class TestPackageImports:
+    """Test suite for the community package's lazy imports."""
+
+    def test_lazy_import(self):
+        """Test that component classes are importable from the package."""
+        import mtfema_backtester.community as community
+
+        assert community.CommunityConnect is CommunityConnect
+        with pytest.raises(AttributeError):
+            community.NotAComponent
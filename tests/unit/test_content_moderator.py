@@ -0,0 +1,257 @@
+"""
+Unit tests for the content moderation system.
+"""
+
+import gc
+import threading
+
+import pytest
+from mtfema_backtester.community.feature_flags import get_feature_flags
+from mtfema_backtester.community.moderation.content_moderator import (
+    ContentModerator, ContentType, ModerationType, ModeratorRole
+)
+
+
+@pytest.fixture
+def moderator():
+    """Create a content moderator with the default configuration."""
+    moderator = ContentModerator()
+    yield moderator
+    moderator.close()
+
+
+@pytest.fixture
+def moderation_enabled():
+    """Turn on the content_moderation feature flag for the duration of a test."""
+    flags = get_feature_flags()
+    previous = flags.is_enabled("content_moderation")
+    flags.set_flag("content_moderation", True)
+    yield
+    flags.set_flag("content_moderation", previous)
+
+
+class TestModerationRules:
+    """Test suite for the rule-based moderation checks."""
+
+    def test_clean_content_is_approved(self, moderator):
+        """Test that content without problems is approved."""
+        result = moderator._apply_moderation_rules("The 9 EMA held as support today",
+                                                   {"content_type": ContentType.FORUM_POST.value,
+                                                    "title": "EMA support"})
+        assert result == (True, "Content approved", 0.85)
+
+    def test_forbidden_word_outranks_short_title(self, moderator):
+        """Test that a forbidden word is still rejected outright when the title is also too short."""
+        result = moderator._apply_moderation_rules("This is spam",
+                                                   {"content_type": ContentType.FORUM_POST.value,
+                                                    "title": "Hi"})
+        assert result == (False, "Forbidden word: spam", 0.95)
+
+    def test_forbidden_word_outranks_earlier_pattern(self, moderator):
+        """Test that a forbidden word is reported even when a pattern matches earlier in the content."""
+        assert moderator._apply_moderation_rules("buy now, this is a scam offer", {}) == \
+            (False, "Forbidden word: scam", 0.95)
+        assert moderator._apply_moderation_rules("buy now before it is gone", {}) == \
+            (False, "Matched forbidden pattern #3", 0.9)
+
+    def test_short_title_applies_to_clean_content(self, moderator):
+        """Test that the title check rejects otherwise clean forum posts."""
+        result = moderator._apply_moderation_rules("The 9 EMA held as support today",
+                                                   {"content_type": ContentType.FORUM_POST.value,
+                                                    "title": "Hi"})
+        assert result == (False, "Forum post title too short", 0.85)
+
+    def test_confident_metadata_rejection(self, moderator):
+        """Test that a signal without a symbol is rejected."""
+        is_approved, _, confidence = moderator._apply_moderation_rules(
+            "Long above the 9 EMA", {"content_type": ContentType.SIGNAL.value})
+        assert not is_approved
+        assert confidence >= moderator.config["rejection_threshold"]
+
+
+class TestContentIds:
+    """Test suite for content ID generation."""
+
+    def test_same_content_gets_same_id(self, moderator):
+        """Test that IDs are stable and ignore metadata key order."""
+        first = moderator._generate_content_id("post", {"a": 1, "b": 2})
+        second = moderator._generate_content_id("post", {"b": 2, "a": 1})
+        assert first == second
+        assert len(first) == 16
+
+    def test_different_metadata_gets_different_id(self, moderator):
+        """Test that metadata is part of the ID."""
+        assert (moderator._generate_content_id("post", {"a": 1}) !=
+                moderator._generate_content_id("post", {"a": 2}))
+
+    @pytest.mark.parametrize("metadata", [{1: "a"}, {"size": 2 ** 70}])
+    def test_metadata_json_accepts(self, moderator, metadata):
+        """Test that metadata json.dumps accepts doesn't break moderation."""
+        assert len(moderator._generate_content_id("post", metadata)) == 16
+
+
+class TestFeatureFlag:
+    """Test suite for the content_moderation feature flag."""
+
+    def test_flag_is_read_from_published_state(self, moderator, moderation_enabled):
+        """Test that switching the flag off takes effect immediately."""
+        assert moderator.moderate_content("This is spam", {}, ContentType.FORUM_COMMENT, "user1")[0] is False
+
+        get_feature_flags().set_flag("content_moderation", False)
+        result = moderator.moderate_content("This is spam", {}, ContentType.FORUM_COMMENT, "user1")
+        assert result == (True, "Content moderation disabled", 1.0)
+
+
+class TestModerationQueue:
+    """Test suite for the manual moderation queue."""
+
+    # Clean content with a short title is held for review at 0.85 confidence
+    HELD_METADATA = {"content_type": ContentType.FORUM_POST.value, "title": "Hi"}
+
+    def queue_post(self, moderator, text):
+        """Submit a forum post that is held for manual review and return its content ID."""
+        result = moderator.moderate_content(text, self.HELD_METADATA, ContentType.FORUM_POST, "user1")
+        assert result[1] == "Queued for manual review"
+        return moderator._generate_content_id(text, self.HELD_METADATA)
+
+    def test_queued_content_can_be_moderated(self, moderator, moderation_enabled):
+        """Test that a queued item can be fetched and then moderated."""
+        content_id = self.queue_post(moderator, "The 9 EMA held as support")
+
+        queue = moderator.get_moderation_queue(ModeratorRole.MODERATOR)
+        assert [item["content_id"] for item in queue] == [content_id]
+        assert "timestamp" in queue[0]
+        assert moderator.get_content(content_id) == "The 9 EMA held as support"
+
+        assert moderator.manual_moderate(content_id, ModerationType.APPROVED, "mod1", ModeratorRole.MODERATOR)
+        assert moderator.get_moderation_queue(ModeratorRole.MODERATOR) == []
+        assert moderator.get_content(content_id) is None
+
+    def test_duplicate_submission_is_queued_once(self, moderator, moderation_enabled):
+        """Test that resubmitting queued content doesn't leave a stuck duplicate."""
+        content_id = self.queue_post(moderator, "The 9 EMA held as support")
+        self.queue_post(moderator, "The 9 EMA held as support")
+
+        assert len(moderator.get_moderation_queue(ModeratorRole.MODERATOR)) == 1
+        assert moderator.manual_moderate(content_id, ModerationType.APPROVED, "mod1", ModeratorRole.MODERATOR)
+        assert moderator.get_moderation_queue(ModeratorRole.MODERATOR) == []
+        assert not moderator.manual_moderate(content_id, ModerationType.APPROVED, "mod1", ModeratorRole.MODERATOR)
+
+    def test_full_queue_drops_oldest(self, moderator, moderation_enabled):
+        """Test that the oldest item is dropped when the queue is full."""
+        moderator.config["moderation_queue_limit"] = 2
+        first = self.queue_post(moderator, "First post about the 9 EMA")
+        second = self.queue_post(moderator, "Second post about the 9 EMA")
+        third = self.queue_post(moderator, "Third post about the 9 EMA")
+
+        queue = moderator.get_moderation_queue(ModeratorRole.MODERATOR)
+        assert [item["content_id"] for item in queue] == [second, third]
+        assert moderator.get_content(first) is None
+
+    def test_queue_filters_by_content_type(self, moderator, moderation_enabled):
+        """Test filtering the queue by content type."""
+        self.queue_post(moderator, "The 9 EMA held as support")
+
+        assert moderator.get_moderation_queue(ModeratorRole.MODERATOR, [ContentType.SIGNAL]) == []
+        assert len(moderator.get_moderation_queue(ModeratorRole.MODERATOR, [ContentType.FORUM_POST])) == 1
+
+
+class TestModerationLog:
+    """Test suite for the background moderation log."""
+
+    def test_history_records_actions(self, moderator, moderation_enabled):
+        """Test that moderation actions show up in the history."""
+        moderator.moderate_content("This is spam", {}, ContentType.FORUM_COMMENT, "user1")
+
+        history = moderator.get_moderation_history(user_id="user1")
+        assert [item["action"] for item in history] == [ModerationType.REJECTED.value]
+        assert history[0]["reason"] == "Forbidden word: spam"
+
+    def test_close_stops_log_thread(self, moderation_enabled):
+        """Test that close() records pending actions and stops the thread."""
+        moderator = ContentModerator()
+        moderator.moderate_content("This is spam", {}, ContentType.FORUM_COMMENT, "user1")
+        moderator.close()
+
+        assert not moderator._log_thread.is_alive()
+        assert len(moderator.get_moderation_history(user_id="user1")) == 1
+
+        # Actions after closing are still recorded
+        moderator.moderate_content("This is a scam", {}, ContentType.FORUM_COMMENT, "user1")
+        assert len(moderator.get_moderation_history(user_id="user1")) == 2
+
+    def test_unreferenced_moderator_stops_log_thread(self):
+        """Test that a moderator that is never closed doesn't leak its thread."""
+        moderator = ContentModerator()
+        log_thread = moderator._log_thread
+        del moderator
+        gc.collect()
+
+        log_thread.join(timeout=5)
+        assert not log_thread.is_alive()
+        assert log_thread not in threading.enumerate()
+
+
+class TestModerationHistory:
+    """Test suite for querying the moderation history."""
+
+    @pytest.fixture
+    def history(self, moderator):
+        """Moderator with manual actions by two moderators on three pieces of content."""
+        for content_id, moderator_id, action in (("c1", "mod1", ModerationType.APPROVED),
+                                                 ("c2", "mod1", ModerationType.REJECTED),
+                                                 ("c1", "mod2", ModerationType.REJECTED),
+                                                 ("c3", "mod2", ModerationType.APPROVED)):
+            moderator.manual_moderate(content_id, action, moderator_id, ModeratorRole.MODERATOR,
+                                      reason=f"{moderator_id} {content_id}")
+        return moderator
+
+    def test_newest_first(self, history):
+        """Test that history is returned newest first with ISO timestamps."""
+        items = history.get_moderation_history()
+        assert [item["reason"] for item in items] == ["mod2 c3", "mod2 c1", "mod1 c2", "mod1 c1"]
+        assert all("timestamp" in item for item in items)
+
+    @pytest.mark.parametrize("filters, reasons", [
+        ({"content_id": "c1"}, ["mod2 c1", "mod1 c1"]),
+        ({"moderator_id": "mod1"}, ["mod1 c2", "mod1 c1"]),
+        ({"action": ModerationType.REJECTED}, ["mod2 c1", "mod1 c2"]),
+        ({"content_id": "c1", "moderator_id": "mod1"}, ["mod1 c1"]),
+        ({"content_id": "c1", "action": ModerationType.APPROVED}, ["mod1 c1"]),
+        ({"content_id": "unknown"}, [])
+    ])
+    def test_filters(self, history, filters, reasons):
+        """Test filtering by content, moderator and action, alone and combined."""
+        assert [item["reason"] for item in history.get_moderation_history(**filters)] == reasons
+
+    def test_pagination(self, history):
+        """Test limit and offset."""
+        assert [item["reason"] for item in history.get_moderation_history(limit=2, offset=1)] == [
+            "mod2 c1", "mod1 c2"]
+        assert history.get_moderation_history(limit=0) == []
+        assert history.get_moderation_history(offset=10) == []
+
+    def test_oldest_entries_are_dropped_at_the_limit(self, tmp_path):
+        """Test that the history and its indexes stay within the configured limit."""
+        config_path = tmp_path / "moderation.json"
+        config_path.write_text('{"moderation_history_limit": 2}')
+        moderator = ContentModerator(str(config_path))
+        try:
+            for content_id in ("c1", "c2", "c3"):
+                moderator.manual_moderate(content_id, ModerationType.APPROVED, "mod1", ModeratorRole.MODERATOR)
+
+            assert [item["content_id"] for item in moderator.get_moderation_history()] == ["c3", "c2"]
+            assert moderator.get_moderation_history(content_id="c1") == []
+            assert len(moderator.get_moderation_history(moderator_id="mod1")) == 2
+            assert "c1" not in moderator._history_by_content
+        finally:
+            moderator.close()
+
+    def test_reports_flag_content_at_threshold(self, moderator):
+        """Test that content is flagged once it gets enough user reports."""
+        results = [moderator.report_content("c1", ContentType.FORUM_POST, f"user{i}", "Off topic")
+                   for i in range(3)]
+        assert results == [False, False, True]
+
+        flagged = moderator.get_moderation_history(content_id="c1", action=ModerationType.FLAGGED)
+        assert [item["reason"] for item in flagged] == ["Received 3 user reports"]
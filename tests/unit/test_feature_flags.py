@@ -0,0 +1,82 @@
+"""
+Unit tests for the community feature flags.
+"""
+
+import threading
+
+import pytest
+from mtfema_backtester.community.feature_flags import get_feature_flags
+
+
+@pytest.fixture
+def flags():
+    """Get the global feature flags, restoring changed flags after the test."""
+    feature_flags = get_feature_flags()
+    saved_flags = dict(feature_flags.flags)
+    saved_overrides = {user_id: dict(overrides) for user_id, overrides in feature_flags.user_overrides.items()}
+    yield feature_flags
+    with feature_flags._lock:
+        feature_flags.flags = saved_flags
+        feature_flags.user_overrides = saved_overrides
+        feature_flags._publish()
+
+
+class TestFeatureFlags:
+    """Test suite for the FeatureFlags class."""
+
+    def test_set_flag(self, flags):
+        """Test that a set flag is visible to is_enabled and snapshot."""
+        flags.set_flag("unit_test_feature", True)
+        assert flags.is_enabled("unit_test_feature")
+        assert flags.snapshot(["unit_test_feature", "unit_test_unknown"]) == {
+            "unit_test_feature": True, "unit_test_unknown": False}
+
+        flags.set_flag("unit_test_feature", False)
+        assert not flags.is_enabled("unit_test_feature")
+
+    def test_user_override(self, flags):
+        """Test that a user override wins over the global flag."""
+        flags.set_flag("unit_test_feature", False)
+        flags.set_user_flag("user1", "unit_test_feature", True)
+
+        assert flags.is_enabled("unit_test_feature", "user1")
+        assert not flags.is_enabled("unit_test_feature", "user2")
+        assert flags.snapshot(["unit_test_feature"], "user1") == {"unit_test_feature": True}
+
+    def test_usage_counts_are_exact_under_concurrent_flushes(self, flags):
+        """Test that flushing from several threads never double counts or loses checks."""
+        before = flags.get_flag_usage()["unit_test_usage"]
+        checks_per_thread = 3000
+        done = threading.Event()
+
+        def check_flags():
+            for _ in range(checks_per_thread):
+                flags.is_enabled("unit_test_usage")
+
+        def read_usage():
+            while not done.is_set():
+                flags.get_flag_usage()
+
+        readers = [threading.Thread(target=read_usage) for _ in range(2)]
+        checkers = [threading.Thread(target=check_flags) for _ in range(4)]
+        for thread in readers + checkers:
+            thread.start()
+        for thread in checkers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        assert flags.get_flag_usage()["unit_test_usage"] - before == 4 * checks_per_thread
+
+    def test_usage_buffers_of_finished_threads_are_dropped(self, flags):
+        """Test that finished threads' buffers are folded in and released."""
+        before = flags.get_flag_usage()["unit_test_usage"]
+        threads = [threading.Thread(target=flags.is_enabled, args=("unit_test_usage",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+            thread.join()
+
+        assert flags.get_flag_usage()["unit_test_usage"] - before == 5
+        registered = [thread for thread, _ in flags._usage_buffers]
+        assert not any(thread in registered for thread in threads)
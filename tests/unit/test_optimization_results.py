@@ -0,0 +1,131 @@
+"""
+Unit tests for the strategy parameter optimizer and its result analysis.
+"""
+
+import pandas as pd
+import pytest
+from mtfema_backtester import backtester
+from mtfema_backtester.backtester import OptimizationResults
+
+
+def make_results(rows):
+    """Build optimizer result dictionaries from (params, target_value) pairs."""
+    return [{'params': params, 'target_value': target} for params, target in rows]
+
+
+class TestOptimizationResults:
+    """Test suite for the OptimizationResults class."""
+
+    def test_best_parameters(self):
+        """Test that the best result is the one with the highest target value."""
+        results = OptimizationResults(make_results([
+            ({'a': 1}, 1.0),
+            ({'a': 2}, 3.0),
+            ({'a': 3}, 2.0)
+        ]), 'sharpe_ratio')
+
+        assert results.get_best_parameters() == {'a': 2}
+        assert [r['target_value'] for r in results.top_results] == [3.0, 2.0, 1.0]
+
+    def test_parameter_importance(self):
+        """Test that importance is the normalized spread of average target values."""
+        results = OptimizationResults(make_results([
+            ({'a': 1, 'b': 1}, 1.0),
+            ({'a': 1, 'b': 2}, 2.0),
+            ({'a': 2, 'b': 1}, 3.0),
+            ({'a': 2, 'b': 2}, 4.0)
+        ]), 'sharpe_ratio')
+
+        assert results._calculate_parameter_importance() == {'a': 1.0, 'b': 0.5}
+
+    def test_parameter_importance_keeps_none_values(self):
+        """Test that a None parameter value counts as its own group."""
+        results = OptimizationResults(make_results([
+            ({'a': 1, 'b': None}, 1.0),
+            ({'a': 1, 'b': 1}, 2.0),
+            ({'a': 2, 'b': 2}, 3.0)
+        ]), 'sharpe_ratio')
+
+        importance = results._calculate_parameter_importance()
+        assert importance == {'b': 1.0, 'a': 0.75}
+        assert list(importance) == ['b', 'a']
+
+    def test_parameter_importance_skips_missing_parameters(self):
+        """Test that results without a parameter are not grouped under it."""
+        results = OptimizationResults(make_results([
+            ({'a': 1}, 1.0),
+            ({'a': 2, 'b': 1}, 5.0),
+            ({'a': 3, 'b': 2}, 3.0)
+        ]), 'sharpe_ratio')
+
+        assert results._mean_target_by('b').tolist() == [5.0, 3.0]
+        assert results._calculate_parameter_importance() == {'a': 1.0, 'b': 0.5}
+
+    def test_mean_target_by_unknown_parameter(self):
+        """Test that an unknown parameter gives an empty series."""
+        results = OptimizationResults(make_results([
+            ({'a': 1}, 1.0),
+            ({'a': 2}, 2.0)
+        ]), 'sharpe_ratio')
+
+        assert results._mean_target_by('missing').empty
+
+
+@pytest.fixture
+def price_csv(tmp_path):
+    """Write a small price CSV and return its path."""
+    path = tmp_path / "prices.csv"
+    pd.DataFrame({'Close': [1.0, 2.0]},
+                 index=pd.DatetimeIndex(['2024-01-01', '2024-01-02'], name='Date')).to_csv(path)
+    return str(path)
+
+
+class FakeStrategy:
+    """Strategy stand-in that only records its parameters."""
+
+    def __init__(self, **params):
+        self.params = params
+
+
+class FakeBacktester:
+    """Backtester stand-in scoring a strategy against the close prices."""
+
+    def __init__(self, strategy, data_source, data_path, initial_capital):
+        self.strategy = strategy
+        self.data = pd.read_csv(data_path, index_col=0, parse_dates=True)
+
+    def run(self):
+        if self.strategy.params['a'] == 0:
+            return None
+        score = float(self.data['Close'].sum()) * self.strategy.params['a'] - self.strategy.params['b']
+        return type('Results', (), {'metrics': {'sharpe_ratio': score}})()
+
+
+@pytest.fixture
+def fake_backtester(monkeypatch):
+    """Run the optimizer against FakeBacktester."""
+    monkeypatch.setattr(backtester, "Backtester", FakeBacktester, raising=False)
+
+
+class TestOptimizer:
+    """Test suite for running the strategy parameter optimizer."""
+
+    PARAM_GRID = {'a': [0, 1, 2], 'b': [0, 1]}
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_run(self, price_csv, fake_backtester, n_jobs):
+        """Test that every combination is evaluated and failed backtests are skipped."""
+        optimizer = backtester.Optimizer(FakeStrategy, self.PARAM_GRID, price_csv, n_jobs=n_jobs)
+        assert optimizer.n_combinations == 6
+
+        results = optimizer.run()
+
+        assert sorted((r['params']['a'], r['params']['b'], r['target_value']) for r in optimizer.results) == [
+            (1, 0, 3.0), (1, 1, 2.0), (2, 0, 6.0), (2, 1, 5.0)]
+        assert results.get_best_parameters() == {'a': 2, 'b': 0}
+
+    def test_missing_target_scores_zero(self, price_csv, fake_backtester):
+        """Test that a missing optimization target counts as zero."""
+        optimizer = backtester.Optimizer(FakeStrategy, {'a': [1], 'b': [0]}, price_csv,
+                                         optimization_target='total_return')
+        assert optimizer.run().top_results[0]['target_value'] == 0
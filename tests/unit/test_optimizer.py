@@ -0,0 +1,115 @@
+"""
+Unit tests for the parameter optimizer's worker data handling.
+"""
+
+import pandas as pd
+import pytest
+from mtfema_backtester.optimization import optimizer
+
+
+def changing_backtest(params, data):
+    """Backtest that changes its data and reports what it saw."""
+    seen = {'columns': list(data.columns), 'first_close': float(data['close'].iloc[0])}
+    data['ema'] = data['close'] * 2
+    data.loc[data.index[0], 'close'] = 99.0
+    return seen, None, None
+
+
+@pytest.fixture
+def shared_worker_data(monkeypatch):
+    """Install a price frame in shared memory the way a pool worker does."""
+    df = pd.DataFrame({'close': [1.0, 2.0, 3.0], 'volume': [10, 20, 30]})
+    shm, spec = optimizer._share_frame(df)
+    monkeypatch.setattr(optimizer, "_worker_data", None)
+    monkeypatch.setattr(optimizer, "_worker_shm", None)
+    optimizer._init_worker(None, spec)
+    yield df
+    optimizer._worker_shm.close()
+    shm.close()
+    shm.unlink()
+
+
+class TestWorkerData:
+    """Test suite for the data each worker task receives."""
+
+    def test_shared_frame_is_numeric_only(self):
+        """Test that only plain numeric frames are put in shared memory."""
+        assert optimizer._is_shareable_frame(pd.DataFrame({'close': [1.0], 'volume': [1]}))
+        assert not optimizer._is_shareable_frame(pd.DataFrame({'symbol': ['ES']}))
+        assert not optimizer._is_shareable_frame(pd.DataFrame())
+
+    def test_attached_frame_matches_original(self, shared_worker_data):
+        """Test that the worker sees the same data the parent shared."""
+        pd.testing.assert_frame_equal(optimizer._worker_data, shared_worker_data)
+
+    def test_backtest_can_change_its_data(self, shared_worker_data):
+        """Test that a backtest may change the read-only shared data it was given."""
+        _, metrics = optimizer._run_backtest_in_worker(changing_backtest, {'a': 1})
+        assert 'error' not in metrics
+
+    def test_changes_do_not_leak_into_later_tasks(self, shared_worker_data):
+        """Test that each task starts from the original data."""
+        optimizer._run_backtest_in_worker(changing_backtest, {'a': 1})
+        _, metrics = optimizer._run_backtest_in_worker(changing_backtest, {'a': 2})
+
+        assert metrics['columns'] == ['close', 'volume']
+        assert metrics['first_close'] == 1.0
+        pd.testing.assert_frame_equal(optimizer._worker_data, shared_worker_data)
+
+    def test_unshared_data_is_copied_per_task(self, monkeypatch):
+        """Test that data that isn't a shared frame is also private to each task."""
+        def appending_backtest(params, data):
+            data['trades'].append(params['a'])
+            return {'trades': list(data['trades'])}, None, None
+
+        monkeypatch.setattr(optimizer, "_worker_data", None)
+        optimizer._init_worker({'trades': []}, None)
+
+        assert optimizer._run_backtest_in_worker(appending_backtest, {'a': 1})[1]['trades'] == [1]
+        assert optimizer._run_backtest_in_worker(appending_backtest, {'a': 2})[1]['trades'] == [2]
+
+
+def scoring_backtest(params, data):
+    """Backtest scoring a parameter set against the sum of the close prices."""
+    data['close'] = data['close'] * params['scale']
+    metrics = {'sharpe_ratio': float(data['close'].sum()) - params['offset'], 'total_return_pct': 0.0}
+    return metrics, None, None
+
+
+def failing_backtest(params, data):
+    """Backtest that fails for one parameter value."""
+    if params['scale'] == 2:
+        raise ValueError("bad parameters")
+    return scoring_backtest(params, data)
+
+
+class TestGridSearch:
+    """Test suite for grid search across worker processes."""
+
+    PARAM_GRID = {'scale': [1, 2, 3], 'offset': [0, 1]}
+
+    @pytest.mark.parametrize("data", [
+        pd.DataFrame({'close': [1.0, 2.0, 3.0]}),
+        pd.DataFrame({'close': [1.0, 2.0, 3.0], 'symbol': ['ES'] * 3})
+    ], ids=["shared", "pickled"])
+    def test_best_result(self, data, tmp_path):
+        """Test that every combination is scored against unchanged data."""
+        search = optimizer.Optimizer(scoring_backtest, self.PARAM_GRID, data=data,
+                                     n_jobs=2, output_dir=str(tmp_path))
+        best = search.run_grid_search(save_results=False)
+
+        assert best['params'] == {'scale': 3, 'offset': 0}
+        assert best['metrics']['sharpe_ratio'] == 18.0
+        scores = {(r['params']['scale'], r['params']['offset']): r['metrics']['sharpe_ratio']
+                  for r in search.results}
+        assert scores == {(scale, offset): 6.0 * scale - offset
+                          for scale in (1, 2, 3) for offset in (0, 1)}
+        assert data['close'].tolist() == [1.0, 2.0, 3.0]
+
+    def test_failed_runs_are_skipped(self, tmp_path):
+        """Test that failing combinations are left out of the results."""
+        search = optimizer.Optimizer(failing_backtest, self.PARAM_GRID, data=pd.DataFrame({'close': [1.0]}),
+                                     n_jobs=2, output_dir=str(tmp_path))
+        search.run_grid_search(save_results=False)
+
+        assert sorted(r['params']['scale'] for r in search.results) == [1, 1, 3, 3]
@@ -0,0 +1,118 @@
+"""
+Unit tests for the backtest Position and Trade records.
+"""
+
+import pickle
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from mtfema_backtester.backtest.position import Position
+from mtfema_backtester.backtest.trade import Trade
+
+
+ENTRY_TIME = datetime(2024, 1, 2, 9, 30)
+
+
+def closed_position(direction="long", exit_price=110.0):
+    """Create a position entered at 100 with a stop at 95 (short: 105) and close it."""
+    stop_loss = 95.0 if direction == "long" else 105.0
+    take_profit = 110.0 if direction == "long" else 90.0
+    position = Position("ES", direction, 100.0, 2, entry_time=ENTRY_TIME,
+                        stop_loss=stop_loss, take_profit=take_profit, timeframe="1h")
+    position.close(exit_price, exit_time=ENTRY_TIME + timedelta(hours=3), exit_reason="target")
+    return position
+
+
+class TestPosition:
+    """Test suite for the Position class."""
+
+    def test_generated_ids_are_unique_uuid4(self):
+        """Test that generated ids are distinct version 4 UUIDs."""
+        ids = {Position("ES", "long", 100.0, 1).id for _ in range(5000)}
+        assert len(ids) == 5000
+        assert all(uuid.UUID(position_id).version == 4 for position_id in list(ids)[:10])
+
+    def test_given_id_is_kept(self):
+        """Test that an explicit id is used as-is."""
+        assert Position("ES", "long", 100.0, 1, id="abc").id == "abc"
+
+    @pytest.mark.parametrize("direction, exit_price, pnl, r_multiple", [
+        ("long", 110.0, 20.0, 2.0),
+        ("long", 95.0, -10.0, -1.0),
+        ("short", 90.0, 20.0, 2.0),
+        ("short", 105.0, -10.0, -1.0)
+    ])
+    def test_pnl_and_r_multiple(self, direction, exit_price, pnl, r_multiple):
+        """Test P&L and R multiple for both directions."""
+        position = closed_position(direction, exit_price)
+        assert position.realized_pnl == pnl
+        assert position.current_r_multiple() == r_multiple
+
+    def test_open_position_pnl(self):
+        """Test unrealized P&L and R multiple of an open short."""
+        position = Position("ES", "SHORT", 100.0, 2, stop_loss=105.0)
+        assert position.direction == "short"
+        assert position.current_pnl(98.0) == 4.0
+        assert position.current_r_multiple(98.0) == 0.4
+        with pytest.raises(ValueError):
+            position.current_r_multiple()
+
+    def test_closing_twice_keeps_first_exit(self):
+        """Test that closing a closed position changes nothing."""
+        position = closed_position(exit_price=110.0)
+        assert position.close(120.0) == 20.0
+        assert position.exit_price == 110.0
+
+    def test_pickle_round_trip(self):
+        """Test that pickling keeps every field, including the lazy id."""
+        position = closed_position()
+        restored = pickle.loads(pickle.dumps(position))
+
+        assert restored.id == position.id
+        assert restored.to_dict() == position.to_dict()
+        assert restored.current_r_multiple() == position.current_r_multiple()
+
+    def test_dict_round_trip(self):
+        """Test that from_dict restores what to_dict produced."""
+        position = closed_position()
+        assert Position.from_dict(position.to_dict()).to_dict() == position.to_dict()
+
+
+class TestTrade:
+    """Test suite for the Trade class."""
+
+    def test_from_position(self):
+        """Test that a trade carries the closed position's results."""
+        trade = Trade.from_position(closed_position("short", 90.0))
+
+        assert trade.profit == 20.0
+        assert trade.r_multiple == 2.0
+        assert trade.risk_reward_ratio == 2.0
+        assert trade.percent_return == 10.0
+        assert trade.duration == timedelta(hours=3)
+        assert trade.duration_hours == 3.0
+        assert trade.is_winner()
+
+    def test_open_position_is_rejected(self):
+        """Test that an open position can't become a trade."""
+        with pytest.raises(ValueError):
+            Trade.from_position(Position("ES", "long", 100.0, 1))
+
+    def test_string_times(self):
+        """Test that ISO string times give the same duration as datetimes."""
+        trade = Trade("t1", "ES", "long", 100.0, 105.0, 1, "2024-01-02T09:30:00Z",
+                      "2024-01-02T11:00:00Z", 5.0, "1h", stop_loss=95.0)
+        assert trade.duration_hours == 1.5
+        assert trade.r_multiple == 1.0
+
+    def test_unparseable_times(self):
+        """Test that bad times leave the duration unknown instead of failing."""
+        trade = Trade("t1", "ES", "long", 100.0, 105.0, 1, "yesterday", "today", 5.0, "1h")
+        assert trade.duration is None
+        assert trade.duration_hours == 0.0
+
+    def test_pickle_round_trip(self):
+        """Test that pickling keeps every field."""
+        trade = Trade.from_position(closed_position())
+        assert pickle.loads(pickle.dumps(trade)).to_dict() == trade.to_dict()
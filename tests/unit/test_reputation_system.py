@@ -0,0 +1,249 @@
+"""
+Unit tests for the community reputation system.
+"""
+
+import json
+import os
+
+import pytest
+from mtfema_backtester.community.reputation import reputation_system
+from mtfema_backtester.community.reputation.reputation_system import ActionType, ReputationSystem
+
+
+@pytest.fixture
+def storage_path(tmp_path):
+    """Directory for reputation data."""
+    return str(tmp_path / "reputation")
+
+
+@pytest.fixture
+def reputation(storage_path):
+    """Create a reputation system backed by a temporary directory."""
+    system = ReputationSystem(storage_path)
+    yield system
+    system.close()
+
+
+def history_log(storage_path):
+    """Path of the action history log."""
+    return os.path.join(storage_path, "action_history.jsonl")
+
+
+class TestActionHistoryLog:
+    """Test suite for the append-only action history log."""
+
+    def test_torn_last_line_does_not_swallow_next_record(self, reputation, storage_path):
+        """Test that a record appended after a crash mid-write is kept."""
+        reputation.award_points("user1", ActionType.FORUM_POST_CREATE)
+        reputation.close()
+
+        # Simulate a crash partway through appending a record
+        with open(history_log(storage_path), 'ab') as f:
+            f.write(b'{"action_id":"torn","user_id":"user1","act')
+
+        system = ReputationSystem(storage_path)
+        system.award_points("user1", ActionType.SETUP_SHARE)
+        system.close()
+
+        reloaded = ReputationSystem(storage_path)
+        try:
+            actions = [record["action_type"] for record in reloaded.get_action_history("user1")]
+            assert actions == [ActionType.SETUP_SHARE.value, ActionType.FORUM_POST_CREATE.value]
+        finally:
+            reloaded.close()
+
+    def test_unterminated_complete_record_is_kept(self, reputation, storage_path):
+        """Test that a complete record missing only its newline survives the repair."""
+        reputation.award_points("user1", ActionType.FORUM_POST_CREATE)
+        reputation.close()
+
+        with open(history_log(storage_path), 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            assert f.read(1) == b"\n"
+            f.seek(-1, os.SEEK_END)
+            f.truncate()
+
+        system = ReputationSystem(storage_path)
+        system.award_points("user1", ActionType.SETUP_SHARE)
+        system.close()
+
+        reloaded = ReputationSystem(storage_path)
+        try:
+            assert len(reloaded.get_action_history("user1")) == 2
+        finally:
+            reloaded.close()
+
+
+class TestStorageOwnership:
+    """Test suite for one open instance per storage directory."""
+
+    def test_second_instance_on_same_directory_is_refused(self, reputation, storage_path):
+        """Test that a second open instance can't share the directory."""
+        with pytest.raises(RuntimeError):
+            ReputationSystem(storage_path)
+        with pytest.raises(RuntimeError):
+            ReputationSystem(os.path.join(storage_path, "..", os.path.basename(storage_path)))
+
+    def test_directory_is_released_on_close(self, reputation, storage_path):
+        """Test that closing an instance lets another open the directory."""
+        reputation.award_points("user1", ActionType.SIGNAL_CREATE)
+        reputation.close()
+
+        system = ReputationSystem(storage_path)
+        try:
+            assert system.get_user_reputation("user1")["points"] == 15
+        finally:
+            system.close()
+
+    def test_other_directories_are_independent(self, reputation, tmp_path):
+        """Test that instances on different directories can be open together."""
+        other = ReputationSystem(str(tmp_path / "other"))
+        other.close()
+
+    def test_get_reputation_system_shares_one_instance(self, storage_path, monkeypatch):
+        """Test that the factory returns the same instance every time."""
+        monkeypatch.setattr(reputation_system, "_reputation_system", None)
+        system = reputation_system.get_reputation_system(storage_path)
+        try:
+            assert reputation_system.get_reputation_system() is system
+        finally:
+            system.close()
+
+    def test_get_reputation_system_rejects_other_directory(self, storage_path, tmp_path, monkeypatch):
+        """Test that asking the factory for a different directory fails instead of being ignored."""
+        monkeypatch.setattr(reputation_system, "_reputation_system", None)
+        system = reputation_system.get_reputation_system(storage_path)
+        try:
+            assert reputation_system.get_reputation_system(storage_path + os.sep) is system
+            with pytest.raises(ValueError):
+                reputation_system.get_reputation_system(str(tmp_path / "other"))
+        finally:
+            system.close()
+
+
+class TestPersistence:
+    """Test suite for saving and reloading reputation data."""
+
+    def test_reload_keeps_users_and_history(self, reputation, storage_path):
+        """Test that points, level, badges and history survive a restart."""
+        for _ in range(12):
+            reputation.award_points("user1", ActionType.FORUM_POST_CREATE)
+        reputation.award_points("user2", ActionType.SIGNAL_CREATE)
+        before = {user_id: (reputation.get_user_reputation(user_id), reputation.get_action_history(user_id))
+                  for user_id in ("user1", "user2")}
+        reputation.close()
+
+        reloaded = ReputationSystem(storage_path)
+        try:
+            for user_id, (user, history) in before.items():
+                assert reloaded.get_user_reputation(user_id) == user
+                assert reloaded.get_action_history(user_id) == history
+            assert before["user1"][0]["points"] == 120
+            assert before["user1"][0]["level"] == 2
+        finally:
+            reloaded.close()
+
+    def test_reset_survives_reload(self, reputation, storage_path):
+        """Test that a reset user stays reset after a restart."""
+        reputation.award_points("user1", ActionType.SIGNAL_CREATE)
+        assert reputation.reset_user_reputation("user1")
+        assert not reputation.reset_user_reputation("unknown")
+        reputation.award_points("user1", ActionType.DAILY_LOGIN)
+        reputation.close()
+
+        reloaded = ReputationSystem(storage_path)
+        try:
+            assert reloaded.get_user_reputation("user1")["points"] == 2
+            assert [record["action_type"] for record in reloaded.get_action_history("user1")] == [
+                ActionType.DAILY_LOGIN.value]
+        finally:
+            reloaded.close()
+
+    def test_files_from_older_versions_are_migrated(self, storage_path):
+        """Test that user_reputation.json and action_history.json are converted on load."""
+        os.makedirs(storage_path)
+        with open(os.path.join(storage_path, "user_reputation.json"), "w") as f:
+            json.dump({"user1": {"user_id": "user1", "points": 25, "level": 1, "badges": [],
+                                 "actions": {ActionType.FORUM_POST_CREATE.value: 1,
+                                             ActionType.SIGNAL_CREATE.value: 1}}}, f)
+        with open(os.path.join(storage_path, "action_history.json"), "w") as f:
+            json.dump({"user1": [
+                {"user_id": "user1", "action_type": ActionType.FORUM_POST_CREATE.value, "points": 10,
+                 "timestamp": "2024-01-01T10:00:00"},
+                {"user_id": "user1", "action_type": ActionType.SIGNAL_CREATE.value, "points": 15,
+                 "timestamp": "2024-01-02T10:00:00"}
+            ]}, f)
+
+        for _ in range(2):
+            system = ReputationSystem(storage_path)
+            try:
+                assert system.get_user_reputation("user1")["points"] == 25
+                assert [record["action_type"] for record in system.get_action_history("user1")] == [
+                    ActionType.SIGNAL_CREATE.value, ActionType.FORUM_POST_CREATE.value]
+            finally:
+                system.close()
+
+        assert not os.path.exists(os.path.join(storage_path, "user_reputation.json"))
+        assert not os.path.exists(os.path.join(storage_path, "action_history.json"))
+
+
+class TestAwardsAndLeaderboards:
+    """Test suite for awarding points and ranking users."""
+
+    def test_bulk_award_matches_single_awards(self, reputation):
+        """Test that a bulk award gives the same results as one call per action."""
+        actions = [("user1", ActionType.SIGNAL_CREATE, None),
+                   ("user2", ActionType.FORUM_SOLUTION, None),
+                   ("", ActionType.SIGNAL_CREATE, None),
+                   ("user1", "signal_success", {"signal_id": "s1"})]
+
+        assert reputation.award_points_bulk(actions) == [15, 25, 0, 20]
+        assert reputation.get_user_reputation("user1")["points"] == 35
+        assert reputation.get_action_history("user1", limit=1)[0]["action_type"] == ActionType.SIGNAL_SUCCESS.value
+
+    def test_leaderboards(self, reputation):
+        """Test the reputation and category leaderboards."""
+        reputation.award_points("user1", ActionType.SIGNAL_CREATE)
+        reputation.award_points("user1", ActionType.SIGNAL_SUCCESS)
+        reputation.award_points("user2", ActionType.FORUM_SOLUTION)
+        reputation.award_points("user2", ActionType.FORUM_POST_CREATE)
+        reputation.award_points("user1", ActionType.DAILY_LOGIN)
+        reputation.award_points("user3", ActionType.DAILY_LOGIN)
+
+        assert [(e["rank"], e["user_id"], e["points"]) for e in reputation.generate_leaderboard(limit=2)] == [
+            (1, "user1", 37), (2, "user2", 35)]
+
+        signals = reputation.generate_leaderboard("signals", limit=1)
+        assert signals[0]["user_id"] == "user1"
+        assert (signals[0]["signal_count"], signals[0]["successful_signals"]) == (1, 1)
+
+        forum = reputation.generate_leaderboard("forum", limit=1)
+        assert forum[0]["user_id"] == "user2"
+        assert (forum[0]["post_count"], forum[0]["solutions"]) == (1, 1)
+
+    def test_tied_users_get_distinct_ranks(self, reputation):
+        """Test that users with the same points are ranked by user ID, as on the leaderboard."""
+        for user_id in ("user3", "user1", "user2"):
+            reputation.award_points(user_id, ActionType.DAILY_LOGIN)
+
+        ranks = [reputation.get_user_reputation(user_id)["rank"] for user_id in ("user1", "user2", "user3")]
+        assert ranks == [1, 2, 3]
+        assert [e["user_id"] for e in reputation.generate_leaderboard()] == ["user1", "user2", "user3"]
+
+    def test_leaderboard_reflects_new_points(self, reputation):
+        """Test that a cached leaderboard is refreshed after points change."""
+        reputation.award_points("user1", ActionType.DAILY_LOGIN)
+        reputation.award_points("user2", ActionType.FORUM_POST_CREATE)
+        assert reputation.generate_leaderboard(limit=1)[0]["user_id"] == "user2"
+
+        reputation.award_points("user1", ActionType.FORUM_SOLUTION)
+        assert reputation.generate_leaderboard(limit=1)[0]["user_id"] == "user1"
+
+        reputation.reset_user_reputation("user1")
+        assert reputation.generate_leaderboard(limit=1)[0]["user_id"] == "user2"
+
+    def test_leaderboard_copies(self, reputation):
+        """Test that changing a returned leaderboard doesn't change the next one."""
+        reputation.award_points("user1", ActionType.DAILY_LOGIN)
+        reputation.generate_leaderboard()[0]["points"] = 1000
+        assert reputation.generate_leaderboard()[0]["points"] == 2